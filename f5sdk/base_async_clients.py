@@ -0,0 +1,344 @@
+"""Base asyncio clients
+
+Note
+----
+
+Requires python 3 (asyncio), this module is only imported when available
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from f5sdk.logger import Logger
+from f5sdk import constants
+from f5sdk.utils import http_utils, retry_utils
+
+from f5sdk.exceptions import AuthRequiredError
+
+
+class BaseAsyncManagementClient(object):
+    """A base asyncio management client class
+
+    Notes
+    -----
+    Wraps the synchronous management client set in 'client_class'.  Individual
+    HTTP calls run in an executor, while every wait (readiness checks, login
+    retries, async task polling) happens on the event loop and holds neither a
+    worker thread nor a concurrency slot.
+
+    Attributes
+    ----------
+    client : object
+        the (synchronous) management client, available after login()
+
+    Methods
+    -------
+    login()
+        Refer to method documentation
+    make_request()
+        Refer to method documentation
+    close()
+        Refer to method documentation
+    """
+
+    login_retry_exceptions = (Exception,)
+    login_retry_status_codes = ()
+
+    def __init__(self, *args, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        *args :
+            positional arguments for the management client
+        **kwargs :
+            optional keyword arguments, any not listed here are passed
+            to the management client
+
+        Keyword Arguments
+        -----------------
+        logger_name : str
+            the logger name to use in log messages
+        max_concurrency : int
+            the maximum number of concurrent requests for this client
+        semaphore : object
+            an asyncio.Semaphore to share across clients, bounding an entire
+            fleet (overrides max_concurrency)
+        executor : object
+            the executor to run requests in, defaults to a thread pool
+            sized to max_concurrency (owned and shut down by this client)
+
+        Returns
+        -------
+        None
+        """
+
+        self.logger = Logger(kwargs.pop('logger_name', __name__)).get_logger()
+
+        max_concurrency = kwargs.pop('max_concurrency', constants.ASYNC['MAX_CONCURRENCY'])
+        self._max_concurrency = max_concurrency
+        # note: created on first use, so it binds to the running event loop
+        self._semaphore = kwargs.pop('semaphore', None)
+        self._executor = kwargs.pop('executor', None)
+        self._owns_executor = self._executor is None
+        if self._owns_executor:
+            self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+        self._client_args = args
+        self._client_kwargs = kwargs
+        self.client = None
+
+    @staticmethod
+    def client_class(*args, **kwargs):
+        """ The (synchronous) management client class, set by each asyncio client """
+        raise NotImplementedError
+
+    @classmethod
+    async def create(cls, *args, **kwargs):
+        """Creates the client and logs in
+
+        Parameters
+        ----------
+        See class initialization
+
+        Returns
+        -------
+        object
+            the logged in client instance
+        """
+
+        client = cls(*args, **kwargs)
+        await client.login()
+        return client
+
+    async def _run(self, function, *args, **kwargs):
+        """Run blocking function in the executor, bounded by the semaphore"""
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                functools.partial(function, *args, **kwargs)
+            )
+
+    async def _retry(self, operation, function, *args, **kwargs):
+        """Run blocking function with retries, waiting on the event loop
+
+        Parameters
+        ----------
+        operation : str
+            the operation name, see retry_utils.RetryPolicy
+        function : function
+            the (single attempt) function to run
+        *args :
+            positional arguments for the function
+        **kwargs :
+            keyword arguments for the function, plus:
+
+        Keyword Arguments
+        -----------------
+        exceptions : tuple
+            the exceptions which should be retried (default: Exception)
+        retry_status_codes : list
+            HTTP status codes to retry, in addition to retryable errors
+        classify : bool
+            classify HTTP errors (default: True), see retry_utils.RetryPolicy
+        timeout : int
+            the deadline (in seconds) for all attempts
+            (default: constants.RETRY_POLICY['TIMEOUT_IN_SECS'])
+
+        Returns
+        -------
+        any
+            the function response
+        """
+
+        policy_kwargs = {'exceptions': kwargs.pop('exceptions', Exception)}
+        for key in ['retry_status_codes', 'classify', 'timeout']:
+            if key in kwargs:
+                policy_kwargs[key] = kwargs.pop(key)
+        policy = retry_utils.RetryPolicy(operation, **policy_kwargs)
+
+        state = policy.start()
+        while True:
+            try:
+                response = await self._run(function, *args, **kwargs)
+            except policy.exceptions as err:  # pylint: disable=broad-except
+                delay = state.next_delay(err)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            state.succeeded()
+            return response
+
+    def _create_client(self, **kwargs):
+        """Create the (synchronous) management client, without logging in
+
+        Notes
+        -----
+        The management client is created with skip_login=True, so no blocking
+        I/O occurs here
+
+        Parameters
+        ----------
+        **kwargs :
+            keyword arguments to add to, or override, the client keyword arguments
+
+        Returns
+        -------
+        object
+            the management client
+        """
+
+        client_kwargs = dict(self._client_kwargs)
+        client_kwargs.update(kwargs)
+        client_kwargs['skip_login'] = True
+        return self.client_class(*self._client_args, **client_kwargs)
+
+    async def _login(self, client):
+        """Log in the management client using user + password
+
+        Parameters
+        ----------
+        client : object
+            the management client
+
+        Returns
+        -------
+        None
+        """
+
+        # pylint: disable=protected-access
+        # note: clients supporting a token cache reuse a valid cached token
+        if hasattr(client, '_get_cached_token'):
+            token = await self._run(client._get_cached_token)
+            if token is not None:
+                client._set_token(token, cached=True)
+                return
+        token = await self._retry(
+            'async.get_token',
+            client._request_token,
+            exceptions=self.login_retry_exceptions,
+            retry_status_codes=self.login_retry_status_codes
+        )
+        if hasattr(client, '_cache_token'):
+            await self._run(client._cache_token, token)
+        client._set_token(token)
+
+    async def login(self):
+        """Logs in, creating the management client
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        client = self._create_client()
+        try:
+            await self._login(client)
+        except Exception:
+            client.close()
+            raise
+        self.client = client
+
+    def _check_login(self):
+        """Raise if login() has not completed"""
+
+        if self.client is None:
+            raise AuthRequiredError('Login required')
+
+    async def make_request(self, uri, **kwargs):
+        """Makes request (HTTP/S)
+
+        Parameters
+        ----------
+        uri : str
+            the URI where the request should be made
+        **kwargs :
+            optional keyword arguments, see the management client make_request()
+
+        Returns
+        -------
+        dict
+            a dictionary containing the JSON response
+        """
+
+        self._check_login()
+
+        return await self._run(self.client.make_request, uri, **kwargs)
+
+    def _get_task_response(self, task_uri):
+        """Get async task response (single attempt) - see _wait_for_task()"""
+
+        response, status_code = self.client.make_request(task_uri, advanced_return=True)
+
+        if status_code != constants.HTTP_STATUS_CODE['OK']:
+            raise Exception('Successful status code not returned: %s' % status_code)
+        if 'status' in response and response['status'].upper() not in ['FINISHED', 'COMPLETED']:
+            raise Exception('Successful status message not returned: %s' % response['status'])
+
+        return response
+
+    async def _wait_for_task(self, task_url):
+        """Wait for task to complete - async 'accepted' task
+
+        Notes
+        -----
+        Same semantics as the synchronous clients: any exception (including
+        HTTP and connection errors while a service restarts) is retried, until
+        constants.RETRY_POLICY['LONG_TIMEOUT_IN_SECS'].  Waits do not block
+        the event loop.
+
+        Parameters
+        ----------
+        task_url : str
+            the HTTP url with a task ID to query
+
+        Returns
+        -------
+        dict
+            the serialized REST response (once the task completes)
+        """
+
+        self._check_login()
+
+        return await self._retry(
+            'async.wait_for_task',
+            self._get_task_response,
+            http_utils.parse_url(task_url)['path'],
+            classify=False,
+            timeout=constants.RETRY_POLICY['LONG_TIMEOUT_IN_SECS']
+        )
+
+    async def close(self):
+        """Closes the client, releasing pooled connections and the executor
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        if self.client is not None:
+            self.client.close()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        if self.client is None:
+            await self.login()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -2,12 +2,19 @@
 
 # pylint: disable=too-few-public-methods
 
-from retry import retry
+import threading
+
+try:
+    from urllib.parse import parse_qsl
+except ImportError:  # python 2.x support
+    from urlparse import parse_qsl
 
 from f5sdk.logger import Logger
 from f5sdk import constants
+from f5sdk.utils import cache_utils
 from f5sdk.utils import misc_utils
 from f5sdk.utils import http_utils
+from f5sdk.utils import task_utils
 
 from f5sdk.exceptions import InputRequiredError
 
@@ -36,6 +43,12 @@ class BaseFeatureClient(object):
             the logger name to use in log messages
         uri : str
             the REST URI against which this client operates
+        paging : str
+            the collection paging style used by iter_list(), either 'icontrol'
+            ($top/$skip, nextLink, totalPages) or 'cs' (limit/page)
+        query_style : str
+            the query style (see query_utils.Query), either 'bigip', 'bigiq'
+            or 'cs' - defaults to 'cs' with CS paging, otherwise 'bigip'
 
         Returns
         -------
@@ -45,25 +58,19 @@ class BaseFeatureClient(object):
         self.logger = Logger(kwargs.pop('logger_name', __name__)).get_logger()
 
         self._client = client
+        paging = kwargs.pop('paging', 'icontrol')
         self._metadata = {
-            'uri': kwargs.pop('uri', None)
+            'uri': kwargs.pop('uri', None),
+            'paging': paging,
+            'query_style': kwargs.pop('query_style', 'cs' if paging == 'cs' else 'bigip')
         }
 
         self._exceptions = {
             'InputRequiredError': InputRequiredError
         }
 
-    @retry(tries=constants.RETRIES['LONG'], delay=constants.RETRIES['DELAY_IN_SECS'])
-    def _wait_for_task(self, task_url):
-        """Wait for task to complete - async 'accepted' task
-
-        Notes
-        -----
-        Certain operations use an async task pattern, where a 202 response on the initial
-        POST is returned along with a self link to query.  The operation is complete when
-        one of the following is true (depends on the REST API)
-        - The self link returns 200 (as opposed to 202)
-        - The response object contains the following: { 'status': 'FINISHED' }
+    def _get_task_response(self, task_url):
+        """Get async task response (single attempt)
 
         Parameters
         ----------
@@ -73,7 +80,12 @@ class BaseFeatureClient(object):
         Returns
         -------
         dict
-            the serialized REST response (once the task completes)
+            the serialized REST response
+
+        Raises
+        ------
+        Exception
+            if the task has not completed (yet)
         """
 
         response, status_code = self._client.make_request(
@@ -89,6 +101,51 @@ class BaseFeatureClient(object):
 
         return response
 
+    def _submit_task(self, task_url):
+        """Submit async 'accepted' task to the (shared) task poller
+
+        Notes
+        -----
+        Certain operations use an async task pattern, where a 202 response on the initial
+        POST is returned along with a self link to query.  The operation is complete when
+        one of the following is true (depends on the REST API)
+        - The self link returns 200 (as opposed to 202)
+        - The response object contains the following: { 'status': 'FINISHED' }
+
+        Any exception while polling is retried until the task poller timeout
+
+        Parameters
+        ----------
+        task_url : str
+            the HTTP url with a task ID to query
+
+        Returns
+        -------
+        object
+            the task future, see task_utils.TaskFuture
+        """
+
+        return task_utils.get_task_poller().submit(
+            lambda: (True, self._get_task_response(task_url)),
+            retry_exceptions=True
+        )
+
+    def _wait_for_task(self, task_url):
+        """Wait for task to complete - async 'accepted' task
+
+        Parameters
+        ----------
+        task_url : str
+            the HTTP url with a task ID to query
+
+        Returns
+        -------
+        dict
+            the serialized REST response (once the task completes)
+        """
+
+        return self._submit_task(task_url).result()
+
     def _make_request(self, **kwargs):
         """Make request (HTTP)
 
@@ -107,6 +164,9 @@ class BaseFeatureClient(object):
             request body
         query_parameters : dict
             request query parameters
+        wait : bool
+            wait for any async task to complete (default), otherwise a
+            task future is returned (see task_utils.TaskFuture)
 
         Notes
         -----
@@ -117,6 +177,7 @@ class BaseFeatureClient(object):
         method = kwargs.pop('method', 'GET')
         config = kwargs.pop('config', None)
         query_parameters = kwargs.pop('query_parameters', {})
+        wait = kwargs.pop('wait', True)
 
         response, status_code = self._client.make_request(
             uri,
@@ -130,12 +191,17 @@ class BaseFeatureClient(object):
         # Note: F5CS does not return an "accepted" status code
         # so we will directly check for "taskReference" property (for now)
         if status_code == constants.HTTP_STATUS_CODE['ACCEPTED']:
-            return self._wait_for_task(response['selfLink'])
-        if status_code == constants.HTTP_STATUS_CODE['OK'] and response.get('taskReference'):
-            return self._wait_for_task(response['taskReference'])
-
-        # default - simply return response
-        return response
+            future = self._submit_task(response['selfLink'])
+        elif status_code == constants.HTTP_STATUS_CODE['OK'] and response.get('taskReference'):
+            future = self._submit_task(response['taskReference'])
+        elif wait:
+            # default - simply return response
+            return response
+        else:
+            future = task_utils.TaskFuture()
+            future.set_result(response)
+
+        return future.result() if wait else future
 
     @staticmethod
     def _get_resource_name(**kwargs):
@@ -148,10 +214,208 @@ class BaseFeatureClient(object):
 
         return resource_name
 
+    def _apply_query(self, kwargs):
+        """Apply query (builder) to request keyword arguments
+
+        Parameters
+        ----------
+        kwargs : dict
+            the request keyword arguments, the query (if any) is removed and
+            its parameters merged into query_parameters
+
+        Returns
+        -------
+        object
+            the query (see query_utils.Query), or None
+        """
+
+        query = kwargs.pop('query', None)
+        if query is not None:
+            query_parameters = dict(kwargs.get('query_parameters') or {})
+            query_parameters.update(
+                query.get_query_parameters(style=self._metadata['query_style']))
+            kwargs['query_parameters'] = query_parameters
+        return query
+
     def _list(self, **kwargs):
         """List operation - private method"""
 
-        return self._make_request(**kwargs)
+        query = self._apply_query(kwargs)
+        response = self._make_request(**kwargs)
+        if query is None or not query.fields:
+            return response
+        return [query.to_record(i) for i in self._get_page_items(response)]
+
+    def _get_page(self, uri, query_parameters, background=False):
+        """Get collection page
+
+        Parameters
+        ----------
+        uri : str
+            request URI
+        query_parameters : dict
+            request query parameters
+        background : bool
+            request the page in a background thread
+
+        Returns
+        -------
+        object
+            the page (serialized REST response) future, see task_utils.TaskFuture
+        """
+
+        future = task_utils.TaskFuture()
+
+        def _get():
+            try:
+                future.set_result(self._make_request(uri=uri, query_parameters=query_parameters))
+            except Exception as err:  # pylint: disable=broad-except
+                future.set_exception(err)
+
+        if background:
+            thread = threading.Thread(target=_get)
+            thread.daemon = True
+            thread.start()
+        else:
+            _get()
+        return future
+
+    def _get_page_items(self, response, items_key=None):
+        """Get collection page items
+
+        Parameters
+        ----------
+        response : dict
+            the page (serialized REST response)
+        items_key : str
+            the response property containing the items, defaults to 'items'
+            (iControl REST) or the first list property (CS)
+
+        Returns
+        -------
+        list
+            the page items
+        """
+
+        if not isinstance(response, dict):
+            return []
+        if items_key or self._metadata['paging'] != 'cs':
+            return response.get(items_key or 'items') or []
+        for value in response.values():
+            if isinstance(value, list):
+                return value
+        return []
+
+    def _get_next_page(self, uri, query_parameters, response, items):
+        """Get the next collection page request, following the paging style
+
+        Parameters
+        ----------
+        uri : str
+            the current page request URI
+        query_parameters : dict
+            the current page request query parameters
+        response : dict
+            the current page (serialized REST response)
+        items : list
+            the current page items
+
+        Returns
+        -------
+        tuple
+            the next page request URI and query parameters, or None if this
+            is the last page: ('/mgmt/tm/ltm/pool', {'$top': 100, '$skip': 100})
+        """
+
+        if self._metadata['paging'] == 'cs':
+            limit = int(query_parameters[constants.PAGING['CS_LIMIT_PARAMETER']])
+            page = int(query_parameters[constants.PAGING['CS_PAGE_PARAMETER']])
+            total = response.get('total') if isinstance(response, dict) else None
+            if len(items) < limit or (total is not None and page * limit >= int(total)):
+                return None
+            next_query_parameters = dict(query_parameters)
+            next_query_parameters[constants.PAGING['CS_PAGE_PARAMETER']] = page + 1
+            return uri, next_query_parameters
+
+        if not isinstance(response, dict):
+            return None
+        if response.get('nextLink'):
+            next_link = http_utils.parse_url(response['nextLink'])
+            return next_link['path'], dict(parse_qsl(next_link['query']))
+        if response.get('totalPages') and response.get('pageIndex') \
+                and int(response['pageIndex']) < int(response['totalPages']):
+            next_query_parameters = dict(query_parameters)
+            next_query_parameters['$skip'] = \
+                int(query_parameters.get('$skip', 0)) + int(query_parameters['$top'])
+            return uri, next_query_parameters
+        return None
+
+    def _iter_list(self, **kwargs):
+        """List operation, yielding items page by page - private method
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        uri : str
+            request URI
+        query_parameters : dict
+            request query parameters
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page (in the background) while the current page
+            is consumed
+        items_key : str
+            the response property containing the items, see _get_page_items()
+        query : object
+            the query, see query_utils.Query
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        query = self._apply_query(kwargs)
+        uri = kwargs.pop('uri', self._metadata['uri'])
+        page_size = kwargs.pop('page_size', constants.PAGING['PAGE_SIZE'])
+        prefetch = kwargs.pop('prefetch', False)
+        items_key = kwargs.pop('items_key', None)
+
+        query_parameters = dict(kwargs.pop('query_parameters', {}))
+        if self._metadata['paging'] == 'cs':
+            query_parameters[constants.PAGING['CS_LIMIT_PARAMETER']] = page_size
+            query_parameters.setdefault(constants.PAGING['CS_PAGE_PARAMETER'], 1)
+        else:
+            query_parameters['$top'] = page_size
+            query_parameters.setdefault('$skip', 0)
+
+        future = self._get_page(uri, query_parameters)
+        previous_items = None
+        while future is not None:
+            response = future.result()
+            items = self._get_page_items(response, items_key=items_key)
+            if not items or items == previous_items:
+                # last (empty) page - or paging not supported, the same page was returned
+                return
+
+            next_page = self._get_next_page(uri, query_parameters, response, items)
+            future = None
+            if next_page is not None:
+                uri, query_parameters = next_page
+                if prefetch:
+                    future = self._get_page(uri, query_parameters, background=True)
+
+            for item in items:
+                yield query.to_record(item) if query is not None and query.fields else item
+            previous_items = items
+
+            if next_page is not None and future is None:
+                future = self._get_page(uri, query_parameters)
 
     def _create(self, **kwargs):
         """Create operation - private method"""
@@ -161,16 +425,22 @@ class BaseFeatureClient(object):
             kwargs.pop('config_file', None)
         )
 
-        return self._make_request(method='POST', config=config)
+        return self._make_request(method='POST', config=config, wait=kwargs.pop('wait', True))
 
     def _show(self, **kwargs):
         """Show operation - private method"""
 
         resource_name = self._get_resource_name(**kwargs)
+        query = self._apply_query(kwargs)
 
-        return self._make_request(
-            uri='%s/%s' % (self._metadata['uri'], resource_name)
+        response = self._make_request(
+            uri='%s/%s' % (self._metadata['uri'], resource_name),
+            query_parameters=kwargs.pop('query_parameters', {}),
+            wait=kwargs.pop('wait', True)
         )
+        if query is None or not query.fields or not isinstance(response, dict):
+            return response
+        return query.to_record(response)
 
     def _update(self, **kwargs):
         """Update operation - private method"""
@@ -184,7 +454,8 @@ class BaseFeatureClient(object):
         return self._make_request(
             uri='%s/%s' % (self._metadata['uri'], resource_name),
             method='PUT',
-            config=config
+            config=config,
+            wait=kwargs.pop('wait', True)
         )
 
     def _delete(self, **kwargs):
@@ -200,5 +471,191 @@ class BaseFeatureClient(object):
         return self._make_request(
             uri='%s/%s' % (self._metadata['uri'], resource_name),
             method='DELETE',
-            config=config
+            config=config,
+            wait=kwargs.pop('wait', True)
         )
+
+
+class TokenClientMixin(object):
+    """A token authentication mixin for management clients
+
+    Notes
+    -----
+    The management client provides host, port, _user, _password, logger
+    and _get_token(), and calls _init_token() during initialization
+
+    Attributes
+    ----------
+    token : str
+        the token of the device
+    token_details : dict
+        the token details of the device
+
+    Methods
+    -------
+    None
+    """
+
+    def _init_token(self, token=None, token_cache=False):
+        """Initializes token attributes
+
+        Parameters
+        ----------
+        token : str
+            the token to assign to the token attribute
+        token_cache : bool
+            reuse (and persist) tokens using the on-disk token cache
+
+        Returns
+        -------
+        None
+        """
+
+        self.token = token
+        self.token_details = {}
+        self._token_state = {
+            'cache': token_cache,
+            'cached': False,
+            'lock': threading.Lock()
+        }
+
+    def _login_using_credentials(self):
+        """Logs in to device using user + password
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self.logger.debug('Logging in using user + password')
+
+        token = self._get_cached_token()
+        if token is None:
+            token = self._get_token()
+            self._cache_token(token)
+            self._set_token(token)
+        else:
+            self._set_token(token, cached=True)
+
+    def _get_cached_token(self):
+        """Gets a valid (not expiring) token from the token cache, if enabled
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            the token details, or None - see _get_token()
+        """
+
+        if not self._token_state['cache']:
+            return None
+        token = cache_utils.get_token_cache().get(self.host, self.port, self._user)
+        if token is not None:
+            self.logger.debug('Using cached authentication token')
+        return token
+
+    def _cache_token(self, token):
+        """Adds token to the token cache, if enabled
+
+        Parameters
+        ----------
+        token : dict
+            the token details, see _get_token()
+
+        Returns
+        -------
+        None
+        """
+
+        if self._token_state['cache']:
+            cache_utils.get_token_cache().put(self.host, self.port, self._user, token)
+
+    def _refresh_token(self):
+        """Refreshes the token (using user + password) if it is about to expire
+
+        Notes
+        -----
+        Called before each request (see check_auth), concurrent callers
+        share a single refresh
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        margin = constants.TOKEN['REFRESH_BEFORE_EXPIRY_IN_SECS']
+        if not (self._user and self._password) \
+                or not misc_utils.is_token_expiring(self.token_details, margin):
+            return
+
+        with self._token_state['lock']:
+            # refreshed by another thread, while waiting for the lock
+            if not misc_utils.is_token_expiring(self.token_details, margin):
+                return
+            self.logger.debug('Refreshing authentication token')
+            token = self._get_token()
+            self._cache_token(token)
+            self._set_token(token)
+
+    def _token_rejected(self, token):
+        """Handles a token rejected by the device (HTTP 401)
+
+        Notes
+        -----
+        Called by check_auth, a rejected cached token (revoked, or the
+        device restarted) is removed from the token cache and the client
+        logs in again using user + password, once
+
+        Parameters
+        ----------
+        token : str
+            the rejected token
+
+        Returns
+        -------
+        bool
+            boolean true if the request should be retried (with a new token)
+        """
+
+        with self._token_state['lock']:
+            # replaced by another thread, while waiting for the lock
+            if token != self.token:
+                return True
+            if not (self._token_state['cached'] and self._user and self._password):
+                return False
+            self.logger.debug('Cached authentication token rejected, logging in again')
+            cache_utils.get_token_cache().remove(self.host, self.port, self._user)
+            token = self._get_token()
+            self._cache_token(token)
+            self._set_token(token)
+        return True
+
+    def _set_token(self, token, cached=False):
+        """Sets token attributes
+
+        Parameters
+        ----------
+        token : dict
+            the token details, see _get_token()
+        cached : bool
+            the token came from the token cache
+
+        Returns
+        -------
+        None
+        """
+
+        self.token = token['token']
+        self.token_details = token
+        self._token_state['cached'] = cached
@@ -19,10 +19,44 @@
                                 private_key_file='~/my_key',
                                 set_user_password='admin')
 
+    Example - asyncio (python 3)::
+
+        from f5sdk.bigip import AsyncManagementClient
+
+        async with AsyncManagementClient('192.0.2.10', user='admin', password='admin') as device:
+            await device.get_info()
+
+    Example - Device Group (python 3)::
+
+        from f5sdk.bigip import DeviceGroup
+        from f5sdk.bigip.extension import AsyncAS3Client
+
+        async with DeviceGroup(['192.0.2.10', '192.0.2.11'], user='admin', password='admin',
+                               max_concurrency=20, timeout=300) as group:
+            async for result in group.run(
+                    lambda device: AsyncAS3Client(device).service.create(
+                        config_file='./decl.json')):
+                print(result['host'], result['error'] or result['response'])
+
+    Example - Readiness Watcher (python 3)::
+
+        from f5sdk.bigip import ReadinessWatcher
+
+        async for result in ReadinessWatcher(['192.0.2.10', '192.0.2.11'], timeout=600).watch():
+            print(result['host'], result['error'] or result['port'])
 """
 
+import sys
+
 from .mgmt_client import ManagementClient
 
 __all__ = [
     'ManagementClient'
 ]
+
+# asyncio client requires python 3
+if sys.version_info[0] >= 3:
+    from .async_mgmt_client import AsyncManagementClient
+    from .device_group import DeviceGroup
+    from .readiness import ReadinessWatcher
+    __all__.extend(['AsyncManagementClient', 'DeviceGroup', 'ReadinessWatcher'])
@@ -0,0 +1,303 @@
+"""BIG-IP asyncio management client
+
+Note
+----
+
+Requires python 3 (asyncio)
+"""
+
+import asyncio
+import time
+
+import f5sdk.constants as constants
+from f5sdk.base_async_clients import BaseAsyncManagementClient
+from f5sdk.exceptions import DeviceReadyError, HTTPError
+
+from .mgmt_client import ManagementClient, DFL_PORT, DFL_PORT_1NIC, \
+    get_discovered_port, get_ready_check_policy, set_discovered_port, select_port
+
+
+class AsyncManagementClient(BaseAsyncManagementClient):
+    """A class used as an asyncio management client for BIG-IP
+
+    Attributes
+    ----------
+    client : object
+        the (synchronous) management client, available after login()
+
+    Methods
+    -------
+    login()
+        Refer to method documentation
+    get_info()
+        Refer to method documentation
+    make_request()
+        Refer to method documentation
+    make_ssh_request()
+        Refer to method documentation
+    make_bash_request()
+        Refer to method documentation
+    close()
+        Refer to method documentation
+    """
+
+    client_class = ManagementClient
+    login_retry_exceptions = (HTTPError,)
+    login_retry_status_codes = (constants.HTTP_STATUS_CODE['BAD_REQUEST'],)
+
+    def __init__(self, host, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        host : str
+            the hostname of the device
+        **kwargs :
+            optional keyword arguments, see ManagementClient and
+            BaseAsyncManagementClient
+
+        Returns
+        -------
+        None
+        """
+
+        super(AsyncManagementClient, self).__init__(host, logger_name=__name__, **kwargs)
+
+        self.host = host.split(':')[0]
+
+    async def _test_socket(self, port):
+        """Test TCP connection can be established (non-blocking)
+
+        Parameters
+        ----------
+        port : int
+            the port to test
+
+        Returns
+        -------
+        bool
+            a boolean true/false
+        """
+
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, port),
+                constants.DEVICE_READY['SOCKET_TIMEOUT_IN_SECS'])
+        except (asyncio.TimeoutError, OSError) as err:
+            self.logger.debug('connection timeout: %s', err)
+            return False
+        writer.close()
+        return True
+
+    async def _discover_port(self):
+        """Discover management port (best effort), both ports are tried concurrently
+
+        See ManagementClient._discover_port()
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            the discovered management port
+        """
+
+        port = get_discovered_port(self.host)
+        if port:
+            return port
+
+        tasks = {
+            asyncio.ensure_future(self._test_socket(port)): port
+            for port in [DFL_PORT, DFL_PORT_1NIC]
+        }
+        results = {}
+        preference_deadline = None
+        pending = set(tasks)
+        try:
+            while True:
+                if results.get(DFL_PORT_1NIC) and preference_deadline is None:
+                    preference_deadline = time.time() + \
+                        constants.DEVICE_READY['PORT_PREFERENCE_DELAY_IN_SECS']
+                preference_expired = preference_deadline is not None \
+                    and time.time() >= preference_deadline
+                done, port = select_port(results, preference_expired)
+                if done:
+                    break
+                finished, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(preference_deadline - time.time(), 0) if preference_deadline
+                    else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    results[tasks[task]] = task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if port is None:
+            return DFL_PORT
+        set_discovered_port(self.host, port)
+        return port
+
+    async def _is_ready(self, port):
+        """Checks that the device is ready, waiting on the event loop
+
+        See ManagementClient._is_ready()
+
+        Parameters
+        ----------
+        port : int
+            the management port
+
+        Returns
+        -------
+        bool
+            boolean true if device is ready
+        """
+
+        state = get_ready_check_policy('async.is_ready').start()
+        while True:
+            if await self._test_socket(port):
+                state.succeeded()
+                return True
+            delay = state.next_delay('device not ready')
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        # the discovered port may be stale
+        if get_discovered_port(self.host) == port:
+            set_discovered_port(self.host, None)
+        raise DeviceReadyError('Unable to complete device ready check')
+
+    async def login(self):
+        """Logs in, creating the management client
+
+        Notes
+        -----
+        Port discovery, the device ready check and authentication retries
+        all wait on the event loop
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        # pylint: disable=protected-access
+        port = int(self._client_kwargs.get('port') or await self._discover_port())
+        if not self._client_kwargs.get('skip_ready_check', False):
+            await self._is_ready(port)
+
+        client = self._create_client(port=port, skip_ready_check=True)
+        try:
+            if client._user and client._password:
+                await self._login(client)
+            elif client._user and client._private_key_file:
+                await self._retry('async.set_password_using_key', client._set_password)
+                await self._login(client)
+            elif not client.token:
+                raise Exception('user|password, user|private_key_file or token required')
+        except Exception:
+            client.close()
+            raise
+        self.client = client
+
+    async def make_ssh_request(self, command):
+        """Makes request to device (SSH)
+
+        Parameters
+        ----------
+        command : str
+            the command to execute on the device
+
+        Returns
+        -------
+        str
+            the command response
+        """
+
+        self._check_login()
+
+        return await self._run(self.client.make_ssh_request, command)
+
+    async def make_ssh_requests(self, commands, **kwargs):
+        """Makes a batch of requests to device (SSH), over one connection
+
+        Parameters
+        ----------
+        commands : list
+            the commands to execute on the device, in order
+        **kwargs :
+            optional keyword arguments, see ManagementClient.make_ssh_requests()
+
+        Returns
+        -------
+        list
+            the result of each (executed) command - see ManagementClient.make_ssh_requests()
+        """
+
+        self._check_login()
+
+        return await self._run(self.client.make_ssh_requests, commands, **kwargs)
+
+    async def make_bash_request(self, command):
+        """Makes request to device (iControl REST bash utility)
+
+        Parameters
+        ----------
+        command : str
+            the command to execute on the device
+
+        Returns
+        -------
+        str
+            the command response (stdout)
+        """
+
+        self._check_login()
+
+        return await self._run(self.client.make_bash_request, command)
+
+    async def make_bash_requests(self, commands, **kwargs):
+        """Makes a batch of requests to device (iControl REST bash utility)
+
+        Parameters
+        ----------
+        commands : list
+            the commands to execute on the device, in order
+        **kwargs :
+            optional keyword arguments, see ManagementClient.make_bash_requests()
+
+        Returns
+        -------
+        list
+            the result of each (executed) command - see ManagementClient.make_bash_requests()
+        """
+
+        self._check_login()
+
+        return await self._run(self.client.make_bash_requests, commands, **kwargs)
+
+    async def get_info(self):
+        """Gets device info
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            the device information, see ManagementClient.get_info()
+        """
+
+        self._check_login()
+
+        return await self._run(self.client.get_info)
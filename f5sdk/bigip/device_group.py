@@ -0,0 +1,287 @@
+"""BIG-IP device group (fleet) client
+
+Note
+----
+
+Requires python 3 (asyncio)
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from f5sdk.logger import Logger
+from f5sdk import constants
+
+from .async_mgmt_client import AsyncManagementClient
+from .readiness import ReadinessWatcher
+
+
+class DeviceGroup(object):
+    """A class used to run operations concurrently across many BIG-IPs
+
+    Notes
+    -----
+    All devices share one concurrency limit (semaphore) and one executor, the
+    per-device timeout is applied to login and to each operation.  Unless
+    skip_ready_check is set, devices are watched (see ReadinessWatcher) and
+    each is logged in to the moment it is ready.
+
+    Attributes
+    ----------
+    devices : dict
+        the logged in asyncio management clients, keyed by host
+
+    Methods
+    -------
+    login()
+        Refer to method documentation
+    run()
+        Refer to method documentation
+    close()
+        Refer to method documentation
+    """
+
+    def __init__(self, hosts, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        hosts : list
+            the devices, either a host string or a dictionary containing the
+            host plus device specific management client keyword arguments:
+            ['192.0.2.10', {'host': '192.0.2.11', 'port': 8443}]
+        **kwargs :
+            optional keyword arguments, any not listed here are passed
+            to every management client (user, password, etc.)
+
+        Keyword Arguments
+        -----------------
+        max_concurrency : int
+            the maximum number of concurrent requests across all devices
+        timeout : int
+            the per-device timeout (in seconds) for login and each operation,
+            defaults to no timeout
+        ready_timeout : int
+            the per-device timeout (in seconds) for the device to be ready,
+            before login
+
+        Returns
+        -------
+        None
+        """
+
+        self.logger = Logger(__name__).get_logger()
+
+        self._max_concurrency = kwargs.pop('max_concurrency', constants.ASYNC['MAX_CONCURRENCY'])
+        self._timeout = kwargs.pop('timeout', None)
+        self._ready_timeout = kwargs.pop(
+            'ready_timeout', constants.DEVICE_READY['TIMEOUT_IN_SECS'])
+        self._hosts = [i if isinstance(i, dict) else {'host': i} for i in hosts]
+        self._client_kwargs = kwargs
+
+        self._semaphore = None
+        self._executor = None
+        self.devices = {}
+
+    async def _run_device(self, host, function, timeout):
+        """Run operation for a single device, capturing any error
+
+        Parameters
+        ----------
+        host : str
+            the device host
+        function : function
+            the function returning an awaitable
+        timeout : int
+            the timeout (in seconds), None for no timeout
+
+        Returns
+        -------
+        dict
+            the device result: {'host': '', 'response': {}, 'error': None}
+        """
+
+        try:
+            response = await asyncio.wait_for(function(), timeout)
+        except Exception as err:  # pylint: disable=broad-except
+            self.logger.debug('%s: operation failed: %r' % (host, err))
+            return {'host': host, 'response': None, 'error': err}
+        return {'host': host, 'response': response, 'error': None}
+
+    async def _login_device(self, device_kwargs):
+        """Create and log in a device management client
+
+        Parameters
+        ----------
+        device_kwargs : dict
+            the device specific management client keyword arguments
+
+        Returns
+        -------
+        object
+            the (logged in) asyncio management client
+        """
+
+        kwargs = dict(self._client_kwargs)
+        kwargs.update(device_kwargs)
+        device = AsyncManagementClient(
+            kwargs.pop('host'),
+            semaphore=self._semaphore,
+            executor=self._executor,
+            **kwargs
+        )
+        try:
+            await device.login()
+        except BaseException:
+            # includes cancellation, on timeout
+            await device.close()
+            raise
+        return device
+
+    async def login(self):
+        """Logs in to all devices concurrently
+
+        Notes
+        -----
+        Devices which are not ready, or fail to log in (or time out) are not
+        added to devices
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        list
+            the login result for each device, in completion order:
+            [{'host': '', 'response': <client>, 'error': None}]
+        """
+
+        # note: created here, so the semaphore binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+
+        hosts = [i for i in self._hosts if i['host'] not in self.devices]
+
+        results = []
+        if self._client_kwargs.get('skip_ready_check', False):
+            tasks = [self._login_device_task(i) for i in hosts]
+        else:
+            tasks = []
+            watcher = ReadinessWatcher(
+                [{'host': i['host'], 'port': i.get('port') or self._client_kwargs.get('port')}
+                 for i in hosts],
+                timeout=self._ready_timeout
+            )
+            device_kwargs = {i['host']: i for i in hosts}
+            try:
+                async for ready in watcher.watch():
+                    if ready['error'] is not None:
+                        results.append({'host': ready['host'], 'response': None,
+                                        'error': ready['error']})
+                        continue
+                    tasks.append(self._login_device_task(dict(
+                        device_kwargs[ready['host']], port=ready['port'], skip_ready_check=True)))
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+        for task in asyncio.as_completed(tasks):
+            result = await task
+            if result['error'] is None:
+                self.devices[result['host']] = result['response']
+            results.append(result)
+        return results
+
+    def _login_device_task(self, device_kwargs):
+        """Create task to log in a device management client, capturing any error
+
+        Parameters
+        ----------
+        device_kwargs : dict
+            the device specific management client keyword arguments
+
+        Returns
+        -------
+        object
+            the task, see _run_device()
+        """
+
+        return asyncio.ensure_future(self._run_device(
+            device_kwargs['host'],
+            functools.partial(self._login_device, device_kwargs),
+            self._timeout
+        ))
+
+    async def run(self, function, *args, **kwargs):
+        """Runs an operation on all (logged in) devices concurrently
+
+        Parameters
+        ----------
+        function : function
+            the operation, called with the device management client plus
+            any additional arguments and returning an awaitable:
+            lambda device: AsyncAS3Client(device).service.create(config={})
+        *args :
+            additional positional arguments for the function
+        **kwargs :
+            additional keyword arguments for the function, plus:
+
+        Keyword Arguments
+        -----------------
+        timeout : int
+            the per-device timeout (in seconds), overrides the class timeout
+
+        Returns
+        -------
+        async generator
+            yields the result for each device as it completes:
+            {'host': '', 'response': {}, 'error': None}
+        """
+
+        timeout = kwargs.pop('timeout', self._timeout)
+
+        tasks = [
+            asyncio.ensure_future(self._run_device(
+                host,
+                functools.partial(function, device, *args, **kwargs),
+                timeout
+            )) for host, device in self.devices.items()
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # caller stopped iterating early
+            for task in tasks:
+                task.cancel()
+
+    async def close(self):
+        """Closes all device management clients
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        for device in self.devices.values():
+            await device.close()
+        self.devices = {}
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        await self.login()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -15,6 +15,8 @@ class PoolsClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -62,6 +64,9 @@ class PoolsClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -71,6 +76,34 @@ class PoolsClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -110,6 +143,9 @@ class PoolsClient(BaseFeatureClient):
             object containing configuration
         config_file : str
             reference to a local file containing configuration
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
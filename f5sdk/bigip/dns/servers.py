@@ -15,6 +15,8 @@ class ServersClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -63,6 +65,9 @@ class ServersClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -72,6 +77,34 @@ class ServersClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -111,6 +144,9 @@ class ServersClient(BaseFeatureClient):
             object containing configuration
         config_file : str
             reference to a local file containing configuration
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
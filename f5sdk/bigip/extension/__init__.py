@@ -24,8 +24,20 @@
     Example - Specify Component Version::
 
         extension_client = AS3Client(device, version='3.9.0')
+
+    Example - asyncio (python 3)::
+
+        from f5sdk.bigip import AsyncManagementClient
+        from f5sdk.bigip.extension import AsyncAS3Client
+
+        async with AsyncManagementClient('192.0.2.10', user='admin', password='admin') as device:
+            extension_client = AsyncAS3Client(device)
+            await extension_client.package.install()
+            await extension_client.service.create(config_file='./decl.json')
 """
 
+import sys
+
 from .extension_as3 import AS3Client
 from .extension_do import DOClient
 from .extension_ts import TSClient
@@ -37,3 +49,8 @@ __all__ = [
     'TSClient',
     'CFClient'
 ]
+
+# asyncio clients require python 3
+if sys.version_info[0] >= 3:
+    from .async_extension import AsyncAS3Client, AsyncDOClient, AsyncTSClient, AsyncCFClient
+    __all__.extend(['AsyncAS3Client', 'AsyncDOClient', 'AsyncTSClient', 'AsyncCFClient'])
@@ -0,0 +1,93 @@
+"""Python module containing asyncio Extension Clients (AS3, DO, TS and CF)
+
+Note
+----
+
+Requires python 3 (asyncio) and an asyncio management client, such as
+f5sdk.bigip.AsyncManagementClient
+"""
+
+from .extension_as3 import AS3Client, AS3ServiceClient
+from .extension_do import DOClient, DOServiceClient
+from .extension_ts import TSClient, TSServiceClient
+from .extension_cf import CFClient, CFServiceClient
+from .package.async_operation import AsyncOperationClient as AsyncPackageClient
+from .service.async_operation import AsyncOperationClient as AsyncServiceClient
+
+
+class AsyncAS3ServiceClient(AS3ServiceClient, AsyncServiceClient):
+    """AS3 service client (asyncio) - see AS3ServiceClient"""
+
+
+class AsyncDOServiceClient(DOServiceClient, AsyncServiceClient):
+    """DO service client (asyncio) - see DOServiceClient"""
+
+
+class AsyncTSServiceClient(TSServiceClient, AsyncServiceClient):
+    """TS service client (asyncio) - see TSServiceClient"""
+
+
+class AsyncCFServiceClient(CFServiceClient, AsyncServiceClient):
+    """CF service client (asyncio) - see CFServiceClient"""
+
+
+class _AsyncExtensionClient(object):
+    """Mixin providing asyncio package and service clients"""
+
+    # set on initialization by the extension client (such as AS3Client)
+    _client = None
+    _metadata_client = None
+    component = None
+    version = None
+    logger = None
+
+    @staticmethod
+    def service_client_class(*args, **kwargs):
+        """ The asyncio service client class, set by each extension client """
+        raise NotImplementedError
+
+    @property
+    def package(self):
+        """ Package (see AsyncPackageClient for more details) """
+        return AsyncPackageClient(
+            self._client,
+            self.component,
+            self.version,
+            self._metadata_client,
+            logger=self.logger
+        )
+
+    @property
+    def service(self):
+        """ Service (see service_client_class for more details) """
+        return self.service_client_class(
+            self._client,
+            self.component,
+            self.version,
+            self._metadata_client,
+            logger=self.logger
+        )
+
+
+class AsyncAS3Client(_AsyncExtensionClient, AS3Client):
+    """AS3 client (asyncio) - see AS3Client"""
+
+    service_client_class = AsyncAS3ServiceClient
+
+
+class AsyncDOClient(_AsyncExtensionClient, DOClient):
+    """DO client (asyncio) - see DOClient"""
+
+    service_client_class = AsyncDOServiceClient
+
+
+class AsyncTSClient(_AsyncExtensionClient, TSClient):
+    """TS client (asyncio) - see TSClient"""
+
+    service_client_class = AsyncTSServiceClient
+
+
+class AsyncCFClient(_AsyncExtensionClient, CFClient):
+    """CF client (asyncio) - see CFClient"""
+
+    service_client_class = AsyncCFServiceClient
@@ -1,18 +1,80 @@
 """Python module for BIG-IP extension metadata client"""
 
+import hashlib
 import os
-import json
 import re
+import threading
+import time
 
 from f5sdk.logger import Logger
-from f5sdk.utils import http_utils
+from f5sdk import constants
+from f5sdk.utils import cache_utils, file_utils, http_utils, json_utils
 from f5sdk.exceptions import InvalidComponentError, InvalidComponentVersionError, FileLoadError
 
 EXTENSION_METADATA = {
     'FILE': 'extension_metadata.json',
-    'URL': 'https://cdn.f5.com/product/cloudsolutions/f5-extension-metadata/latest/metadata.json'
+    'URL': 'https://cdn.f5.com/product/cloudsolutions/f5-extension-metadata/latest/metadata.json',
+    'MAX_AGE_IN_SECS': 300
 }
 
+# process-wide metadata (and index), keyed by local file or URL
+_METADATA_CACHE = {}
+_METADATA_LOCK = threading.Lock()
+
+
+def _parse_version(version):
+    """Parse version string into a tuple, for sorting: '3.10.0' -> (3, 10, 0)"""
+
+    return tuple(int(i) for i in re.findall('[0-9]+', version))
+
+
+def _build_index(metadata):
+    """Build extension metadata index
+
+    Parameters
+    ----------
+    metadata : dict
+        the extension metadata
+
+    Returns
+    -------
+    dict
+        the index, keyed by component:
+        {
+            'as3': {
+                'versions': ['3.10.0', '3.9.0'],  # sorted, latest first
+                'latest': '3.10.0',
+                'component_package_names': {'3.10.0': 'f5-appsvcs'}
+            }
+        }
+    """
+
+    index = {}
+    for component, component_metadata in metadata['components'].items():
+        versions = component_metadata['versions']
+        sorted_versions = sorted(versions.keys(), key=_parse_version, reverse=True)
+        latest = [k for k in sorted_versions if versions[k].get('latest')]
+
+        component_package_names = {}
+        for version, version_metadata in versions.items():
+            match = re.search('.+?(?=-[0-9])', version_metadata.get('packageName', ''))
+            component_package_names[version] = match.group(0) if match else None
+
+        index[component] = {
+            'versions': sorted_versions,
+            'latest': (latest or sorted_versions or [None])[0],
+            'component_package_names': component_package_names
+        }
+    return index
+
+
+def _create_cache_entry(metadata, **kwargs):
+    """Create metadata cache entry, including the index"""
+
+    entry = {'metadata': metadata, 'index': _build_index(metadata)}
+    entry.update(kwargs)
+    return entry
+
 
 class MetadataClient(object):
     """A class used as a metadata client
@@ -52,6 +114,9 @@ class MetadataClient(object):
         -----------------
         use_latest_metadata : bool
             use latest metadata (will be retrieved from remote CDN)
+        max_age : int
+            the number of seconds cached CDN metadata is used before it is
+            revalidated
 
         Returns
         -------
@@ -61,13 +126,186 @@ class MetadataClient(object):
         self.logger = Logger(__name__).get_logger()
 
         self.use_latest_metadata = kwargs.pop('use_latest_metadata', False)
-        self.extension_metadata = self._load_metadata()
+        self.max_age = kwargs.pop('max_age', EXTENSION_METADATA['MAX_AGE_IN_SECS'])
+        entry = self._load_metadata()
+        self.extension_metadata = entry['metadata']
+        self._index = entry['index']
         self.component = self._validate_component(component)
         self.version = self._validate_component_version(
             self.component,
             version or self.get_latest_version()
         )
 
+    @staticmethod
+    def _get_disk_cache_file(url):
+        """Get the on-disk cache file for a metadata URL"""
+
+        return os.path.join(
+            cache_utils.get_cache_dir('metadata'),
+            '%s.json' % hashlib.sha256(url.encode('utf-8')).hexdigest()
+        )
+
+    def _read_disk_cache(self, url):
+        """Read CDN metadata from the on-disk cache (shared across processes)
+
+        Parameters
+        ----------
+        url : str
+            the metadata URL
+
+        Returns
+        -------
+        dict
+            the cached document, or None:
+            {'url': '', 'etag': '', 'last_modified': '', 'fetched_at': 0, 'metadata': {}}
+        """
+
+        try:
+            with open(self._get_disk_cache_file(url), 'rb') as cache_file:
+                document = json_utils.decode(cache_file.read())
+        except (IOError, OSError, ValueError):
+            return None
+        if document.get('url') != url or 'metadata' not in document:
+            return None
+        return document
+
+    def _write_disk_cache(self, document):
+        """Write CDN metadata to the on-disk cache, atomically"""
+
+        try:
+            file_utils.write_file_atomic(
+                self._get_disk_cache_file(document['url']),
+                json_utils.encode(document)
+            )
+        except (IOError, OSError) as err:
+            self.logger.debug('Unable to write metadata cache: %s' % err)
+
+    def _fetch_remote_metadata(self, url, document):
+        """Fetch extension metadata from CDN, conditionally if cached
+
+        Parameters
+        ----------
+        url : str
+            the metadata URL
+        document : dict
+            the cached document (see _read_disk_cache), or None
+
+        Returns
+        -------
+        dict
+            the (fetched or revalidated) document, or None if the request failed
+        """
+
+        headers = {}
+        if document is not None:
+            if document.get('etag'):
+                headers['If-None-Match'] = document['etag']
+            if document.get('last_modified'):
+                headers['If-Modified-Since'] = document['last_modified']
+
+        parsed_url = http_utils.parse_url(url)
+        try:
+            metadata, status_code, response_headers = http_utils.make_request(
+                parsed_url['host'],
+                parsed_url['path'],
+                headers=headers,
+                advanced_return=True,
+                return_headers=True,
+                timeout=constants.HTTP_TIMEOUT['METADATA']
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            self.logger.warning('Error downloading metadata file: %s', err)
+            return None
+
+        if status_code == 304 and document is not None:
+            document = dict(document, fetched_at=time.time())
+        else:
+            document = {
+                'url': url,
+                'etag': response_headers.get('etag'),
+                'last_modified': response_headers.get('last-modified'),
+                'fetched_at': time.time(),
+                'metadata': metadata
+            }
+        self._write_disk_cache(document)
+        return document
+
+    def _load_remote_metadata(self):
+        """Load extension metadata from CDN
+
+        Notes
+        -----
+        The CDN document is cached in process and on disk (shared by
+        concurrent processes), it is revalidated (If-None-Match,
+        If-Modified-Since) once older than max age.  If the CDN cannot be
+        reached a stale cached document is used.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            the cache entry (metadata and index), or None
+        """
+
+        url = EXTENSION_METADATA['URL']
+        entry = _METADATA_CACHE.get(url)
+        if entry is not None and time.time() < entry['fetched_at'] + self.max_age:
+            return entry
+
+        document = self._read_disk_cache(url)
+        if document is None or time.time() >= document['fetched_at'] + self.max_age:
+            document = self._fetch_remote_metadata(url, document) or document
+        if document is None:
+            return None
+
+        entry = _create_cache_entry(
+            document['metadata'],
+            etag=document['etag'],
+            last_modified=document['last_modified'],
+            fetched_at=document['fetched_at']
+        )
+        with _METADATA_LOCK:
+            _METADATA_CACHE[url] = entry
+        return entry
+
+    @staticmethod
+    def _load_local_metadata():
+        """Load extension metadata included in package (local file), once per process
+
+        Notes
+        -----
+        The cached metadata is reloaded if the file modification time changes
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            the cache entry (metadata and index)
+        """
+
+        local_file = os.path.join(os.path.dirname(__file__), EXTENSION_METADATA['FILE'])
+        try:
+            mtime = os.stat(local_file).st_mtime
+            entry = _METADATA_CACHE.get(local_file)
+            if entry is not None and entry['mtime'] == mtime:
+                return entry
+
+            with open(local_file, 'rb') as m_file:
+                metadata = json_utils.decode(m_file.read())
+        except Exception as err:  # pylint: disable=broad-except
+            raise FileLoadError(err)
+
+        entry = _create_cache_entry(metadata, mtime=mtime)
+        with _METADATA_LOCK:
+            _METADATA_CACHE[local_file] = entry
+        return entry
+
     def _load_metadata(self):
         """Load extension metadata
 
@@ -75,6 +313,9 @@ class MetadataClient(object):
         - metadata from CDN (unless use_latest_metadata=False)
         - metadata included in package (local file)
 
+        Metadata is loaded (and indexed) once per process, shared by all
+        metadata clients - it must not be modified
+
         Parameters
         ----------
         None
@@ -82,29 +323,20 @@ class MetadataClient(object):
         Returns
         -------
         dict
-            a dictionary containg the JSON metadata
+            the cache entry: {'metadata': {}, 'index': {}}
         """
 
-        metadata = None
+        entry = None
 
         # retrieve metadata from URL - unless opted out
         if self.use_latest_metadata:
-            parsed_url = http_utils.parse_url(EXTENSION_METADATA['URL'])
-            try:
-                metadata = http_utils.make_request(parsed_url['host'], parsed_url['path'])
-            except Exception as err:  # pylint: disable=broad-except
-                self.logger.warning('Error downloading metadata file: %s', err)
+            entry = self._load_remote_metadata()
 
         # fallback to local metadata file
-        if metadata is None:
-            local_file = os.path.join(os.path.dirname(__file__), EXTENSION_METADATA['FILE'])
-            try:
-                with open(local_file) as m_file:
-                    metadata = json.loads(m_file.read())
-            except Exception as err:  # pylint: disable=broad-except
-                raise FileLoadError(err)
+        if entry is None:
+            entry = self._load_local_metadata()
 
-        return metadata
+        return entry
 
     def _validate_component(self, component):
         """Validates the extension component exists in metadata
@@ -125,9 +357,9 @@ class MetadataClient(object):
             if the extension component does not exist in metadata
         """
 
-        components = list(self.extension_metadata['components'].keys())
-        if not [i for i in components if i == component]:
-            raise InvalidComponentError('Valid component must be provided: %s' % (components))
+        if component not in self._index:
+            raise InvalidComponentError(
+                'Valid component must be provided: %s' % (list(self._index.keys())))
         return component
 
     def _validate_component_version(self, component, version):
@@ -151,10 +383,10 @@ class MetadataClient(object):
             if the extension component version does not exist in metadata
         """
 
-        versions = list(self.extension_metadata['components'][component]['versions'].keys())
-        if not [i for i in versions if i == version]:
+        if version not in self.extension_metadata['components'][component]['versions']:
             raise InvalidComponentVersionError(
-                'Valid component version must be provided: %s' % (versions)
+                'Valid component version must be provided: %s' % (
+                    self._index[component]['versions'])
             )
         return version
 
@@ -201,9 +433,7 @@ class MetadataClient(object):
             a string containing the latest version
         """
 
-        c_v_metadata = self.extension_metadata['components'][self.component]['versions']
-        latest = {k: v for (k, v) in c_v_metadata.items() if v['latest']}
-        return list(latest.keys())[0]  # we should only have one
+        return self._index[self.component]['latest']
 
     def get_versions_list(self):
         """Lists all the component versions from the extension metadata
@@ -215,10 +445,10 @@ class MetadataClient(object):
         Returns
         -------
         list
-            a list containing all versions
+            a list containing all versions, latest first
         """
 
-        return list(self.extension_metadata['components'][self.component]['versions'].keys())
+        return list(self._index[self.component]['versions'])
 
     def get_download_url(self):
         """Gets the component versions download url from extension metadata
@@ -263,9 +493,7 @@ class MetadataClient(object):
             a string containing the component's package name, i.e. 'f5-telemetry'
         """
 
-        match = re.search('.+?(?=-[0-9])', self._get_version_metadata()['packageName'])
-
-        return match.group(0)
+        return self._index[self.component]['component_package_names'][self.version]
 
     def get_component_dependencies(self):
         """Gets the component dependencies
@@ -0,0 +1,248 @@
+"""Module for BIG-IP extension component package configuration (asyncio)
+
+Note
+----
+
+Requires python 3 (asyncio)
+"""
+
+# pylint: disable=protected-access
+
+import asyncio
+
+from f5sdk import constants
+from f5sdk.utils import retry_utils
+
+from .operation import OperationClient, PKG_MGMT_URI, RPM_TASK_STATUS, REMOTE_DOWNLOADS_DIR
+from .inventory import get_package_inventory
+
+
+class AsyncOperationClient(OperationClient):
+    """A class used as an asyncio extension package operation client for BIG-IP
+
+    Notes
+    -----
+    Task status polling waits on the event loop, blocking work (package
+    download and upload) runs in the management client executor
+
+    Attributes
+    ----------
+    component : str
+        the extension component
+    version : str
+        the extension component version
+
+    Methods
+    -------
+    is_installed()
+        Refer to method documentation
+    install()
+        Refer to method documentation
+    uninstall()
+        Refer to method documentation
+    """
+
+    @property
+    def _sync_client(self):
+        """Synchronous package operation client, resolved on use
+
+        Raises
+        ------
+        AuthRequiredError
+            if the asyncio management client has not logged in
+        """
+
+        self._client._check_login()
+
+        return OperationClient(
+            self._client.client,
+            self.component,
+            self.version,
+            self._metadata_client,
+            logger=self.logger
+        )
+
+    @property
+    def _package_inventory(self):
+        """Installed package inventory, shared with the (synchronous) management client"""
+
+        self._client._check_login()
+        return get_package_inventory(self._client.client)
+
+    async def _check_rpm_task_status(self, task_id):
+        """Checks RPM task status on a remote device - see OperationClient"""
+
+        status_link_uri = '%s/%s' % (PKG_MGMT_URI, task_id)
+        state = retry_utils.RetryPolicy(
+            'package.check_rpm_task_status',
+            timeout=RPM_TASK_STATUS['ATTEMPTS'] * RPM_TASK_STATUS['DELAY_IN_SECS'],
+            max_delay=RPM_TASK_STATUS['DELAY_IN_SECS']
+        ).start()
+        while True:
+            response = await self._client.make_request(status_link_uri)
+            if self._is_rpm_task_finished(response):
+                state.succeeded()
+                return response
+            delay = state.next_delay('task not finished: %s' % task_id)
+            if delay is None:
+                raise Exception('Max count exceeded')
+            await asyncio.sleep(delay)
+
+    async def _run_rpm_task(self, body):
+        """Creates a package management task and waits for it to finish
+
+        Parameters
+        ----------
+        body : dict
+            the task body, such as {'operation': 'QUERY'}
+
+        Returns
+        -------
+        dict
+            the (finished) task response
+        """
+
+        try:
+            response = await self._client.make_request(PKG_MGMT_URI, method='POST', body=body)
+            return await self._check_rpm_task_status(response['id'])
+        finally:
+            if body['operation'] != 'QUERY':
+                self._package_inventory.invalidate()
+
+    async def _check_rpm_exists(self, component_package_name):
+        """Checks RPM (LX extension) exists on a remote device - see OperationClient"""
+
+        inventory = self._package_inventory
+        response = inventory.get_cached()
+        if response is None:
+            generation = inventory.generation
+            response = await self._run_rpm_task({'operation': 'QUERY'})
+            inventory.set(response, generation=generation)
+        return self._parse_query_response(response, component_package_name)
+
+    async def _get_installed_rpm_info(self):
+        """Retrieve installed RPM information - see OperationClient"""
+
+        installed_rpm_info = await self._check_rpm_exists(
+            self._metadata_client.get_component_package_name()
+        )
+        return {
+            'installed': installed_rpm_info['exists'],
+            'installed_version': installed_rpm_info['version'],
+            'package_name': installed_rpm_info['package_name']
+        }
+
+    async def install(self, package_url=None, **kwargs):
+        """Installs extension package component on a remote device
+
+        Parameters
+        ----------
+        package_url : str
+            optional package url to specify and install a rpm. Support local file and http/s url
+        **kwargs :
+            optional keyword arguments, see OperationClient.install()
+
+        Returns
+        -------
+        dict
+            a dictionary containing component and version - see OperationClient.install()
+        """
+
+        sync_client = self._sync_client
+        chunk_size = kwargs.pop('chunk_size', None)
+        idempotent = kwargs.pop('idempotent', False)
+
+        if idempotent:
+            installed_info = await self._get_installed_rpm_info()
+            package_name = self._resolve_package(package_url)['name']
+            if self._is_package_installed(installed_info, package_name):
+                self.logger.info('Package already installed, skipping: %s' % package_name)
+                return {
+                    'component': self.component,
+                    'version': installed_info['installed_version']
+                }
+
+        package_file, package_name, delete_file = await self._client._run(
+            sync_client._get_package_file, package_url)
+        remote_file = '%s/%s' % (REMOTE_DOWNLOADS_DIR, package_name)
+
+        # upload to BIG-IP
+        remote_info = None
+        if idempotent:
+            remote_info = self._parse_remote_file_info(await self._client.make_request(
+                constants.COMMANDS['BASH_URI'],
+                method='POST',
+                body=self._get_remote_file_info_body(remote_file)
+            ))
+        if remote_info is not None and await self._client._run(
+                self._is_remote_file_current, package_file, remote_info):
+            self.logger.info('Package already uploaded, skipping: %s' % package_name)
+        else:
+            await self._client._run(
+                sync_client._upload_rpm,
+                package_file,
+                delete_file=delete_file,
+                chunk_size=chunk_size
+            )
+        # install on BIG-IP
+        await self._run_rpm_task({
+            'operation': 'INSTALL',
+            'packageFilePath': remote_file
+        })
+        # get installed rpm info
+        installed_info = await self._get_installed_rpm_info()
+        return {
+            'component': self.component,
+            'version': installed_info['installed_version']
+        }
+
+    async def uninstall(self):
+        """Uninstalls extension package component on a remote device
+
+        Note: This method will uninstall any component version
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            Uninstalled component and version - see OperationClient.uninstall()
+        """
+
+        installed_component_info = await self._get_installed_rpm_info()
+
+        # uninstall from BIG-IP (if installed)
+        if installed_component_info['installed']:
+            await self._run_rpm_task({
+                'operation': 'UNINSTALL',
+                'packageName': installed_component_info['package_name']
+            })
+            # check for any component dependencies, log warning as needed
+            self._check_for_dependency()
+
+        return {
+            'component': self.component,
+            'version': installed_component_info['installed_version']
+        }
+
+    async def is_installed(self):
+        """Checks if the extension component package is installed on a remote device
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            a dictionary containing version info - see OperationClient.is_installed()
+        """
+
+        install_info = await self._get_installed_rpm_info()
+        return {
+            'installed': install_info['installed'],
+            'installed_version': install_info['installed_version'],
+            'latest_version': self._metadata_client.get_latest_version()
+        }
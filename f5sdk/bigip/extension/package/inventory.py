@@ -0,0 +1,171 @@
+"""Module for BIG-IP installed package inventory (cache)"""
+
+import threading
+import time
+import weakref
+
+from f5sdk import constants
+
+_INVENTORIES = weakref.WeakKeyDictionary()
+_INVENTORIES_LOCK = threading.Lock()
+
+
+class PackageInventory(object):
+    """A class used to cache the installed package inventory of a device
+
+    Notes
+    -----
+    The inventory is the (finished) package management QUERY task response,
+    which lists every installed package - so one QUERY serves all extension
+    components.  It expires after a TTL and is invalidated by any task which
+    changes the installed packages (INSTALL, UNINSTALL).
+
+    Methods
+    -------
+    get()
+        Refer to method documentation
+    get_cached()
+        Refer to method documentation
+    set()
+        Refer to method documentation
+    invalidate()
+        Refer to method documentation
+    """
+
+    def __init__(self, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        ttl : int
+            the number of seconds the inventory is cached for
+
+        Returns
+        -------
+        None
+        """
+
+        self.ttl = kwargs.pop('ttl', constants.PACKAGE_INVENTORY['TTL_IN_SECS'])
+
+        self._lock = threading.Lock()
+        self._response = None
+        self._expires = 0
+        self._generation = 0
+
+    def get_cached(self):
+        """Gets the cached inventory, if not expired
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            the QUERY task response, or None
+        """
+
+        if self._response is not None and time.time() < self._expires:
+            return self._response
+        return None
+
+    def set(self, response, generation=None):
+        """Sets the inventory
+
+        Parameters
+        ----------
+        response : dict
+            the QUERY task response
+        generation : int
+            the generation (see generation property) when the QUERY started,
+            the response is discarded if the inventory was invalidated since
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._response = response
+            self._expires = time.time() + self.ttl
+
+    @property
+    def generation(self):
+        """ Generation, incremented on each invalidation """
+        return self._generation
+
+    def invalidate(self):
+        """Invalidates the inventory, such as after an INSTALL/UNINSTALL task
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            self._response = None
+            self._generation += 1
+
+    def get(self, query):
+        """Gets the inventory, querying the device if not cached
+
+        Notes
+        -----
+        Concurrent callers share a single QUERY
+
+        Parameters
+        ----------
+        query : function
+            the function which runs the QUERY task, returning the response
+
+        Returns
+        -------
+        dict
+            the QUERY task response
+        """
+
+        response = self.get_cached()
+        if response is not None:
+            return response
+
+        with self._lock:
+            response = self.get_cached()
+            if response is None:
+                response = query()
+                self._response = response
+                self._expires = time.time() + self.ttl
+        return response
+
+
+def get_package_inventory(client):
+    """Get the package inventory for a management client
+
+    Parameters
+    ----------
+    client : object
+        the management client
+
+    Returns
+    -------
+    object
+        the package inventory (see PackageInventory), shared by all
+        extension clients using the management client
+    """
+
+    with _INVENTORIES_LOCK:
+        inventory = _INVENTORIES.get(client)
+        if inventory is None:
+            inventory = PackageInventory()
+            _INVENTORIES[client] = inventory
+        return inventory
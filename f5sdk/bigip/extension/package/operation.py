@@ -1,15 +1,28 @@
 """Module for BIG-IP extension component package configuration"""
 
+import mmap
 import os
 import re
 import time
 
+try:
+    from shlex import quote as shell_quote
+except ImportError:  # python 2.x support
+    from pipes import quote as shell_quote
+
 from f5sdk.exceptions import InputRequiredError
 
 from f5sdk import constants
-from f5sdk.utils import http_utils, misc_utils
+from f5sdk.utils import cache_utils, file_utils, misc_utils, retry_utils, task_utils
+
+from .inventory import get_package_inventory
 
 PKG_MGMT_URI = '/mgmt/shared/iapp/package-management-tasks'
+REMOTE_DOWNLOADS_DIR = '/var/config/rest/downloads'
+RPM_TASK_STATUS = {
+    'ATTEMPTS': 122,  # ~2 mins
+    'DELAY_IN_SECS': 1
+}
 
 
 class OperationClient(object):
@@ -65,9 +78,63 @@ class OperationClient(object):
         self.component = component
         self.version = version
 
+    @staticmethod
+    def _get_acknowledged_offset(response, end, file_size):
+        """Get the offset acknowledged by the remote device after an upload slice
+
+        Parameters
+        ----------
+        response : dict
+            the upload response, may contain 'remainingByteCount'
+        end : int
+            the end offset (exclusive) of the uploaded slice
+        file_size : int
+            the total file size
+
+        Returns
+        -------
+        int
+            the offset to continue the upload from
+        """
+
+        remaining = response.get('remainingByteCount') if isinstance(response, dict) else None
+        if isinstance(remaining, int) and 0 <= remaining <= file_size:
+            return file_size - remaining
+        return end
+
+    @staticmethod
+    def _release_pages(mapped, offset):
+        """Release (uploaded) memory-mapped pages before offset, bounding resident memory
+
+        Parameters
+        ----------
+        mapped : object
+            the memory-mapped file
+        offset : int
+            the offset before which pages are no longer required
+
+        Returns
+        -------
+        None
+        """
+
+        # note: madvise requires python 3.8+
+        advice = getattr(mmap, 'MADV_DONTNEED', None)
+        if hasattr(mapped, 'madvise') and advice is not None:
+            length = offset - offset % mmap.PAGESIZE
+            if length:
+                mapped.madvise(advice, 0, length)
+
     def _upload_rpm(self, file_name, **kwargs):
         """Uploads a local RPM file to a remote device
 
+        Notes
+        -----
+        The file is sized using fstat and memory-mapped, slices are sent
+        without reading the file into memory.  A failed slice is retried
+        (see retry_utils), resuming from the last acknowledged Content-Range
+        offset.
+
         Parameters
         ----------
         file_name : str
@@ -79,6 +146,10 @@ class OperationClient(object):
         -----------------
         delete_file : bool
             flag to delete local file when upload is complete
+        chunk_size : int
+            the size (in bytes) of each uploaded slice
+        offset : int
+            the offset to start from, to resume a previously interrupted upload
 
         Returns
         -------
@@ -86,42 +157,115 @@ class OperationClient(object):
         """
 
         delete_file = kwargs.pop('delete_file', True)
+        chunk_size = kwargs.pop('chunk_size', None) or constants.UPLOAD['CHUNK_SIZE']
+        offset = kwargs.pop('offset', 0)
         uri = '/mgmt/shared/file-transfer/uploads/%s' % (file_name.split('/')[-1])
 
-        file_object = open(file_name, 'rb')
-        max_chunk = 1024 * 1024
-        file_size = len(file_object.read())
-        file_object.seek(0)  # move to start
-        start_index = 0
-        while True:
-            file_slice = file_object.read(max_chunk)
-            if not file_slice:
-                break
-
-            slice_size = len(file_slice)
-            if slice_size < max_chunk:
-                end = file_size
-            else:
-                end = start_index + slice_size
-
-            headers = {
-                'Content-Range': '%s-%s/%s' % (start_index, end - 1, file_size),
-                'Content-Length': str(end),
-                'Content-Type': 'application/octet-stream'
-            }
-            # send chunk
-            self._client.make_request(
-                uri,
-                method='POST',
-                headers=headers,
-                body=file_slice,
-                body_content_type='raw'
-            )
-            start_index += slice_size
+        with open(file_name, 'rb') as file_object:
+            file_size = os.fstat(file_object.fileno()).st_size
+            if file_size:
+                mapped = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    self._upload_slices(uri, mapped, offset, chunk_size)
+                finally:
+                    mapped.close()
 
         if delete_file:
             os.remove(file_name)
 
+    def _post_slice(self, uri, file_slice, content_range):
+        """Uploads a single file slice (single attempt), see _upload_slices()
+
+        Parameters
+        ----------
+        uri : str
+            the upload URI
+        file_slice : object
+            the slice: memoryview or bytes
+        content_range : str
+            the slice content range: '0-1023/2560'
+
+        Returns
+        -------
+        dict
+            the upload response
+        """
+
+        return self._client.make_request(
+            uri,
+            method='POST',
+            headers={
+                'Content-Range': content_range,
+                'Content-Type': 'application/octet-stream'
+            },
+            body=file_slice,
+            body_content_type='raw'
+        )
+
+    def _upload_slices(self, uri, mapped, offset, chunk_size):
+        """Uploads memory-mapped file slices, see _upload_rpm()
+
+        Notes
+        -----
+        Each slice is retried (up to UPLOAD['RETRIES'] attempts) with backoff
+        and jitter, sharing the retry budget - see retry_utils.RetryPolicy
+
+        Parameters
+        ----------
+        uri : str
+            the upload URI
+        mapped : object
+            the memory-mapped file
+        offset : int
+            the offset to start from
+        chunk_size : int
+            the size (in bytes) of each slice
+
+        Returns
+        -------
+        None
+        """
+
+        file_size = len(mapped)
+        try:
+            view = memoryview(mapped)
+        except TypeError:  # python 2.x support: mmap does not export a buffer
+            view = None
+
+        policy = retry_utils.RetryPolicy(
+            'package.upload_slice',
+            tries=constants.UPLOAD['RETRIES'],
+            timeout=constants.RETRY_POLICY['LONG_TIMEOUT_IN_SECS']
+        )
+        state = None
+        try:
+            while offset < file_size:
+                end = min(offset + chunk_size, file_size)
+                file_slice = view[offset:end] if view is not None else mapped[offset:end]
+                if state is None:
+                    state = policy.start()
+                try:
+                    response = self._post_slice(
+                        uri, file_slice, '%s-%s/%s' % (offset, end - 1, file_size))
+                except Exception as err:  # pylint: disable=broad-except
+                    delay = state.next_delay(err)
+                    if delay is None:
+                        raise
+                    self.logger.warning(
+                        'Upload interrupted at offset %s, resuming: %s' % (offset, err))
+                    time.sleep(delay)
+                    continue
+                finally:
+                    if view is not None:
+                        file_slice.release()
+                state.succeeded()
+                state = None
+                offset = self._get_acknowledged_offset(response, end, file_size)
+                self._release_pages(mapped, offset)
+        finally:
+            if view is not None:
+                view.release()
+
     def _check_rpm_task_status(self, task_id):
         """Checks RPM task status on a remote device
 
@@ -137,20 +281,72 @@ class OperationClient(object):
         """
 
         status_link_uri = '%s/%s' % (PKG_MGMT_URI, task_id)
-        sleep_secs = 1
-        count = 0
-        max_count = 120  # max_count + sleep_secs = 2 mins
-        while True:
+
+        def _poll():
             response = self._client.make_request(status_link_uri)
-            if response['status'] == 'FINISHED':
-                break
-            elif response['status'] == 'FAILED':
-                raise Exception(response['errorMessage'])
-            elif count > max_count:
-                raise Exception('Max count exceeded')
-            time.sleep(sleep_secs)
-            count += 1
-        return response
+            return self._is_rpm_task_finished(response), response
+
+        return task_utils.get_task_poller().submit(
+            _poll,
+            timeout=RPM_TASK_STATUS['ATTEMPTS'] * RPM_TASK_STATUS['DELAY_IN_SECS']
+        ).result()
+
+    @staticmethod
+    def _is_rpm_task_finished(response):
+        """Checks RPM task status response
+
+        Parameters
+        ----------
+        response : dict
+            the task status response
+
+        Returns
+        -------
+        bool
+            boolean true if the task is finished, false if it is still running
+
+        Raises
+        ------
+        Exception
+            if the task failed
+        """
+
+        if response['status'] == 'FINISHED':
+            return True
+        if response['status'] == 'FAILED':
+            raise Exception(response['errorMessage'])
+        return False
+
+    @property
+    def _package_inventory(self):
+        """Installed package inventory, shared per management client"""
+
+        return get_package_inventory(self._client)
+
+    def _run_rpm_task(self, body):
+        """Creates a package management task and waits for it to finish
+
+        Notes
+        -----
+        Any task other than QUERY invalidates the package inventory
+
+        Parameters
+        ----------
+        body : dict
+            the task body, such as {'operation': 'QUERY'}
+
+        Returns
+        -------
+        dict
+            the (finished) task response
+        """
+
+        try:
+            response = self._client.make_request(PKG_MGMT_URI, method='POST', body=body)
+            return self._check_rpm_task_status(response['id'])
+        finally:
+            if body['operation'] != 'QUERY':
+                self._package_inventory.invalidate()
 
     def _install_rpm(self, package_path):
         """Installs RPM on a remote device
@@ -165,37 +361,24 @@ class OperationClient(object):
         None
         """
 
-        uri = PKG_MGMT_URI
-        body = {
+        self._run_rpm_task({
             'operation': 'INSTALL',
             'packageFilePath': package_path
-        }
-        response = self._client.make_request(uri, method='POST', body=body)
+        })
 
-        # now check for task status completion
-        self._check_rpm_task_status(response['id'])
-
-    def install(self, package_url=None):
-        """Installs extension package component on a remote device
+    def _resolve_package(self, package_url=None):
+        """Resolves the package to install, without downloading it
 
         Parameters
         ----------
         package_url : str
-            optional keyword argument. Default is set to None.
-
-        Keyword Arguments
-        -----------------
-        package_url : str
-            optional package url to specify and install a rpm. Support local file and http/s url
+            optional package url, supports local file and http/s url - defaults
+            to the component version download url
 
         Returns
         -------
         dict
-            a dictionary containing component and version:
-            {
-              'component': 'as3',
-              'version': 'x.x.x'
-            }
+            the package: {'name': 'pkg.rpm', 'download_url': '', 'file': None}
         """
 
         # if a url_package is provided, check to ensure it contains HTTP/S
@@ -204,10 +387,8 @@ class OperationClient(object):
         if package_url and not re.match(url_pattern, package_url):
             raise InputRequiredError("Package URL format is not supported. "
                                      "Must contain HTTP/S or file protocol and rpm file extension.")
-        download_url, package_name, package_file = None, None, None
-        delete_file = True
+        download_url, package_file = None, None
         if package_url is None:
-            # download package (rpm) locally
             download_url = self._metadata_client.get_download_url()
             package_name = download_url.split('/')[-1]
         else:
@@ -217,18 +398,202 @@ class OperationClient(object):
                 download_url = package_url
             elif "file" in protocol:
                 package_file = package_url.split('file://')[1]
-                delete_file = False
 
-        if download_url:
-            # download rpm
-            package_file = '%s/%s' % (constants.TMP_DIR, package_name)
-            http_utils.download_to_file(download_url, package_file)
+        return {'name': package_name, 'download_url': download_url, 'file': package_file}
+
+    def _get_package_file(self, package_url=None):
+        """Gets (downloading, if required) the local package file to install
+
+        Parameters
+        ----------
+        package_url : str
+            optional package url, supports local file and http/s url - defaults
+            to the component version download url
+
+        Returns
+        -------
+        tuple
+            the local package file, package name and whether the local file
+            should be deleted once uploaded: ('/tmp/pkg.rpm', 'pkg.rpm', False)
+        """
+
+        package = self._resolve_package(package_url)
+        package_file = package['file']
+        if package['download_url']:
+            # download rpm (once) into the shared artifact cache
+            package_file = cache_utils.get_artifact_cache().fetch(package['download_url'])
+
+        # note: local files and cached artifacts are never deleted
+        return package_file, package['name'], False
+
+    @staticmethod
+    def _is_package_installed(installed_info, package_name):
+        """Checks if the installed package is exactly the package to install
+
+        Parameters
+        ----------
+        installed_info : dict
+            the installed RPM information - see _get_installed_rpm_info()
+        package_name : str
+            the package (file) name to install: 'f5-appsvcs-3.18.0-4.noarch.rpm'
+
+        Returns
+        -------
+        bool
+            boolean true if the same package (version and release) is installed
+        """
+
+        return installed_info['installed'] and \
+            '%s.rpm' % installed_info['package_name'] == package_name
+
+    @staticmethod
+    def _get_remote_file_info_body(remote_file):
+        """Gets the request body to get the size and SHA-256 of a remote file
+
+        Notes
+        -----
+        The file name is (shell) quoted, it may come from the caller
+
+        Parameters
+        ----------
+        remote_file : str
+            the file on the remote device
+
+        Returns
+        -------
+        dict
+            the /mgmt/tm/util/bash request body
+        """
+
+        remote_file = shell_quote(remote_file)
+        script = 'test -f %s && stat -c %%s %s && sha256sum %s' % ((remote_file,) * 3)
+        return {
+            'command': 'run',
+            # single quote the script, escaping any single quotes within
+            'utilCmdArgs': "-c '%s'" % script.replace("'", "'\"'\"'")
+        }
+
+    @staticmethod
+    def _parse_remote_file_info(response):
+        """Parses the size and SHA-256 of a remote file
+
+        Parameters
+        ----------
+        response : dict
+            the /mgmt/tm/util/bash response
+
+        Returns
+        -------
+        dict
+            the remote file information, or None if it does not exist:
+            {'size': 0, 'sha256': ''}
+        """
+
+        lines = (response or {}).get('commandResult', '').strip().split('\n')
+        if len(lines) != 2 or not lines[0].strip().isdigit():
+            return None
+        return {'size': int(lines[0].strip()), 'sha256': lines[1].split()[0]}
+
+    def _get_remote_file_info(self, remote_file):
+        """Gets the size and SHA-256 of a remote file
+
+        Parameters
+        ----------
+        remote_file : str
+            the file on the remote device
+
+        Returns
+        -------
+        dict
+            the remote file information - see _parse_remote_file_info()
+        """
+
+        response = self._client.make_request(
+            constants.COMMANDS['BASH_URI'],
+            method='POST',
+            body=self._get_remote_file_info_body(remote_file)
+        )
+        return self._parse_remote_file_info(response)
+
+    @staticmethod
+    def _is_remote_file_current(package_file, remote_info):
+        """Checks if the remote file matches the local package file
+
+        Parameters
+        ----------
+        package_file : str
+            the local package file
+        remote_info : dict
+            the remote file information - see _parse_remote_file_info()
+
+        Returns
+        -------
+        bool
+            boolean true if the remote file size and SHA-256 match
+        """
+
+        return remote_info is not None \
+            and remote_info['size'] == os.path.getsize(package_file) \
+            and remote_info['sha256'] == file_utils.get_file_hash(package_file)
+
+    def install(self, package_url=None, **kwargs):
+        """Installs extension package component on a remote device
+
+        Parameters
+        ----------
+        package_url : str
+            optional keyword argument. Default is set to None.
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        package_url : str
+            optional package url to specify and install a rpm. Support local file and http/s url
+        chunk_size : int
+            the size (in bytes) of each uploaded slice
+        idempotent : bool
+            skip the install if the same package is already installed, and skip
+            the upload if the same file (size and SHA-256) exists on the device
+
+        Returns
+        -------
+        dict
+            a dictionary containing component and version:
+            {
+              'component': 'as3',
+              'version': 'x.x.x'
+            }
+        """
+
+        chunk_size = kwargs.pop('chunk_size', None)
+        idempotent = kwargs.pop('idempotent', False)
+
+        if idempotent:
+            installed_info = self._get_installed_rpm_info()
+            package_name = self._resolve_package(package_url)['name']
+            if self._is_package_installed(installed_info, package_name):
+                self.logger.info('Package already installed, skipping: %s' % package_name)
+                return {
+                    'component': self.component,
+                    'version': installed_info['installed_version']
+                }
+
+        package_file, package_name, delete_file = self._get_package_file(package_url)
+        remote_file = '%s/%s' % (REMOTE_DOWNLOADS_DIR, package_name)
 
         # upload to BIG-IP
-        self._upload_rpm(package_file, delete_file=delete_file)
+        if idempotent and self._is_remote_file_current(
+                package_file, self._get_remote_file_info(remote_file)):
+            self.logger.info('Package already uploaded, skipping: %s' % package_name)
+        else:
+            self._upload_rpm(
+                package_file,
+                delete_file=delete_file,
+                chunk_size=chunk_size
+            )
         # install on BIG-IP
-        tmp_file_bigip_path = '/var/config/rest/downloads/%s' % package_name
-        self._install_rpm(tmp_file_bigip_path)
+        self._install_rpm(remote_file)
         # get installed rpm info
         installed_info = self._get_installed_rpm_info()
         return {
@@ -249,14 +614,10 @@ class OperationClient(object):
         None
         """
 
-        uri = PKG_MGMT_URI
-        body = {
+        self._run_rpm_task({
             'operation': 'UNINSTALL',
             'packageName': package_name
-        }
-        response = self._client.make_request(uri, method='POST', body=body)
-        # now check for task status completion
-        self._check_rpm_task_status(response['id'])
+        })
 
     def _check_for_dependency(self):
         """Check for (existing) dependencies
@@ -343,15 +704,27 @@ class OperationClient(object):
             }
         """
 
-        # query device for packages
-        response = self._client.make_request(
-            PKG_MGMT_URI,
-            method='POST',
-            body={
-                'operation': 'QUERY'
-            }
-        )
-        response = self._check_rpm_task_status(response['id'])
+        # query device for packages (cached, shared by all components)
+        response = self._package_inventory.get(
+            lambda: self._run_rpm_task({'operation': 'QUERY'}))
+        return self._parse_query_response(response, component_package_name)
+
+    def _parse_query_response(self, response, component_package_name):
+        """Parses a package management QUERY task response for a package
+
+        Parameters
+        ----------
+        response : dict
+            the (finished) QUERY task response
+        component_package_name : str
+            the name of the installed package
+
+        Returns
+        -------
+        dict
+            RPM version, or empty string if it does not exist - see _check_rpm_exists()
+        """
+
         # check response for matching package_name
         matching_packages = [i for i in response['queryResponse']
                              if component_package_name == i['name']]
@@ -0,0 +1,174 @@
+"""Module for BIG-IP extension component service configuration (asyncio)
+
+Note
+----
+
+Requires python 3 (asyncio)
+"""
+
+# pylint: disable=protected-access
+
+import asyncio
+
+from f5sdk import constants
+from f5sdk.utils import misc_utils, retry_utils
+
+from .operation import OperationClient
+
+
+class AsyncOperationClient(OperationClient):
+    """A class used as an asyncio extension service operation client for BIG-IP
+
+    Notes
+    -----
+    Requires an asyncio management client, such as f5sdk.bigip.AsyncManagementClient
+
+    Attributes
+    ----------
+    component : str
+        the extension component
+    version : str
+        the extension component version
+
+    Methods
+    -------
+    is_available()
+        Refer to method documentation
+    show_info()
+        Refer to method documentation
+    create()
+        Refer to method documentation
+    show()
+        Refer to method documentation
+    """
+
+    async def _wait_for_task(self, task_url):
+        """Wait for task to complete - see OperationClient._wait_for_task()"""
+
+        return await self._client._wait_for_task(task_url)
+
+    async def _post(self, uri, config):
+        """Performs a POST, waiting for any async 'accepted' task
+
+        Parameters
+        ----------
+        uri : str
+            the endpoint URI
+        config : dict
+            the request body
+
+        Returns
+        -------
+        dict
+            the API response
+        """
+
+        response, status_code = await self._client.make_request(
+            uri,
+            method='POST',
+            body=config,
+            advanced_return=True
+        )
+
+        # check for async task pattern response
+        if status_code == constants.HTTP_STATUS_CODE['ACCEPTED']:
+            return await self._wait_for_task(response['selfLink'])
+        # return response data
+        return response
+
+    async def is_available(self):
+        """Checks extension component service is available
+
+        Notes
+        -----
+        Retries up to 60 seconds
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            a boolean based on service availability
+        """
+
+        uri = self._get_configure_endpoint()['uri']
+
+        state = retry_utils.RetryPolicy('service.is_available').start()
+        while not await self._client.make_request(uri, bool_response=True):
+            delay = state.next_delay('service not available')
+            if delay is None:
+                return False
+            await asyncio.sleep(delay)
+        state.succeeded()
+        return True
+
+    async def show_info(self):
+        """Show component extension info - see OperationClient.show_info()"""
+
+        return await self._client.make_request(self._get_info_endpoint()['uri'])
+
+    async def create(self, **kwargs):
+        """Creates (or updates) extension component service
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        config : dict
+            a dictionary containing configuration, or a pre-serialized
+            configuration (bytes, json_utils.PreparedBody) sent as-is
+        config_file : str
+            a local file containing configuration to send (as-is)
+
+        Returns
+        -------
+        dict
+            the response to a service create
+        """
+
+        config = misc_utils.resolve_config(
+            kwargs.pop('config', None), kwargs.pop('config_file', None), prepare=True)
+
+        return await self._post(self._get_configure_endpoint()['uri'], config)
+
+    async def show(self):
+        """Gets (shows) the extension component service - see OperationClient.show()"""
+
+        return await self._client.make_request(self._get_configure_endpoint()['uri'])
+
+    async def _delete(self):
+        """Performs a delete against the component configuration endpoint"""
+
+        return await self._client.make_request(
+            self._get_configure_endpoint()['uri'],
+            method='DELETE'
+        )
+
+    async def _show_inspect(self, **kwargs):
+        """Performs a GET against the component inspect endpoint"""
+
+        return await self._client.make_request(self._get_inspect_uri(**kwargs))
+
+    async def _show_trigger(self):
+        """Performs a GET against the component trigger endpoint"""
+
+        return await self._client.make_request(self._get_trigger_endpoint()['uri'])
+
+    async def _trigger(self, **kwargs):
+        """Performs a POST against the component trigger endpoint"""
+
+        endpoint = self._get_trigger_endpoint()
+        return await self._post(
+            endpoint['uri'], self._resolve_config_or_default(endpoint, **kwargs))
+
+    async def _reset(self, **kwargs):
+        """Performs a POST against the component reset endpoint"""
+
+        endpoint = self._get_reset_endpoint()
+        return await self._post(
+            endpoint['uri'], self._resolve_config_or_default(endpoint, **kwargs))
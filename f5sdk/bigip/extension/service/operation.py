@@ -4,10 +4,9 @@
 import time
 
 import requests
-from retry import retry
 
 from f5sdk import constants
-from f5sdk.utils import misc_utils
+from f5sdk.utils import misc_utils, retry_utils, task_utils
 
 class OperationClient(object):
     """A class used as a extension service operation client for BIG-IP
@@ -139,16 +138,8 @@ class OperationClient(object):
 
         return self._metadata_client.get_endpoints()['reset']
 
-    @retry(tries=constants.RETRIES['LONG'], delay=constants.RETRIES['DELAY_IN_SECS'])
-    def _wait_for_task(self, task_url):
-        """Wait for task to complete - async 'accepted' task
-
-        Notes
-        -----
-        Certain extension components support async task behavior,
-        where a 202 response on the initial POST is returned along
-        with a self link to query.  The self link will return 202 until
-        the task is complete, at which time it will return 200.
+    def _get_task_response(self, task_url):
+        """Get async task response (single attempt) - see _wait_for_task()
 
         Parameters
         ----------
@@ -171,12 +162,41 @@ class OperationClient(object):
 
         return response
 
+    def _wait_for_task(self, task_url):
+        """Wait for task to complete - async 'accepted' task
+
+        Notes
+        -----
+        Certain extension components support async task behavior,
+        where a 202 response on the initial POST is returned along
+        with a self link to query.  The self link will return 202 until
+        the task is complete, at which time it will return 200.
+
+        The task is polled by the (shared) task poller, any exception is
+        retried until the task poller timeout
+
+        Parameters
+        ----------
+        task_url : str
+            HTTP url to task ID to query
+
+        Returns
+        -------
+        dict
+            the response to a service create (from task ID endpoint)
+        """
+
+        return task_utils.get_task_poller().submit(
+            lambda: (True, self._get_task_response(task_url)),
+            retry_exceptions=True
+        ).result()
+
     def is_available(self):
         """Checks extension component service is available
 
         Notes
         -----
-        Retries up to 60 seconds
+        Retries until the retry policy deadline, see retry_utils
 
         Parameters
         ----------
@@ -190,16 +210,14 @@ class OperationClient(object):
 
         uri = self._get_configure_endpoint()['uri']
 
-        ret = False
-        i = 0
-        while i < constants.RETRIES['DEFAULT']:
-            if self._client.make_request(uri, bool_response=True):
-                ret = True
-                break
-            i += 1
-            time.sleep(constants.RETRIES['DELAY_IN_SECS'])
-
-        return ret
+        state = retry_utils.RetryPolicy('service.is_available').start()
+        while not self._client.make_request(uri, bool_response=True):
+            delay = state.next_delay('service not available')
+            if delay is None:
+                return False
+            time.sleep(delay)
+        state.succeeded()
+        return True
 
     def show_info(self):
         """Show component extension info
@@ -227,9 +245,11 @@ class OperationClient(object):
         Keyword Arguments
         -----------------
         config : dict
-            a dictionary containing configuration
+            a dictionary containing configuration, or a pre-serialized
+            configuration (bytes, json_utils.PreparedBody) sent as-is - such
+            as a declaration sent to many devices
         config_file : str
-            a local file containing configuration to load
+            a local file containing configuration to send (as-is)
 
         Returns
         -------
@@ -243,7 +263,7 @@ class OperationClient(object):
         response, status_code = self._client.make_request(
             self._get_configure_endpoint()['uri'],
             method='POST',
-            body=misc_utils.resolve_config(config, config_file),
+            body=misc_utils.resolve_config(config, config_file, prepare=True),
             advanced_return=True
         )
 
@@ -305,6 +325,27 @@ class OperationClient(object):
             the API response
         """
 
+        return self._client.make_request(self._get_inspect_uri(**kwargs))
+
+    def _get_inspect_uri(self, **kwargs):
+        """Get inspect endpoint URI, including any query parameters
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            optional query parameters to include
+
+        Returns
+        -------
+        str
+            the inspect URI
+        """
+
         query_parameters = kwargs.pop('query_parameters', None)
 
         url = ''
@@ -313,7 +354,39 @@ class OperationClient(object):
                 url += ''.join(key + '=' + str(query_parameters[key]) + '&')
             url = '?' + url[:-1]
 
-        return self._client.make_request(self._get_inspect_endpoint()['uri'] + url)
+        return self._get_inspect_endpoint()['uri'] + url
+
+    @staticmethod
+    def _resolve_config_or_default(endpoint, **kwargs):
+        """Resolve config options: config|config_file, or the endpoint default POST body
+
+        Parameters
+        ----------
+        endpoint : dict
+            the endpoint details
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        config : dict
+            a dictionary containing configuration
+        config_file : str
+            a local file containing configuration to load
+
+        Returns
+        -------
+        dict
+            the resolved config
+        """
+
+        config = kwargs.pop('config', None)
+        config_file = kwargs.pop('config_file', None)
+
+        # set default if no declaration is provided
+        if config is None and config_file is None:
+            return endpoint["defaultPostBody"]
+        return misc_utils.resolve_config(config, config_file)
 
     def _show_trigger(self):
         """Performs a GET against the component trigger endpoint
@@ -351,14 +424,7 @@ class OperationClient(object):
             the API response
         """
 
-        config = kwargs.pop('config', None)
-        config_file = kwargs.pop('config_file', None)
-
-        # set default if no declaration is provided
-        if config is None and config_file is None:
-            config = self._get_trigger_endpoint()["defaultPostBody"]
-        else:
-            config = misc_utils.resolve_config(config, config_file)
+        config = self._resolve_config_or_default(self._get_trigger_endpoint(), **kwargs)
 
         response, status_code = self._client.make_request(
             self._get_trigger_endpoint()['uri'],
@@ -394,14 +460,7 @@ class OperationClient(object):
             the API response
         """
 
-        config = kwargs.pop('config', None)
-        config_file = kwargs.pop('config_file', None)
-
-        # set default if no declaration is provided
-        if config is None and config_file is None:
-            config = self._get_reset_endpoint()["defaultPostBody"]
-        else:
-            config = misc_utils.resolve_config(config, config_file)
+        config = self._resolve_config_or_default(self._get_reset_endpoint(), **kwargs)
 
         response, status_code = self._client.make_request(
             self._get_reset_endpoint()['uri'],
@@ -1,29 +1,125 @@
 """BIG-IP management client"""
 
-import os
+import re
 import socket
-import warnings
+import threading
+import time
+import uuid
 from datetime import datetime, timedelta
-from retry import retry
-import paramiko
 
 import f5sdk.constants as constants
 from f5sdk.logger import Logger
-from f5sdk.utils import http_utils
-from f5sdk.exceptions import SSHCommandStdError, DeviceReadyError, InvalidAuthError, HTTPError
+from f5sdk.utils import http_utils, retry_utils, ssh_utils
+from f5sdk.exceptions import SSHCommandStdError, BashCommandStdError, DeviceReadyError, \
+    InvalidAuthError, HTTPError
+from f5sdk.base_clients import TokenClientMixin
 from f5sdk.decorators import check_auth, add_auth_header
 
 DFL_PORT = 443
 DFL_PORT_1NIC = 8443
 
-SSH_EXCEPTIONS = (
-    paramiko.ssh_exception.SSHException,
-    paramiko.ssh_exception.AuthenticationException,
-    paramiko.ssh_exception.BadHostKeyException
-)
+SSH_EXCEPTIONS = ssh_utils.SSH_EXCEPTIONS
+COMMAND_BACKENDS = ['ssh', 'rest']
 
+# discovered management ports, keyed by host
+_DISCOVERED_PORTS = {}
+_DISCOVERED_PORTS_LOCK = threading.Lock()
 
-class ManagementClient(object):
+
+def get_discovered_port(host):
+    """Get the (cached) discovered management port of a host
+
+    Parameters
+    ----------
+    host : str
+        the hostname of the device
+
+    Returns
+    -------
+    int
+        the management port, or None if not discovered
+    """
+
+    with _DISCOVERED_PORTS_LOCK:
+        return _DISCOVERED_PORTS.get(host)
+
+
+def set_discovered_port(host, port):
+    """Set (or with port None, remove) the discovered management port of a host
+
+    Parameters
+    ----------
+    host : str
+        the hostname of the device
+    port : int
+        the management port
+
+    Returns
+    -------
+    None
+    """
+
+    with _DISCOVERED_PORTS_LOCK:
+        if port is None:
+            _DISCOVERED_PORTS.pop(host, None)
+        else:
+            _DISCOVERED_PORTS[host] = port
+
+
+def select_port(results, preference_expired):
+    """Select the management port from (possibly partial) port test results
+
+    DFL_PORT is preferred: DFL_PORT_1NIC is only selected once DFL_PORT
+    failed, or once the preference delay expired
+
+    Parameters
+    ----------
+    results : dict
+        the port test results: {443: True}
+    preference_expired : bool
+        the preference delay has expired
+
+    Returns
+    -------
+    tuple
+        whether a decision was made, and the port (None if neither port
+        responded): (True, 443)
+    """
+
+    if results.get(DFL_PORT):
+        return True, DFL_PORT
+    if results.get(DFL_PORT_1NIC) and (DFL_PORT in results or preference_expired):
+        return True, DFL_PORT_1NIC
+    if len(results) == 2:
+        return True, None
+    return False, None
+
+
+def get_ready_check_policy(operation, timeout=None):
+    """Get the retry policy of device ready checks
+
+    Parameters
+    ----------
+    operation : str
+        the operation name (retry metrics are keyed by it)
+    timeout : float
+        the deadline (in seconds), defaults to DEVICE_READY['TIMEOUT_IN_SECS']
+
+    Returns
+    -------
+    object
+        the retry policy, see retry_utils.RetryPolicy
+    """
+
+    return retry_utils.RetryPolicy(
+        operation,
+        timeout=constants.DEVICE_READY['TIMEOUT_IN_SECS'] if timeout is None else timeout,
+        initial_delay=constants.DEVICE_READY['INITIAL_DELAY_IN_SECS'],
+        max_delay=constants.DEVICE_READY['MAX_DELAY_IN_SECS']
+    )
+
+
+class ManagementClient(TokenClientMixin):
     """A class used as a management client for BIG-IP
 
     Attributes
@@ -47,6 +143,14 @@ class ManagementClient(object):
         Refer to method documentation
     make_ssh_request()
         Refer to method documentation
+    make_ssh_requests()
+        Refer to method documentation
+    make_bash_request()
+        Refer to method documentation
+    make_bash_requests()
+        Refer to method documentation
+    close()
+        Refer to method documentation
     """
 
     def __init__(self, host, **kwargs):
@@ -75,6 +179,23 @@ class ManagementClient(object):
             the token to assign to the token attribute
         skip_ready_check : bool
             skips the device ready check if set to true
+        skip_login : bool
+            skips authentication, the caller is responsible for logging in
+        pool_size : int
+            the maximum number of keep-alive connections to pool for the device
+        transport : object
+            the HTTP transport to use instead of the (shared) keep-alive
+            session, see transport_utils - the caller owns (closes) it
+        compress : bool
+            compress (gzip) large request bodies, where the endpoint supports
+            it, and request compressed responses - see http_utils.make_request()
+        token_cache : bool
+            reuse (and persist) tokens using the on-disk token cache, keyed
+            by host, port and user - see cache_utils.TokenCache
+        command_backend : str
+            the backend for make_ssh_request() and make_ssh_requests(), either
+            'ssh' or 'rest' (iControl REST bash utility, over the existing
+            HTTPS session)
 
         Returns
         -------
@@ -89,31 +210,59 @@ class ManagementClient(object):
         self._password = kwargs.pop('password', None)
         self._private_key_file = kwargs.pop('private_key_file', None)
         self._set_user_password = kwargs.pop('set_user_password', None)
-        self.token = kwargs.pop('token', None)
-
-        self.token_details = {}
-
-        # check device is ready
-        if not kwargs.pop('skip_ready_check', False):
-            self._is_ready()
-
-        # handle multiple authentication mechanisms
-        if self._user and self._password:
-            self._login_using_credentials()
-        elif self._user and self._private_key_file:
-            self._set_password_using_key()
-            self._login_using_credentials()
-        elif self.token:
-            pass
-        else:
-            raise Exception('user|password, user|private_key_file or token required')
+        self._init_token(
+            token=kwargs.pop('token', None),
+            token_cache=kwargs.pop('token_cache', False)
+        )
+
+        # note: the persistent SSH connection is created on first use
+        self._commands = {
+            'backend': kwargs.pop('command_backend', constants.COMMANDS['BACKEND']),
+            'ssh': None,
+            'ssh_lock': threading.Lock()
+        }
+        if self._commands['backend'] not in COMMAND_BACKENDS:
+            raise Exception('command_backend must be one of: %s' % COMMAND_BACKENDS)
+
+        self._http = {
+            'session': None,
+            'transport': kwargs.pop('transport', None),
+            'compress': kwargs.pop('compress', False)
+        }
+        if self._http['transport'] is None:
+            # keep-alive connection pool, shared with other clients for this device
+            self._http['session'] = http_utils.get_session(
+                self.host, self.port, pool_size=kwargs.pop('pool_size', None))
+
+        try:
+            # check device is ready
+            if not kwargs.pop('skip_ready_check', False):
+                self._is_ready()
+
+            # handle multiple authentication mechanisms
+            if kwargs.pop('skip_login', False):
+                pass
+            elif self._user and self._password:
+                self._login_using_credentials()
+            elif self._user and self._private_key_file:
+                self._set_password_using_key()
+                self._login_using_credentials()
+            elif self.token:
+                pass
+            else:
+                raise Exception('user|password, user|private_key_file or token required')
+        except Exception:
+            # do not leak the pooled session reference
+            self.close()
+            raise
 
     def _test_socket(self, port):
         """Test TCP connection can be established
 
         Parameters
         ----------
-        None
+        port : int
+            the port to test
 
         Returns
         -------
@@ -121,7 +270,7 @@ class ManagementClient(object):
             a boolean true/false
         """
         _socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        _socket.settimeout(1)
+        _socket.settimeout(constants.DEVICE_READY['SOCKET_TIMEOUT_IN_SECS'])
 
         check = False
         try:
@@ -136,9 +285,11 @@ class ManagementClient(object):
     def _discover_port(self):
         """Discover management port (best effort)
 
-        Try 443 -> 8443, set port to 443 if neither responds.
+        Both 443 and 8443 are tried concurrently, 443 is preferred - 8443 is
+        used if 443 does not respond, or is still connecting after a short
+        preference delay.  Set port to 443 if neither responds.
 
-        Timeout set to 1 second, if connect or connect refused assume it is the right port.
+        The discovered port is cached (per host) for the process.
 
         Parameters
         ----------
@@ -154,19 +305,52 @@ class ManagementClient(object):
             the discovered management port
         """
 
-        if self._test_socket(DFL_PORT):
+        port = get_discovered_port(self.host)
+        if port:
+            return port
+
+        results = {}
+        condition = threading.Condition()
+
+        def _test_port(port):
+            result = self._test_socket(port)
+            with condition:
+                results[port] = result
+                condition.notify_all()
+
+        for port in [DFL_PORT, DFL_PORT_1NIC]:
+            thread = threading.Thread(target=_test_port, args=(port,))
+            thread.daemon = True
+            thread.start()
+
+        preference_deadline = None
+        with condition:
+            while True:
+                if results.get(DFL_PORT_1NIC) and preference_deadline is None:
+                    preference_deadline = time.time() + \
+                        constants.DEVICE_READY['PORT_PREFERENCE_DELAY_IN_SECS']
+                preference_expired = preference_deadline is not None \
+                    and time.time() >= preference_deadline
+                done, port = select_port(results, preference_expired)
+                if done:
+                    break
+                condition.wait(
+                    max(preference_deadline - time.time(), 0) if preference_deadline
+                    else constants.DEVICE_READY['SOCKET_TIMEOUT_IN_SECS']
+                )
+
+        if port is None:
             return DFL_PORT
-        if self._test_socket(DFL_PORT_1NIC):
-            return DFL_PORT_1NIC
-        return DFL_PORT
+        set_discovered_port(self.host, port)
+        return port
 
-    @retry(tries=constants.RETRIES['LONG'], delay=constants.RETRIES['DELAY_IN_SECS'])
     def _is_ready(self):
         """Checks that the device is ready
 
         Notes
         -----
-        Retries up to 5 minutes
+        Retries with exponential backoff (and jitter), until a deadline (5
+        minutes) - see get_ready_check_policy()
 
         Parameters
         ----------
@@ -180,11 +364,49 @@ class ManagementClient(object):
 
         self.logger.debug('Performing ready check using port %s' % self.port)
 
-        if self._test_socket(self.port):
-            return True
-
+        state = get_ready_check_policy('bigip.is_ready').start()
+        while True:
+            if self._test_socket(self.port):
+                state.succeeded()
+                return True
+            delay = state.next_delay('device not ready')
+            if delay is None:
+                break
+            time.sleep(delay)
+
+        # the discovered port may be stale
+        if get_discovered_port(self.host) == self.port:
+            set_discovered_port(self.host, None)
         raise DeviceReadyError('Unable to complete device ready check')
 
+    def _get_ssh_connection(self):
+        """Get the (persistent) SSH connection to the device, created on first use
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        object
+            the SSH connection, see ssh_utils.SSHConnection
+        """
+
+        with self._commands['ssh_lock']:
+            if self._commands['ssh'] is None:
+                # create connection kwargs
+                connect_kwargs = {
+                    'username': self._user
+                }
+                if self._password:
+                    connect_kwargs['password'] = self._password
+                elif self._private_key_file:
+                    connect_kwargs['pkey'] = ssh_utils.load_private_key(self._private_key_file)
+                else:
+                    raise Exception('password or private key file required')
+                self._commands['ssh'] = ssh_utils.SSHConnection(self.host, **connect_kwargs)
+            return self._commands['ssh']
+
     def _make_ssh_request(self, command):
         """See public method for documentation: make_ssh_request """
 
@@ -192,51 +414,142 @@ class ManagementClient(object):
         # logger should scrub those: i.e. secret foo -> secret ***
         self.logger.debug('Making SSH request: %s' % (command))
 
-        # create client kwargs
-        client_kwargs = {
-            'username': self._user
-        }
-        if self._password:
-            client_kwargs['password'] = self._password
-        elif self._private_key_file:
-            private_key_file = os.path.expanduser(self._private_key_file)
-            client_kwargs['pkey'] = paramiko.RSAKey.from_private_key_file(private_key_file)
-        else:
-            raise Exception('password or private key file required')
-
-        # workaround for deprecation warning described here, until fixed
-        # https://github.com/paramiko/paramiko/issues/1369
-        # workaround: temporarily catch warnings on client.connect
-        with warnings.catch_warnings(record=True) as _:
-            # create client
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.client.AutoAddPolicy)
-            try:
-                client.connect(self.host, **client_kwargs)
-            except SSH_EXCEPTIONS as _e:
-                self.logger.error(_e)
-                raise _e
-
-        # collect result
-        result = client.exec_command(command)
-
-        # command output (tuple): stdin, stdout, stder
-        stdout = result[1].read().decode('utf-8')
-        stderr = result[2].read().decode('utf-8')
-        client.close()
-
+        stdout, stderr = self._get_ssh_connection().exec_command(command)
         if stderr:
             raise SSHCommandStdError('Error: %s' % stderr)
 
         return stdout.rstrip('\n\r')
 
-    @retry(tries=constants.RETRIES['DEFAULT'], delay=constants.RETRIES['DELAY_IN_SECS'])
+    @staticmethod
+    def _get_bash_script(commands, marker, stop_on_error=False):
+        """Gets a bash script which runs commands, separating stdout and stderr
+
+        Notes
+        -----
+        Each command runs in a subshell, with stderr redirected to a temporary
+        file.  The stdout of each command is followed by a marker line
+        (containing the exit status), then its stderr and another marker line:
+
+            <stdout>\n<marker>:out:<index>:<exit status>\n<stderr>\n<marker>:err:<index>\n
+
+        Parameters
+        ----------
+        commands : list
+            the commands to run
+        marker : str
+            the (unique) marker
+        stop_on_error : bool
+            exit once a command writes to stderr
+
+        Returns
+        -------
+        str
+            the bash script
+        """
+
+        script = ['_e=$(mktemp); trap \'rm -f "$_e"\' EXIT']
+        for index, command in enumerate(commands):
+            script.append(
+                '( %s\n) 2>"$_e"; _r=$?; printf \'\\n%%s:out:%%d:%%d\\n\' %s %d $_r; '
+                'cat "$_e"; printf \'\\n%%s:err:%%d\\n\' %s %d' % (
+                    command, marker, index, marker, index))
+            if stop_on_error:
+                script.append('[ -s "$_e" ] && exit 0')
+        return '\n'.join(script)
+
+    @staticmethod
+    def _parse_bash_output(output, marker):
+        """Parses the output of a bash script, see _get_bash_script()
+
+        Parameters
+        ----------
+        output : str
+            the script output
+        marker : str
+            the marker
+
+        Returns
+        -------
+        list
+            the stdout and stderr of each (executed) command: [('stdout', 'stderr')]
+        """
+
+        out_re = re.compile(r'\n%s:out:\d+:\d+(?:\n|$)' % marker)
+        err_re = re.compile(r'\n%s:err:\d+(?:\n|$)' % marker)
+
+        results = []
+        position = 0
+        while True:
+            out_match = out_re.search(output, position)
+            if out_match is None:
+                break
+            err_match = err_re.search(output, out_match.end())
+            if err_match is None:
+                break
+            results.append((
+                output[position:out_match.start()],
+                output[out_match.end():err_match.start()]
+            ))
+            position = err_match.end()
+        return results
+
+    def _make_bash_requests(self, commands, stop_on_error=False):
+        """Runs commands using the iControl REST bash utility, in a single request
+
+        Parameters
+        ----------
+        commands : list
+            the commands to run
+        stop_on_error : bool
+            do not execute the remaining commands once a command fails
+
+        Returns
+        -------
+        list
+            the stdout and stderr of each (executed) command: [('stdout', 'stderr')]
+        """
+
+        # note: command *might* contain sensitive information
+        self.logger.debug('Making bash request: %s' % (commands))
+
+        marker = '__F5SDK_%s' % uuid.uuid4().hex
+        script = self._get_bash_script(commands, marker, stop_on_error=stop_on_error)
+        response = self.make_request(
+            constants.COMMANDS['BASH_URI'],
+            method='POST',
+            body={
+                'command': 'run',
+                # single quote the script, escaping any single quotes within
+                'utilCmdArgs': "-c '%s'" % script.replace("'", "'\"'\"'")
+            }
+        )
+
+        results = self._parse_bash_output((response or {}).get('commandResult', ''), marker)
+        if not results:
+            raise BashCommandStdError('Error: unexpected response: %s' % response)
+        return results
+
+    @retry_utils.retry('bigip.set_password_using_key')
     def _set_password_using_key(self):
         """Sets password on device using user + private key
 
         Updates user's password using set_user_password
 
-        Retries if unsuccessful, up to maximum allotment
+        Retries if unsuccessful, until the retry policy deadline (see retry_utils)
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self._set_password()
+
+    def _set_password(self):
+        """Sets password on device using user + private key (single attempt)
 
         Parameters
         ----------
@@ -268,13 +581,16 @@ class ManagementClient(object):
         self._make_ssh_request(constants.BIGIP_CMDS['AUTH_MODIFY'] % (tmsh, self._user, password))
         self._password = password
 
-    @retry(exceptions=HTTPError,
-           tries=constants.RETRIES['DEFAULT'],
-           delay=constants.RETRIES['DELAY_IN_SECS'])
+    @retry_utils.retry(
+        'bigip.get_token',
+        exceptions=HTTPError,
+        retry_status_codes=[constants.HTTP_STATUS_CODE['BAD_REQUEST']]
+    )
     def _get_token(self):
         """Gets authentication token
 
-        Retries if unsuccessful, up to maximum allotment
+        Retries if unsuccessful, until the retry policy deadline (see retry_utils).
+        Bad request (400) is retried, it may be returned while the device starts
 
         Parameters
         ----------
@@ -287,6 +603,21 @@ class ManagementClient(object):
             {'token': 'token', 'expirationDate': '2019-01-01T01:01:01.00', 'expirationIn': 3600}
         """
 
+        return self._request_token()
+
+    def _request_token(self):
+        """Requests authentication token (single attempt)
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            see _get_token()
+        """
+
         self.logger.debug('Getting authentication token')
 
         expiration_date = (datetime.now() + timedelta(hours=1)).isoformat()
@@ -307,10 +638,12 @@ class ManagementClient(object):
                 port=self.port,
                 method='POST',
                 body=body,
-                basic_auth={'user': self._user, 'password': self._password}
+                basic_auth={'user': self._user, 'password': self._password},
+                session=self._http['session'],
+                transport=self._http['transport']
             )
         except HTTPError as error:
-            if constants.HTTP_STATUS_CODE['FAILED_AUTHENTICATION'] in str(error):
+            if error.status_code == constants.HTTP_STATUS_CODE['UNAUTHORIZED']:
                 _exception = InvalidAuthError(error)
                 _exception.__cause__ = None
                 raise _exception
@@ -326,28 +659,12 @@ class ManagementClient(object):
             port=self.port,
             method='PATCH',
             body={'timeout': timeout},
-            basic_auth={'user': self._user, 'password': self._password}
+            basic_auth={'user': self._user, 'password': self._password},
+            session=self._http['session'],
+            transport=self._http['transport']
         )
         return {'token': token, 'expirationDate': expiration_date, 'expirationIn': timeout}
 
-    def _login_using_credentials(self):
-        """Logs in to device using user + password
-
-        Parameters
-        ----------
-        None
-
-        Returns
-        -------
-        None
-        """
-
-        self.logger.debug('Logging in using user + password')
-
-        token = self._get_token()
-        self.token = token['token']
-        self.token_details = token
-
     @check_auth
     @add_auth_header
     def make_request(self, uri, **kwargs):
@@ -374,6 +691,9 @@ class ManagementClient(object):
             return boolean based on HTTP success/failure
         advanced_return : bool
             return additional information, like HTTP status code to caller
+        compress : bool
+            compress (gzip) large requests and responses, defaults to the
+            client compress setting - see http_utils.make_request()
 
         Returns
         -------
@@ -381,7 +701,36 @@ class ManagementClient(object):
             a dictionary containing the JSON response
         """
 
-        return http_utils.make_request(self.host, uri, port=self.port, **kwargs)
+        if self._http['compress']:
+            kwargs.setdefault('compress', True)
+        return http_utils.make_request(
+            self.host, uri, port=self.port, session=self._http['session'],
+            transport=self._http['transport'], **kwargs)
+
+    def close(self):
+        """Closes the management client, releasing pooled connections
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        if self._http['session'] is not None:
+            http_utils.release_session(self.host, self.port)
+            self._http['session'] = None
+        if self._commands['ssh'] is not None:
+            self._commands['ssh'].close()
+            self._commands['ssh'] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     @check_auth
     def make_ssh_request(self, command):
@@ -398,8 +747,109 @@ class ManagementClient(object):
             the command response
         """
 
+        if self._commands['backend'] == 'rest':
+            return self.make_bash_request(command)
         return self._make_ssh_request(command)
 
+    def make_ssh_requests(self, commands, **kwargs):
+        """Makes a batch of requests to device (SSH), over one connection
+
+        Parameters
+        ----------
+        commands : list
+            the commands to execute on the device, in order
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        stop_on_error : bool
+            do not execute the remaining commands once a command fails
+
+        Returns
+        -------
+        list
+            the result of each (executed) command:
+            [{'command': '', 'response': '', 'error': None}]
+        """
+
+        stop_on_error = kwargs.pop('stop_on_error', False)
+
+        if self._commands['backend'] == 'rest':
+            return self.make_bash_requests(commands, stop_on_error=stop_on_error)
+
+        results = []
+        for command in commands:
+            try:
+                response, error = self._make_ssh_request(command), None
+            except SSHCommandStdError as err:
+                response, error = None, err
+            results.append({'command': command, 'response': response, 'error': error})
+            if error is not None and stop_on_error:
+                break
+        return results
+
+    def make_bash_request(self, command):
+        """Makes request to device (iControl REST bash utility)
+
+        Parameters
+        ----------
+        command : str
+            the command to execute on the device
+
+        Returns
+        -------
+        str
+            the command response (stdout)
+
+        Raises
+        ------
+        BashCommandStdError
+            if the command writes to stderr
+        """
+
+        stdout, stderr = self._make_bash_requests([command])[0]
+        if stderr:
+            raise BashCommandStdError('Error: %s' % stderr)
+
+        return stdout.rstrip('\n\r')
+
+    def make_bash_requests(self, commands, **kwargs):
+        """Makes a batch of requests to device (iControl REST bash utility),
+        in a single HTTP request
+
+        Parameters
+        ----------
+        commands : list
+            the commands to execute on the device, in order
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        stop_on_error : bool
+            do not execute the remaining commands once a command fails
+
+        Returns
+        -------
+        list
+            the result of each (executed) command, error is a
+            BashCommandStdError containing stderr (if any):
+            [{'command': '', 'response': '', 'error': None}]
+        """
+
+        stop_on_error = kwargs.pop('stop_on_error', False)
+
+        results = []
+        outputs = self._make_bash_requests(commands, stop_on_error=stop_on_error)
+        for command, (stdout, stderr) in zip(commands, outputs):
+            if stderr:
+                response, error = None, BashCommandStdError('Error: %s' % stderr)
+            else:
+                response, error = stdout.rstrip('\n\r'), None
+            results.append({'command': command, 'response': response, 'error': error})
+        return results
+
     def get_info(self):
         """Gets device info
 
@@ -0,0 +1,234 @@
+"""BIG-IP (mass) device readiness watcher
+
+Note
+----
+
+Requires python 3 (asyncio)
+"""
+
+import asyncio
+import socket
+
+from f5sdk.logger import Logger
+from f5sdk import constants
+from f5sdk.exceptions import DeviceReadyError
+from .mgmt_client import DFL_PORT, DFL_PORT_1NIC, get_ready_check_policy, select_port, \
+    set_discovered_port
+
+
+class ReadinessWatcher(object):
+    """A class used to watch many devices until their management port accepts connections
+
+    Notes
+    -----
+    Every probe is a non-blocking connect on the event loop (selector), so
+    thousands of devices are watched from a single thread.  Each device is
+    probed with exponential backoff (and jitter) until it is ready, or the
+    timeout expires - see mgmt_client.get_ready_check_policy().
+    Devices without a port are probed on both 443 and 8443 (443 preferred,
+    see mgmt_client.select_port), the discovered port is cached for
+    management client construction.
+
+    Methods
+    -------
+    watch()
+        Refer to method documentation
+    """
+
+    def __init__(self, targets, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        targets : list
+            the devices, either a host string or a dictionary containing the
+            host and (optionally) port:
+            ['192.0.2.10', {'host': '192.0.2.11', 'port': 8443}]
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        timeout : int
+            the per-device timeout (in seconds)
+        connect_timeout : int
+            the timeout (in seconds) of each connection attempt
+        max_connections : int
+            the maximum number of concurrent connection attempts
+
+        Returns
+        -------
+        None
+        """
+
+        self.logger = Logger(__name__).get_logger()
+
+        self._timeout = kwargs.pop('timeout', constants.DEVICE_READY['TIMEOUT_IN_SECS'])
+        self._connect_timeout = kwargs.pop(
+            'connect_timeout', constants.DEVICE_READY['SOCKET_TIMEOUT_IN_SECS'])
+        self._max_connections = kwargs.pop(
+            'max_connections', constants.READINESS_WATCHER['MAX_CONNECTIONS'])
+        self._targets = [i if isinstance(i, dict) else {'host': i} for i in targets]
+
+        self._semaphore = None
+
+    async def _test_socket(self, host, port):
+        """Test TCP connection can be established (non-blocking connect)
+
+        Parameters
+        ----------
+        host : str
+            the device host
+        port : int
+            the port to test
+
+        Returns
+        -------
+        bool
+            a boolean true/false
+        """
+
+        loop = asyncio.get_event_loop()
+        async with self._semaphore:
+            try:
+                addresses = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except (socket.gaierror, OSError) as err:
+                self.logger.debug('%s: unable to resolve: %s' % (host, err))
+                return False
+
+            family, _, proto, _, address = addresses[0]
+            _socket = socket.socket(family, socket.SOCK_STREAM, proto)
+            _socket.setblocking(False)
+            try:
+                await asyncio.wait_for(loop.sock_connect(_socket, address), self._connect_timeout)
+                return True
+            except (asyncio.TimeoutError, OSError) as err:
+                self.logger.debug('%s:%s: connection failed: %r' % (host, port, err))
+                return False
+            finally:
+                _socket.close()
+
+    async def _probe(self, target):
+        """Probe device port(s) once
+
+        Parameters
+        ----------
+        target : dict
+            the device: {'host': '', 'port': 443}
+
+        Returns
+        -------
+        int
+            the port accepting connections, or None
+        """
+
+        if target.get('port'):
+            ready = await self._test_socket(target['host'], int(target['port']))
+            return int(target['port']) if ready else None
+
+        port = await self._discover_port(target['host'])
+        if port is not None:
+            set_discovered_port(target['host'], port)
+        return port
+
+    async def _discover_port(self, host):
+        """Discover management port, probing both ports once
+
+        Both 443 and 8443 are probed concurrently, 443 is preferred - 8443 is
+        used if 443 does not respond, or is still connecting after a short
+        preference delay (the 443 probe is then cancelled)
+
+        Parameters
+        ----------
+        host : str
+            the device host
+
+        Returns
+        -------
+        int
+            the port accepting connections, or None
+        """
+
+        loop = asyncio.get_event_loop()
+        tasks = {i: asyncio.ensure_future(self._test_socket(host, i))
+                 for i in [DFL_PORT, DFL_PORT_1NIC]}
+        results = {}
+        preference_deadline = None
+        try:
+            while True:
+                results.update({i: task.result() for i, task in tasks.items() if task.done()})
+                if results.get(DFL_PORT_1NIC) and preference_deadline is None:
+                    preference_deadline = loop.time() + \
+                        constants.DEVICE_READY['PORT_PREFERENCE_DELAY_IN_SECS']
+                done, port = select_port(
+                    results,
+                    preference_deadline is not None and loop.time() >= preference_deadline
+                )
+                if done:
+                    return port
+                await asyncio.wait(
+                    [i for i in tasks.values() if not i.done()],
+                    timeout=max(preference_deadline - loop.time(), 0) if preference_deadline
+                    else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def _watch_target(self, target):
+        """Watch a device until ready (or timed out)
+
+        Parameters
+        ----------
+        target : dict
+            the device: {'host': '', 'port': 443}
+
+        Returns
+        -------
+        dict
+            the device result: {'host': '', 'port': 443, 'error': None}
+        """
+
+        state = get_ready_check_policy('readiness.watch', timeout=self._timeout).start()
+        while True:
+            port = await self._probe(target)
+            if port is not None:
+                state.succeeded()
+                return {'host': target['host'], 'port': port, 'error': None}
+            delay = state.next_delay('device not ready')
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        return {
+            'host': target['host'],
+            'port': target.get('port'),
+            'error': DeviceReadyError('Unable to complete device ready check')
+        }
+
+    async def watch(self):
+        """Watches all devices concurrently
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        async generator
+            yields the result for each device, the moment it is ready (or
+            times out): {'host': '', 'port': 443, 'error': None}
+        """
+
+        # note: created here, so the semaphore binds to the running event loop
+        self._semaphore = asyncio.Semaphore(self._max_connections)
+
+        tasks = [asyncio.ensure_future(self._watch_target(i)) for i in self._targets]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # caller stopped iterating early
+            for task in tasks:
+                task.cancel()
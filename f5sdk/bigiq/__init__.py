@@ -7,10 +7,24 @@
         device = ManagementClient('192.0.2.10', user='admin', password='admin')
         # get device info (version, etc.)
         device.get_info()
+
+    Example - asyncio (python 3)::
+
+        from f5sdk.bigiq import AsyncManagementClient
+
+        async with AsyncManagementClient('192.0.2.10', user='admin', password='admin') as device:
+            await device.get_info()
 """
 
+import sys
+
 from .mgmt_client import ManagementClient
 
 __all__ = [
     'ManagementClient'
 ]
+
+# asyncio client requires python 3
+if sys.version_info[0] >= 3:
+    from .async_mgmt_client import AsyncManagementClient
+    __all__.append('AsyncManagementClient')
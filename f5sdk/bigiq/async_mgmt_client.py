@@ -0,0 +1,69 @@
+"""BIG-IQ asyncio management client
+
+Note
+----
+
+Requires python 3 (asyncio)
+"""
+
+from f5sdk.base_async_clients import BaseAsyncManagementClient
+
+from .mgmt_client import ManagementClient
+
+
+class AsyncManagementClient(BaseAsyncManagementClient):
+    """A class used as an asyncio management client for BIG-IQ
+
+    Attributes
+    ----------
+    client : object
+        the (synchronous) management client, available after login()
+
+    Methods
+    -------
+    login()
+        Refer to method documentation
+    get_info()
+        Refer to method documentation
+    make_request()
+        Refer to method documentation
+    close()
+        Refer to method documentation
+    """
+
+    client_class = ManagementClient
+
+    def __init__(self, host, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        host : str
+            the hostname of the device
+        **kwargs :
+            optional keyword arguments, see ManagementClient and
+            BaseAsyncManagementClient
+
+        Returns
+        -------
+        None
+        """
+
+        super(AsyncManagementClient, self).__init__(host, logger_name=__name__, **kwargs)
+
+    async def get_info(self):
+        """Gets device info
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            the device information, see ManagementClient.get_info()
+        """
+
+        self._check_login()
+
+        return await self._run(self.client.get_info)
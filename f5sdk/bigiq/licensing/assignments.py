@@ -13,6 +13,8 @@ class AssignmentClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     """
 
     def __init__(self, client, **kwargs):
@@ -37,7 +39,8 @@ class AssignmentClient(BaseFeatureClient):
         super(AssignmentClient, self).__init__(
             client,
             logger_name=__name__,
-            uri='/mgmt/cm/device/licensing/assignments'
+            uri='/mgmt/cm/device/licensing/assignments',
+            query_style='bigiq'
         )
 
     def list(self, **kwargs):
@@ -52,6 +55,9 @@ class AssignmentClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -60,3 +66,31 @@ class AssignmentClient(BaseFeatureClient):
         """
 
         return self._list(**kwargs)
+
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
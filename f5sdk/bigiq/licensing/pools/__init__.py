@@ -35,6 +35,14 @@
             }
         )
 
+    Example - Member Management (many devices, without waiting on each task)::
+
+        futures = [
+            license_client.create(config=config, wait=False) for config in configs
+        ]
+        # tasks are polled concurrently by the shared task poller
+        responses = [future.result() for future in futures]
+
     Example - RegKey Pools::
 
         from f5sdk.bigiq import ManagementClient
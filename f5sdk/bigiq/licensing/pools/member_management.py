@@ -13,6 +13,8 @@ class MemberManagementClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     """
@@ -40,7 +42,8 @@ class MemberManagementClient(BaseFeatureClient):
         super(MemberManagementClient, self).__init__(
             client,
             logger_name=__name__,
-            uri='/mgmt/cm/device/tasks/licensing/pool/member-management'
+            uri='/mgmt/cm/device/tasks/licensing/pool/member-management',
+            query_style='bigiq'
         )
 
     def list(self, **kwargs):
@@ -55,6 +58,9 @@ class MemberManagementClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -64,6 +70,34 @@ class MemberManagementClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -15,6 +15,8 @@ class RegKeyClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -50,7 +52,8 @@ class RegKeyClient(BaseFeatureClient):
         super(RegKeyClient, self).__init__(
             client,
             logger_name=__name__,
-            uri=BASE_URI
+            uri=BASE_URI,
+            query_style='bigiq'
         )
 
     def list(self, **kwargs):
@@ -65,6 +68,9 @@ class RegKeyClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -74,6 +80,34 @@ class RegKeyClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -113,6 +147,9 @@ class RegKeyClient(BaseFeatureClient):
             object containing configuration
         config_file : str
             reference to a local file containing configuration
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
@@ -182,6 +219,8 @@ class RegKeyOfferingsClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -218,7 +257,8 @@ class RegKeyOfferingsClient(BaseFeatureClient):
         super(RegKeyOfferingsClient, self).__init__(
             client,
             logger_name=__name__,
-            uri='%s/%s/offerings' % (BASE_URI, self._pool_name)
+            uri='%s/%s/offerings' % (BASE_URI, self._pool_name),
+            query_style='bigiq'
         )
 
     def list(self, **kwargs):
@@ -233,6 +273,9 @@ class RegKeyOfferingsClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -242,6 +285,34 @@ class RegKeyOfferingsClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -281,6 +352,9 @@ class RegKeyOfferingsClient(BaseFeatureClient):
             object containing configuration
         config_file : str
             reference to a local file containing configuration
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
@@ -350,6 +424,8 @@ class RegKeyOfferingMembersClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -389,7 +465,8 @@ class RegKeyOfferingMembersClient(BaseFeatureClient):
         super(RegKeyOfferingMembersClient, self).__init__(
             client,
             logger_name=__name__,
-            uri='%s/%s/offerings/%s/members' % (BASE_URI, self._pool_name, self._offering_name)
+            uri='%s/%s/offerings/%s/members' % (BASE_URI, self._pool_name, self._offering_name),
+            query_style='bigiq'
         )
 
     def list(self, **kwargs):
@@ -404,6 +481,9 @@ class RegKeyOfferingMembersClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -413,6 +493,34 @@ class RegKeyOfferingMembersClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -452,6 +560,9 @@ class RegKeyOfferingMembersClient(BaseFeatureClient):
             object containing configuration
         config_file : str
             reference to a local file containing configuration
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
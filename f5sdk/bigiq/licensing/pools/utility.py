@@ -15,6 +15,8 @@ class UtilityClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -50,7 +52,8 @@ class UtilityClient(BaseFeatureClient):
         super(UtilityClient, self).__init__(
             client,
             logger_name=__name__,
-            uri=BASE_URI
+            uri=BASE_URI,
+            query_style='bigiq'
         )
 
     def list(self, **kwargs):
@@ -65,6 +68,9 @@ class UtilityClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -74,6 +80,34 @@ class UtilityClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -113,6 +147,9 @@ class UtilityClient(BaseFeatureClient):
             object containing configuration
         config_file : str
             reference to a local file containing configuration
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
@@ -183,6 +220,8 @@ class UtilityOfferingsClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -219,7 +258,8 @@ class UtilityOfferingsClient(BaseFeatureClient):
         super(UtilityOfferingsClient, self).__init__(
             client,
             logger_name=__name__,
-            uri='%s/%s/offerings' % (BASE_URI, self._pool_name)
+            uri='%s/%s/offerings' % (BASE_URI, self._pool_name),
+            query_style='bigiq'
         )
 
     def list(self, **kwargs):
@@ -234,6 +274,9 @@ class UtilityOfferingsClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -243,6 +286,34 @@ class UtilityOfferingsClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -282,6 +353,9 @@ class UtilityOfferingsClient(BaseFeatureClient):
             object containing configuration
         config_file : str
             reference to a local file containing configuration
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
@@ -352,6 +426,8 @@ class UtilityOfferingMembersClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -390,7 +466,8 @@ class UtilityOfferingMembersClient(BaseFeatureClient):
         super(UtilityOfferingMembersClient, self).__init__(
             client,
             logger_name=__name__,
-            uri='%s/%s/offerings/%s/members' % (BASE_URI, self._pool_name, self._offering_name)
+            uri='%s/%s/offerings/%s/members' % (BASE_URI, self._pool_name, self._offering_name),
+            query_style='bigiq'
         )
 
     def list(self, **kwargs):
@@ -405,6 +482,9 @@ class UtilityOfferingMembersClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -414,6 +494,34 @@ class UtilityOfferingMembersClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -453,6 +561,9 @@ class UtilityOfferingMembersClient(BaseFeatureClient):
             object containing configuration
         config_file : str
             reference to a local file containing configuration
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
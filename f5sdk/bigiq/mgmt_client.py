@@ -3,15 +3,13 @@
 
 from datetime import datetime, timedelta
 
-from retry import retry
-
 from f5sdk.logger import Logger
-from f5sdk import constants
-from f5sdk.utils import http_utils
+from f5sdk.utils import http_utils, retry_utils
+from f5sdk.base_clients import TokenClientMixin
 from f5sdk.decorators import check_auth, add_auth_header
 
 
-class ManagementClient(object):
+class ManagementClient(TokenClientMixin):
     """A class used as a management client for BIG-IQ
 
     Attributes
@@ -20,6 +18,10 @@ class ManagementClient(object):
         the hostname of the device
     port : str
         the port of the device
+    token : str
+        the token of the device
+    token_details : dict
+        the token details of the device
 
     Methods
     -------
@@ -27,6 +29,8 @@ class ManagementClient(object):
         Refer to method documentation
     make_request()
         Refer to method documentation
+    close()
+        Refer to method documentation
     """
 
     def __init__(self, host, **kwargs):
@@ -47,6 +51,19 @@ class ManagementClient(object):
             the username for device authentication
         password : str
             the password for device authentication
+        pool_size : int
+            the maximum number of keep-alive connections to pool for the device
+        skip_login : bool
+            skips authentication, the caller is responsible for logging in
+        transport : object
+            the HTTP transport to use instead of the (shared) keep-alive
+            session, see transport_utils - the caller owns (closes) it
+        compress : bool
+            compress (gzip) large request bodies, where the endpoint supports
+            it, and request compressed responses - see http_utils.make_request()
+        token_cache : bool
+            reuse (and persist) tokens using the on-disk token cache, keyed
+            by host, port and user - see cache_utils.TokenCache
 
         Returns
         -------
@@ -61,17 +78,36 @@ class ManagementClient(object):
         self._user = kwargs.pop('user', None)
         self._password = kwargs.pop('password', None)
 
-        # account for multiple authentication schemes
-        if self._user and self._password:
-            self._login_using_credentials()
-        else:
-            raise Exception('user|password required')
+        self._init_token(token_cache=kwargs.pop('token_cache', False))
 
-    @retry(tries=constants.RETRIES['DEFAULT'], delay=constants.RETRIES['DELAY_IN_SECS'])
+        self._http = {
+            'session': None,
+            'transport': kwargs.pop('transport', None),
+            'compress': kwargs.pop('compress', False)
+        }
+        if self._http['transport'] is None:
+            # keep-alive connection pool, shared with other clients for this device
+            self._http['session'] = http_utils.get_session(
+                self.host, self.port, pool_size=kwargs.pop('pool_size', None))
+
+        try:
+            # account for multiple authentication schemes
+            if kwargs.pop('skip_login', False):
+                pass
+            elif self._user and self._password:
+                self._login_using_credentials()
+            else:
+                raise Exception('user|password required')
+        except Exception:
+            # do not leak the pooled session reference
+            self.close()
+            raise
+
+    @retry_utils.retry('bigiq.get_token')
     def _get_token(self):
         """Gets authentication token
 
-        Retries if unsuccessful, up to maximum allotment
+        Retries if unsuccessful, until the retry policy deadline (see retry_utils)
 
         Parameters
         ----------
@@ -87,6 +123,21 @@ class ManagementClient(object):
             }
         """
 
+        return self._request_token()
+
+    def _request_token(self):
+        """Requests authentication token (single attempt)
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            see _get_token()
+        """
+
         self.logger.debug('Getting authentication token')
 
         response = http_utils.make_request(
@@ -101,7 +152,9 @@ class ManagementClient(object):
             basic_auth={
                 'user': self._user,
                 'password': self._password
-            }
+            },
+            session=self._http['session'],
+            transport=self._http['transport']
         )
         token_details = response['token']
 
@@ -112,22 +165,6 @@ class ManagementClient(object):
             ).isoformat()
         }
 
-    def _login_using_credentials(self):
-        """Login to device using user + password
-
-        Parameters
-        ----------
-        None
-
-        Returns
-        -------
-        None
-        """
-
-        self.logger.info('Logging in using user + password')
-
-        self.token = self._get_token()['token']
-
     @check_auth
     @add_auth_header
     def make_request(self, uri, **kwargs):
@@ -154,6 +191,9 @@ class ManagementClient(object):
             return boolean based on HTTP success/failure
         advanced_return : bool
             return additional information, like HTTP status code to caller
+        compress : bool
+            compress (gzip) large requests and responses, defaults to the
+            client compress setting - see http_utils.make_request()
 
         Returns
         -------
@@ -161,7 +201,33 @@ class ManagementClient(object):
             a dictionary containing the JSON response
         """
 
-        return http_utils.make_request(self.host, uri, port=self.port, **kwargs)
+        if self._http['compress']:
+            kwargs.setdefault('compress', True)
+        return http_utils.make_request(
+            self.host, uri, port=self.port, session=self._http['session'],
+            transport=self._http['transport'], **kwargs)
+
+    def close(self):
+        """Closes the management client, releasing pooled connections
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        if self._http['session'] is not None:
+            http_utils.release_session(self.host, self.port)
+            self._http['session'] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def get_info(self):
         """Gets device info
@@ -1,30 +1,121 @@
 """ Constants used throughout this package """
 
 import logging
+import os
 import tempfile
 import operator
 
 VERSION = '0.9.2'
 USER_AGENT = 'f5sdk/%s' % (VERSION)
 TMP_DIR = tempfile.gettempdir()
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.f5sdk', 'cache')
 DFL_LOG_LEVEL = logging.WARNING
 F5_AUTH_TOKEN_HEADER = 'X-F5-Auth-Token'
 HTTPS_REQUEST_WARNING_VALUE = 'ignore:Unverified HTTPS request'
 HTTP_TIMEOUT = {
-    'DFL': 60
+    'DFL': 60,
+    'METADATA': 10
 }
 HTTP_VERIFY = False
+HTTP_COMPRESSION = {
+    'MIN_SIZE': 64 * 1024,
+    'LEVEL': 6,
+    'REJECTED_STATUS_CODES': [400, 415]
+}
+HTTP_STREAM = {
+    'CHUNK_SIZE': 64 * 1024
+}
+HTTP_POOL = {
+    'SIZE': 10
+}
+PAGING = {
+    'PAGE_SIZE': 100,
+    'CS_LIMIT_PARAMETER': 'limit',
+    'CS_PAGE_PARAMETER': 'page'
+}
 HTTP_STATUS_CODE = {
     'OK': 200,
     'ACCEPTED': 202,
+    'BAD_REQUEST': 400,
+    'UNAUTHORIZED': 401,
     'BAD_REQUEST_BODY': 'code: 400',
     'FAILED_AUTHENTICATION': 'code: 401'
 }
 
-RETRIES = {
-    'DEFAULT': 60,
-    'LONG': 300,
-    'DELAY_IN_SECS': 1
+HTTP_ERRORS = {
+    'RETRYABLE_STATUS_CODES': [408, 429, 500, 502, 503, 504],
+    'RETRY_AFTER_STATUS_CODES': [429, 503]
+}
+
+RETRY_POLICY = {
+    'INITIAL_DELAY_IN_SECS': 0.5,
+    'MAX_DELAY_IN_SECS': 10,
+    'MULTIPLIER': 2,
+    'TIMEOUT_IN_SECS': 60,
+    'LONG_TIMEOUT_IN_SECS': 300
+}
+
+RETRY_BUDGET = {
+    'CAPACITY': 1000,
+    'REFILL_PER_SEC': 100
+}
+
+ASYNC = {
+    'MAX_CONCURRENCY': 10
+}
+
+DEVICE_READY = {
+    'TIMEOUT_IN_SECS': 300,
+    'INITIAL_DELAY_IN_SECS': 0.5,
+    'MAX_DELAY_IN_SECS': 10,
+    'SOCKET_TIMEOUT_IN_SECS': 1,
+    'PORT_PREFERENCE_DELAY_IN_SECS': 0.25
+}
+
+READINESS_WATCHER = {
+    'MAX_CONNECTIONS': 1000
+}
+
+SSH = {
+    'IDLE_TIMEOUT_IN_SECS': 300
+}
+
+COMMANDS = {
+    'BACKEND': 'ssh',
+    'BASH_URI': '/mgmt/tm/util/bash'
+}
+
+TOKEN = {
+    'REFRESH_BEFORE_EXPIRY_IN_SECS': 60
+}
+
+ARTIFACT_CACHE = {
+    'MAX_SIZE_IN_BYTES': 1024 * 1024 * 1024,
+    'FETCH_ATTEMPTS': 3
+}
+
+DOWNLOAD = {
+    'CONNECTIONS': 4,
+    'PART_SIZE': 8 * 1024 * 1024,
+    'BUFFER_SIZE': 1024 * 1024,
+    'RETRIES': 3
+}
+
+PACKAGE_INVENTORY = {
+    'TTL_IN_SECS': 30
+}
+
+UPLOAD = {
+    'CHUNK_SIZE': 1024 * 1024,
+    'RETRIES': 3
+}
+
+TASK_POLLER = {
+    'WORKERS': 4,
+    'INITIAL_DELAY_IN_SECS': 0.25,
+    'MAX_DELAY_IN_SECS': 5,
+    'BACKOFF': 1.5,
+    'TIMEOUT_IN_SECS': 300
 }
 
 COMPARISON_OPERATORS = {
@@ -44,5 +135,7 @@ F5_CS = {
 
 ENV_VARS = {
     'LOG_LEVEL_ENV_VAR': 'F5_SDK_LOG_LEVEL',
-    'DISABLE_SSL_WARNINGS': 'F5_DISABLE_SSL_WARNINGS'
+    'DISABLE_SSL_WARNINGS': 'F5_DISABLE_SSL_WARNINGS',
+    'CACHE_DIR': 'F5_SDK_CACHE_DIR',
+    'JSON_CODEC': 'F5_SDK_JSON_CODEC'
 }
@@ -23,10 +23,24 @@
             name=subscription_id,
             config_file='./decl.json'
         )
+
+    Example - asyncio (python 3)::
+
+        from f5sdk.cs import AsyncManagementClient
+
+        async with AsyncManagementClient(user='admin', password='admin') as mgmt_client:
+            await mgmt_client.make_request('/v1/svc-account/user')
 """
 
+import sys
+
 from .mgmt_client import ManagementClient
 
 __all__ = [
     'ManagementClient'
 ]
+
+# asyncio client requires python 3
+if sys.version_info[0] >= 3:
+    from .async_mgmt_client import AsyncManagementClient
+    __all__.append('AsyncManagementClient')
@@ -0,0 +1,50 @@
+"""F5 Cloud Services asyncio management client
+
+Note
+----
+
+Requires python 3 (asyncio)
+"""
+
+from f5sdk.base_async_clients import BaseAsyncManagementClient
+from f5sdk.exceptions import HTTPError
+
+from .mgmt_client import ManagementClient
+
+
+class AsyncManagementClient(BaseAsyncManagementClient):
+    """A class used as an asyncio management client for F5 Cloud Services
+
+    Attributes
+    ----------
+    client : object
+        the (synchronous) management client, available after login()
+
+    Methods
+    -------
+    login()
+        Refer to method documentation
+    make_request()
+        Refer to method documentation
+    close()
+        Refer to method documentation
+    """
+
+    client_class = ManagementClient
+    login_retry_exceptions = (HTTPError,)
+
+    def __init__(self, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments, see ManagementClient and
+            BaseAsyncManagementClient
+
+        Returns
+        -------
+        None
+        """
+
+        super(AsyncManagementClient, self).__init__(logger_name=__name__, **kwargs)
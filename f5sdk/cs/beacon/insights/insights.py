@@ -13,6 +13,8 @@ class InsightsClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -46,7 +48,8 @@ class InsightsClient(BaseFeatureClient):
         super(InsightsClient, self).__init__(
             client,
             logger_name=__name__,
-            uri='/beacon/v1/insights'
+            uri='/beacon/v1/insights',
+            paging='cs'
         )
 
     def list(self, **kwargs):
@@ -61,6 +64,9 @@ class InsightsClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -70,6 +76,34 @@ class InsightsClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create/Update operation
 
@@ -108,6 +142,9 @@ class InsightsClient(BaseFeatureClient):
         -----------------
         name : str
             name (id) of the object to operate against
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
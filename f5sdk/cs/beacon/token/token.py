@@ -13,6 +13,8 @@ class TokenClient(BaseFeatureClient):
     -------
     list()
         Refer to method documentation
+    iter_list()
+        Refer to method documentation
     create()
         Refer to method documentation
     show()
@@ -44,7 +46,8 @@ class TokenClient(BaseFeatureClient):
         super(TokenClient, self).__init__(
             client,
             logger_name=__name__,
-            uri='/beacon/v1/telemetry-token'
+            uri='/beacon/v1/telemetry-token',
+            paging='cs'
         )
 
     def list(self, **kwargs):
@@ -59,6 +62,9 @@ class TokenClient(BaseFeatureClient):
         -----------------
         query_parameters : dict
             Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
 
         Returns
         -------
@@ -68,6 +74,34 @@ class TokenClient(BaseFeatureClient):
 
         return self._list(**kwargs)
 
+    def iter_list(self, **kwargs):
+        """List operation, yielding items - pages are requested as they are consumed
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        query_parameters : dict
+            Query parameters for the request
+        query : object
+            the query (projection, filtering), see query_utils.Query - with a
+            projection (select) the items are returned as lightweight records
+        page_size : int
+            the number of items to request per page
+        prefetch : bool
+            request the next page while the current page is consumed
+
+        Returns
+        -------
+        generator
+            yields each item of the collection
+        """
+
+        return self._iter_list(**kwargs)
+
     def create(self, **kwargs):
         """Create operation
 
@@ -103,6 +137,9 @@ class TokenClient(BaseFeatureClient):
         -----------------
         name : str
             name (id) of the object to operate against
+        query : object
+            the query (projection), see query_utils.Query - with a
+            projection (select) a lightweight record is returned
 
         Returns
         -------
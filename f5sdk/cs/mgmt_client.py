@@ -1,10 +1,8 @@
 """Management client"""
 
-from retry import retry
-
 import f5sdk.constants as constants
 from f5sdk.logger import Logger
-from f5sdk.utils import http_utils
+from f5sdk.utils import http_utils, retry_utils
 from f5sdk.exceptions import InputRequiredError, InvalidAuthError, HTTPError
 
 API_ENDPOINT = constants.F5_CS['API_ENDPOINT']
@@ -27,6 +25,8 @@ class ManagementClient(object):
     -------
     make_request()
         Refer to method documentation
+    close()
+        Refer to method documentation
     """
 
     def __init__(self, **kwargs):
@@ -43,6 +43,13 @@ class ManagementClient(object):
             the username for service authentication
         password : str
             the password for service authentication
+        pool_size : int
+            the maximum number of keep-alive connections to pool for the service
+        transport : object
+            the HTTP transport to use instead of the (shared) keep-alive
+            session, see transport_utils - the caller owns (closes) it
+        skip_login : bool
+            skips authentication, the caller is responsible for logging in
 
         Returns
         -------
@@ -63,18 +70,30 @@ class ManagementClient(object):
         self.access_token = None
         self.token_details = None
 
-        if self._user and self._password:
-            self._login_using_credentials()
-        else:
-            raise InputRequiredError('user|password required')
+        self._transport = kwargs.pop('transport', None)
+        self._session = None
+        if self._transport is None:
+            # keep-alive connection pool, shared with other clients for this endpoint
+            self._session = http_utils.get_session(
+                self._api_endpoint, pool_size=kwargs.pop('pool_size', None))
 
-    @retry(exceptions=HTTPError,
-           tries=constants.RETRIES['DEFAULT'],
-           delay=constants.RETRIES['DELAY_IN_SECS'])
+        try:
+            if kwargs.pop('skip_login', False):
+                pass
+            elif self._user and self._password:
+                self._login_using_credentials()
+            else:
+                raise InputRequiredError('user|password required')
+        except Exception:
+            # do not leak the pooled session reference
+            self.close()
+            raise
+
+    @retry_utils.retry('cs.get_token', exceptions=HTTPError)
     def _get_token(self):
         """Gets access token
 
-        Retries if unsuccessful, up to maximum allotment
+        Retries if unsuccessful, until the retry policy deadline (see retry_utils)
 
         Parameters
         ----------
@@ -87,6 +106,20 @@ class ManagementClient(object):
             {'accessToken': 'token', 'expirationIn': 3600}
         """
 
+        return self._request_token()
+
+    def _request_token(self):
+        """Requests access token (single attempt)
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            see _get_token()
+        """
 
         try:
             response = http_utils.make_request(
@@ -96,11 +129,13 @@ class ManagementClient(object):
                 body={
                     'username': self._user,
                     'password': self._password
-                }
+                },
+                session=self._session,
+                transport=self._transport
             )
         except HTTPError as error:
-            if constants.HTTP_STATUS_CODE['BAD_REQUEST_BODY'] in str(error) or \
-                constants.HTTP_STATUS_CODE['FAILED_AUTHENTICATION'] in str(error):
+            if error.status_code in [constants.HTTP_STATUS_CODE['BAD_REQUEST'],
+                                     constants.HTTP_STATUS_CODE['UNAUTHORIZED']]:
                 _exception = InvalidAuthError(error)
                 _exception.__cause__ = None
                 raise _exception
@@ -123,7 +158,22 @@ class ManagementClient(object):
         """
 
         self.logger.info('Logging in using user + password')
-        self.token_details = self._get_token()
+        self._set_token(self._get_token())
+
+    def _set_token(self, token):
+        """Sets token attributes
+
+        Parameters
+        ----------
+        token : dict
+            the token details, see _get_token()
+
+        Returns
+        -------
+        None
+        """
+
+        self.token_details = token
         self.access_token = self.token_details['accessToken']
 
     def make_request(self, uri, **kwargs):
@@ -165,5 +215,29 @@ class ManagementClient(object):
             self._api_endpoint,
             uri,
             headers=dfl_headers,
+            session=self._session,
+            transport=self._transport,
             **kwargs
         )
+
+    def close(self):
+        """Closes the management client, releasing pooled connections
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        if self._session is not None:
+            http_utils.release_session(self._api_endpoint)
+            self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -9,13 +9,22 @@ during documentation engine retrieval
 
 from functools import wraps
 
-from f5sdk.exceptions import AuthRequiredError
+from f5sdk.exceptions import AuthRequiredError, HTTPError, InvalidAuthError
 from f5sdk import constants
 
+UNAUTHORIZED = constants.HTTP_STATUS_CODE['UNAUTHORIZED']
+
 
 def check_auth(function):
     """Checks authentication
 
+    Notes
+    -----
+    Clients which can refresh their token (_refresh_token) are given the
+    chance to do so, before it expires.  Clients which can replace a
+    rejected token (_token_rejected) retry the request once, if it fails
+    with HTTP 401
+
     Parameters
     ----------
     function : function
@@ -31,6 +40,18 @@ def check_auth(function):
     def _wrapper(self, *args, **kwargs):
         if self.token is None:
             raise AuthRequiredError('Device authentication required')
+        refresh_token = getattr(self, '_refresh_token', None)
+        if refresh_token is not None:
+            refresh_token()
+        token = self.token
+        try:
+            return function(self, *args, **kwargs)
+        except (HTTPError, InvalidAuthError) as error:
+            token_rejected = getattr(self, '_token_rejected', None)
+            if token_rejected is None \
+                    or getattr(error, 'status_code', UNAUTHORIZED) != UNAUTHORIZED \
+                    or not token_rejected(token):
+                raise
         return function(self, *args, **kwargs)
     return _wrapper
 
@@ -1,5 +1,10 @@
 """ Exceptions used throughout this package """
 
+import time
+from email.utils import parsedate_tz, mktime_tz
+
+from f5sdk import constants
+
 
 class AuthRequiredError(Exception):
     """ Error raised when authentication is required """
@@ -18,7 +23,54 @@ class InvalidComponentVersionError(Exception):
 
 
 class HTTPError(Exception):
-    """ Error raised http error occurs """
+    """ Error raised http error occurs
+
+    Attributes
+    ----------
+    status_code : int
+        the HTTP status code, None if there was no (complete) response
+    reason : str
+        the HTTP status reason
+    headers : dict
+        the HTTP response headers
+    url : str
+        the URL
+    body : dict
+        the (decoded) HTTP response body
+    """
+
+    def __init__(self, message='', **kwargs):
+        super(HTTPError, self).__init__(message)
+        self.status_code = kwargs.pop('status_code', None)
+        self.reason = kwargs.pop('reason', None)
+        self.headers = kwargs.pop('headers', None) or {}
+        self.url = kwargs.pop('url', None)
+        self.body = kwargs.pop('body', None)
+
+    @property
+    def retryable(self):
+        """ Whether retrying could succeed: transient (or unknown) errors, not
+        client errors such as 400 or 401 - see HTTP_ERRORS['RETRYABLE_STATUS_CODES'] """
+        return self.status_code is None or \
+            self.status_code in constants.HTTP_ERRORS['RETRYABLE_STATUS_CODES']
+
+    @property
+    def retry_after(self):
+        """ The number of seconds to wait before retrying (Retry-After header on
+        429 and 503 responses), None if not set """
+
+        if self.status_code not in constants.HTTP_ERRORS['RETRY_AFTER_STATUS_CODES']:
+            return None
+        value = self.headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            parsed = parsedate_tz(value)  # HTTP-date
+            if parsed is None:
+                return None
+            return max(0.0, mktime_tz(parsed) - time.time())
 
 
 class FileLoadError(Exception):
@@ -29,6 +81,10 @@ class SSHCommandStdError(Exception):
     """ Error raised if ssh client command response contains stderr """
 
 
+class BashCommandStdError(SSHCommandStdError):
+    """ Error raised if bash command (REST) returns stderr """
+
+
 class DeviceReadyError(Exception):
     """ Error raised if device ready check fails """
 
@@ -39,3 +95,11 @@ class RetryInterruptedError(Exception):
 
 class InvalidAuthError(Exception):
     """ Error raised if authentication fails """
+
+
+class TaskTimeoutError(Exception):
+    """ Error raised if an async task does not complete in time """
+
+
+class ChecksumMismatchError(Exception):
+    """ Error raised if a file checksum does not match the expected checksum """
@@ -0,0 +1,481 @@
+"""Python module containing the (on-disk) artifact cache
+
+    Example - Basic::
+
+        from f5sdk.utils import cache_utils
+
+        # downloads once, subsequent calls (any process) reuse the cached file
+        package_file = cache_utils.get_artifact_cache().fetch(
+            'https://github.com/F5Networks/f5-appsvcs-extension/releases/download/v3.18.0/'
+            'f5-appsvcs-3.18.0-4.noarch.rpm'
+        )
+
+    Example - Token cache (used by management clients with token_cache=True)::
+
+        token_details = cache_utils.get_token_cache().get('192.0.2.10', 443, 'admin')
+
+    Example - Cache directory set using environment variable::
+
+        # export F5_SDK_CACHE_DIR='/var/cache/f5sdk'
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+
+from f5sdk.logger import Logger
+from f5sdk import constants
+from f5sdk.exceptions import ChecksumMismatchError, FileLoadError
+
+from . import file_utils
+from . import http_utils
+from . import json_utils
+from . import misc_utils
+
+LOGGER = Logger(__name__).get_logger()
+
+_ARTIFACT_CACHE = None
+_ARTIFACT_CACHE_LOCK = threading.Lock()
+_TOKEN_CACHE = None
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def get_cache_dir(name):
+    """Get (and create) a cache directory
+
+    Parameters
+    ----------
+    name : str
+        the cache name, such as 'artifacts'
+
+    Returns
+    -------
+    str
+        the cache directory, under F5_SDK_CACHE_DIR (if set) or constants.CACHE_DIR
+    """
+
+    cache_dir = os.path.join(
+        os.environ.get(constants.ENV_VARS['CACHE_DIR']) or constants.CACHE_DIR,
+        name
+    )
+    if not os.path.isdir(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError:
+            # created concurrently
+            if not os.path.isdir(cache_dir):
+                raise
+    return cache_dir
+
+
+class ArtifactCache(object):
+    """A class used as a content-addressed, size-bounded (LRU) artifact cache
+
+    Notes
+    -----
+    Artifacts are stored by SHA-256 (objects/<sha256>/<file name>) and
+    referenced by URL (urls/<sha256 of url>.json).  All writes are atomic
+    renames, so the cache may be shared by multiple processes.  The artifact
+    checksum is verified on every cache hit.
+
+    Methods
+    -------
+    get()
+        Refer to method documentation
+    put()
+        Refer to method documentation
+    fetch()
+        Refer to method documentation
+    """
+
+    def __init__(self, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        cache_dir : str
+            the cache directory, defaults to get_cache_dir('artifacts')
+        max_size : int
+            the maximum cache size (in bytes), least recently used
+            artifacts are evicted once exceeded
+
+        Returns
+        -------
+        None
+        """
+
+        self.cache_dir = kwargs.pop('cache_dir', None) or get_cache_dir('artifacts')
+        self.max_size = kwargs.pop('max_size', constants.ARTIFACT_CACHE['MAX_SIZE_IN_BYTES'])
+
+        self._objects_dir = os.path.join(self.cache_dir, 'objects')
+        self._urls_dir = os.path.join(self.cache_dir, 'urls')
+        for directory in [self._objects_dir, self._urls_dir]:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def _get_url_file(self, url):
+        url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self._urls_dir, '%s.json' % url_hash)
+
+    def _get_lock(self, url):
+        """Get (per URL) lock, so concurrent fetches download once"""
+
+        with self._locks_lock:
+            return self._locks.setdefault(url, threading.Lock())
+
+    def _remove_object(self, sha256):
+        shutil.rmtree(os.path.join(self._objects_dir, sha256), ignore_errors=True)
+
+    def get(self, url, sha256=None):
+        """Get cached artifact
+
+        Parameters
+        ----------
+        url : str
+            the artifact URL
+        sha256 : str
+            the expected SHA-256 checksum (if known)
+
+        Returns
+        -------
+        str
+            the cached file, or None if not cached (or failed integrity check)
+        """
+
+        try:
+            with open(self._get_url_file(url), 'rb') as _f:
+                entry = json_utils.decode(_f.read())
+        except (IOError, OSError, ValueError):
+            return None
+
+        if sha256 and sha256.lower() != entry['sha256']:
+            return None
+
+        file_name = os.path.join(self._objects_dir, entry['sha256'], entry['file_name'])
+        try:
+            if file_utils.get_file_hash(file_name) != entry['sha256']:
+                LOGGER.warning('Cached artifact failed integrity check, removing: %s' % url)
+                self._remove_object(entry['sha256'])
+                return None
+            # mark as recently used
+            os.utime(file_name, None)
+        except (IOError, OSError):
+            # evicted
+            return None
+        return file_name
+
+    def put(self, url, file_name, sha256=None):
+        """Add artifact to the cache - the file is moved into the cache
+
+        Parameters
+        ----------
+        url : str
+            the artifact URL
+        file_name : str
+            the local file
+        sha256 : str
+            the expected SHA-256 checksum (if known)
+
+        Returns
+        -------
+        str
+            the cached file
+
+        Raises
+        ------
+        ChecksumMismatchError
+            if the file does not match the expected checksum
+        """
+
+        file_hash = file_utils.get_file_hash(file_name)
+        if sha256 and sha256.lower() != file_hash:
+            os.remove(file_name)
+            raise ChecksumMismatchError('Checksum mismatch for %s: expected %s got %s' % (
+                url, sha256, file_hash))
+
+        object_dir = os.path.join(self._objects_dir, file_hash)
+        if not os.path.isdir(object_dir):
+            try:
+                os.makedirs(object_dir)
+            except OSError:
+                # created concurrently
+                if not os.path.isdir(object_dir):
+                    raise
+        cached_file = os.path.join(object_dir, url.split('/')[-1] or file_hash)
+        file_utils.rename_file(file_name, cached_file)
+
+        file_utils.write_file_atomic(self._get_url_file(url), json_utils.encode({
+            'url': url,
+            'sha256': file_hash,
+            'file_name': os.path.basename(cached_file)
+        }))
+
+        self._evict(keep=file_hash)
+        return cached_file
+
+    def _evict(self, keep=None):
+        """Evict least recently used artifacts, until within max size
+
+        Parameters
+        ----------
+        keep : str
+            an artifact (SHA-256) which should not be evicted
+
+        Returns
+        -------
+        None
+        """
+
+        objects = []
+        for sha256 in os.listdir(self._objects_dir):
+            object_dir = os.path.join(self._objects_dir, sha256)
+            try:
+                stats = [os.stat(os.path.join(object_dir, i)) for i in os.listdir(object_dir)]
+            except (IOError, OSError):
+                continue
+            objects.append((
+                max([i.st_mtime for i in stats] or [0]),
+                sum([i.st_size for i in stats]),
+                sha256
+            ))
+
+        total_size = sum([i[1] for i in objects])
+        for _, size, sha256 in sorted(objects):
+            if total_size <= self.max_size:
+                break
+            if sha256 == keep:
+                continue
+            LOGGER.debug('Evicting cached artifact: %s' % sha256)
+            self._remove_object(sha256)
+            total_size -= size
+
+    def _download(self, url, sha256=None):
+        """Download artifact, adding it to the cache - see fetch()"""
+
+        file_descriptor, tmp_file = tempfile.mkstemp(dir=self._objects_dir, suffix='.tmp')
+        os.close(file_descriptor)
+        try:
+            http_utils.download_to_file(url, tmp_file)
+            return self.put(url, tmp_file, sha256=sha256)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    def fetch(self, url, sha256=None):
+        """Get cached artifact, downloading (once) if not cached
+
+        Notes
+        -----
+        Another process sharing the cache may evict the artifact before it
+        is returned, in which case it is fetched again
+
+        Parameters
+        ----------
+        url : str
+            the artifact URL
+        sha256 : str
+            the expected SHA-256 checksum (if known)
+
+        Returns
+        -------
+        str
+            the cached file
+
+        Raises
+        ------
+        FileLoadError
+            if the artifact is evicted on every attempt
+        """
+
+        with self._get_lock(url):
+            for _ in range(constants.ARTIFACT_CACHE['FETCH_ATTEMPTS']):
+                cached_file = self.get(url, sha256=sha256)
+                if cached_file:
+                    LOGGER.debug('Using cached artifact: %s' % url)
+                else:
+                    cached_file = self._download(url, sha256=sha256)
+                if os.path.isfile(cached_file):
+                    return cached_file
+                LOGGER.debug('Cached artifact evicted by another process, fetching again: %s' % url)
+        raise FileLoadError('Unable to fetch artifact, evicted from the cache: %s' % url)
+
+
+def get_artifact_cache():
+    """Get the process-wide (shared) artifact cache
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    object
+        the artifact cache (see ArtifactCache)
+    """
+
+    global _ARTIFACT_CACHE  # pylint: disable=global-statement
+
+    with _ARTIFACT_CACHE_LOCK:
+        if _ARTIFACT_CACHE is None:
+            _ARTIFACT_CACHE = ArtifactCache()
+        return _ARTIFACT_CACHE
+
+
+class TokenCache(object):
+    """A class used as an on-disk authentication token cache
+
+    Notes
+    -----
+    Tokens are keyed by host, port and user, so short-lived processes can
+    reuse a valid token instead of logging in.  Token files are written
+    atomically and are only readable by the current user.
+
+    Methods
+    -------
+    get()
+        Refer to method documentation
+    put()
+        Refer to method documentation
+    remove()
+        Refer to method documentation
+    """
+
+    def __init__(self, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        cache_dir : str
+            the cache directory, defaults to get_cache_dir('tokens')
+
+        Returns
+        -------
+        None
+        """
+
+        self.cache_dir = kwargs.pop('cache_dir', None) or get_cache_dir('tokens')
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        os.chmod(self.cache_dir, 0o700)
+
+    def _get_token_file(self, host, port, user):
+        key = '%s:%s:%s' % (host, port, user)
+        return os.path.join(
+            self.cache_dir,
+            '%s.json' % hashlib.sha256(key.encode('utf-8')).hexdigest()
+        )
+
+    def get(self, host, port, user):
+        """Get cached token details, if the token is not expiring
+
+        Parameters
+        ----------
+        host : str
+            the device host
+        port : int
+            the device port
+        user : str
+            the device user
+
+        Returns
+        -------
+        dict
+            the token details, or None:
+            {'token': 'token', 'expirationDate': '2019-01-01T01:01:01.00'}
+        """
+
+        try:
+            with open(self._get_token_file(host, port, user), 'rb') as _f:
+                token_details = json_utils.decode(_f.read())
+        except (IOError, OSError, ValueError):
+            return None
+
+        if misc_utils.is_token_expiring(
+                token_details, constants.TOKEN['REFRESH_BEFORE_EXPIRY_IN_SECS']):
+            return None
+        return token_details
+
+    def put(self, host, port, user, token_details):
+        """Add token details to the cache
+
+        Parameters
+        ----------
+        host : str
+            the device host
+        port : int
+            the device port
+        user : str
+            the device user
+        token_details : dict
+            the token details - see get()
+
+        Returns
+        -------
+        None
+        """
+
+        try:
+            file_utils.write_file_atomic(
+                self._get_token_file(host, port, user),
+                json_utils.encode(token_details)
+            )
+        except (IOError, OSError) as err:
+            LOGGER.debug('Unable to write token cache: %s' % err)
+
+    def remove(self, host, port, user):
+        """Remove token details from the cache
+
+        Parameters
+        ----------
+        host : str
+            the device host
+        port : int
+            the device port
+        user : str
+            the device user
+
+        Returns
+        -------
+        None
+        """
+
+        try:
+            os.remove(self._get_token_file(host, port, user))
+        except OSError:
+            pass
+
+
+def get_token_cache():
+    """Get the process-wide (shared) token cache
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    object
+        the token cache (see TokenCache)
+    """
+
+    global _TOKEN_CACHE  # pylint: disable=global-statement
+
+    with _TOKEN_CACHE_LOCK:
+        if _TOKEN_CACHE is None:
+            _TOKEN_CACHE = TokenCache()
+        return _TOKEN_CACHE
@@ -1,6 +1,10 @@
 """Python module containing helper file utility functions """
 
-import json
+import hashlib
+import os
+import tempfile
+
+from . import json_utils
 
 
 def load_file(file, **kwargs):
@@ -25,10 +29,95 @@ def load_file(file, **kwargs):
     """
     file_type = kwargs.pop('file_type', 'json')
 
-    with open(file) as _f:
+    # json is read as bytes, decoded by the JSON codec
+    with open(file, 'rb' if file_type == 'json' else 'r') as _f:
         data = _f.read()
 
     # do stuff based on explicit file type
     if file_type == 'json':
-        data = json.loads(data)
+        data = json_utils.decode(data)
     return data
+
+
+def get_file_hash(file_name, **kwargs):
+    """Get file hash (digest), reading the file in chunks
+
+    Parameters
+    ----------
+    file_name : str
+        the file to hash
+    **kwargs :
+        optional keyword arguments
+
+    Keyword Arguments
+    -----------------
+    algorithm : str
+        the hash algorithm: sha256 (default)
+    chunk_size : int
+        the size (in bytes) of each read
+
+    Returns
+    -------
+    str
+        the hex digest
+    """
+
+    file_hash = hashlib.new(kwargs.pop('algorithm', 'sha256'))
+    chunk_size = kwargs.pop('chunk_size', 1024 * 1024)
+
+    with open(file_name, 'rb') as _f:
+        for chunk in iter(lambda: _f.read(chunk_size), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def write_file_atomic(file_name, data):
+    """Write file atomically (temporary file + rename)
+
+    Notes
+    -----
+    Readers, including other processes, see either the previous or the new
+    file contents - never a partial write
+
+    Parameters
+    ----------
+    file_name : str
+        the file to write
+    data : bytes
+        the file contents
+
+    Returns
+    -------
+    None
+    """
+
+    file_descriptor, tmp_file = tempfile.mkstemp(dir=os.path.dirname(file_name))
+    try:
+        with os.fdopen(file_descriptor, 'wb') as _f:
+            _f.write(data)
+        rename_file(tmp_file, file_name)
+    except Exception:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def rename_file(src, dst):
+    """Rename file, replacing any existing destination file
+
+    Parameters
+    ----------
+    src : str
+        the source file
+    dst : str
+        the destination file
+
+    Returns
+    -------
+    None
+    """
+
+    try:
+        os.replace(src, dst)
+    except AttributeError:  # python 2.x support: rename replaces (posix)
+        os.rename(src, dst)
@@ -1,52 +1,788 @@
 """Python module containing helper http utility functions """
 
-import json
 import os
+import threading
 import warnings
 import requests
 import urllib3
 
+try:
+    import queue
+except ImportError:  # python 2.x support
+    import Queue as queue
+
 from f5sdk import constants
 from f5sdk.logger import Logger
 
-from f5sdk.exceptions import HTTPError
+from f5sdk.exceptions import HTTPError, ChecksumMismatchError
+
+from . import file_utils
+from . import json_utils
+from . import retry_utils
 
 logger = Logger(__name__).get_logger()  # pylint: disable=invalid-name
 
+# shared (keep-alive) sessions, keyed by 'host:port'
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# request body compression support, keyed by endpoint (host, port, path)
+_COMPRESSION_SUPPORT = {}
+_COMPRESSION_SUPPORT_LOCK = threading.Lock()
+
+
+def _mount_adapter(session, pool_size):
+    """Mount HTTP adapter with a connection pool of the requested size"""
+
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+def _create_session(pool_size):
+    """Create HTTP session with a connection pool of the requested size"""
+
+    session = requests.Session()
+    _mount_adapter(session, pool_size)
+    return session
 
-def download_to_file(url, file_name):
-    """Downloads an artifact to a local file
+
+def _get_session_entry(host, port, pool_size):
+    """Get (or create) shared session entry - caller must hold the lock"""
+
+    key = '%s:%s' % (host, port)
+    entry = _SESSIONS.get(key)
+    if entry is None:
+        entry = {'session': _create_session(pool_size), 'pool_size': pool_size, 'references': 0}
+        _SESSIONS[key] = entry
+    elif pool_size > entry['pool_size']:
+        # grow the pool in place, so existing holders of the session keep sharing it
+        old_adapter = entry['session'].get_adapter('https://')
+        _mount_adapter(entry['session'], pool_size)
+        old_adapter.close()
+        entry['pool_size'] = pool_size
+    return entry
+
+
+def get_session(host, port=443, **kwargs):
+    """Gets a shared (keep-alive) HTTP session for a host
 
     Notes
     -----
-    Uses a stream to avoid loading into memory
+    Sessions are shared per host:port and reference counted, each call
+    should be paired with a call to release_session()
 
     Parameters
     ----------
+    host : str
+        the host the session will be used for
+    port : int
+        the port the session will be used for
+    **kwargs :
+        optional keyword arguments
+
+    Keyword Arguments
+    -----------------
+    pool_size : int
+        the maximum number of connections to keep in the pool, if a
+        session already exists with a smaller pool it will be grown
+
+    Returns
+    -------
+    object
+        the session instance
+    """
+
+    pool_size = kwargs.pop('pool_size', None) or constants.HTTP_POOL['SIZE']
+
+    with _SESSIONS_LOCK:
+        entry = _get_session_entry(host, port, pool_size)
+        entry['references'] += 1
+        return entry['session']
+
+
+def release_session(host, port=443):
+    """Releases a shared HTTP session, closing it once it is no longer referenced
+
+    Parameters
+    ----------
+    host : str
+        the host the session was retrieved for
+    port : int
+        the port the session was retrieved for
+
+    Returns
+    -------
+    None
+    """
+
+    key = '%s:%s' % (host, port)
+
+    with _SESSIONS_LOCK:
+        entry = _SESSIONS.get(key)
+        if entry is None:
+            return
+        entry['references'] -= 1
+        if entry['references'] <= 0:
+            entry['session'].close()
+            del _SESSIONS[key]
+
+
+def _check_download_response(url, response):
+    """Raise HTTPError if a download response failed"""
+
+    if str(response.status_code)[:1] in ['4', '5']:
+        raise HTTPError(
+            'Bad request for URL: %s code: %s reason: %s' % (
+                url, response.status_code, response.reason),
+            status_code=response.status_code,
+            reason=response.reason,
+            headers=response.headers,
+            url=url
+        )
+
+
+def _get_download_info(session, url):
+    """Get download size, validator and whether byte ranges are supported
+
+    Parameters
+    ----------
+    session : object
+        the HTTP session
     url : str
-        the URL where the artifact should be downloaded from
+        the URL of the artifact
+
+    Returns
+    -------
+    dict
+        the download info: {'url': '', 'size': 0, 'validator': '', 'ranges': True}
+    """
+
+    response = session.request('HEAD', url, allow_redirects=True)
+    headers = response.headers
+    size = headers.get('content-length')
+    return {
+        # downloads are typically redirected (GitHub to S3), request the final URL
+        'url': getattr(response, 'url', None) or url,
+        'size': int(size) if size and str(response.status_code)[:1] == '2' else None,
+        'validator': headers.get('etag') or headers.get('last-modified'),
+        'ranges': headers.get('accept-ranges') == 'bytes'
+    }
+
+
+class _DownloadState(object):
+    """A class used as the (persisted) resume state of a ranged download
+
+    Attributes
+    ----------
+    completed : list
+        the completed part offsets
+    """
+
+    def __init__(self, state_file, url, info, part_size):
+        self._state_file = state_file
+        self._key = {
+            'url': url,
+            'size': info['size'],
+            'validator': info['validator'],
+            'part_size': part_size
+        }
+        self._lock = threading.Lock()
+        self.completed = []
+
+    def load(self):
+        """Load resume state of a previous (partial) download, if it matches
+
+        Returns
+        -------
+        list
+            the completed part offsets
+        """
+
+        try:
+            with open(self._state_file, 'rb') as file_object:
+                state = json_utils.decode(file_object.read())
+        except (IOError, OSError, ValueError):
+            state = {}
+
+        if all(state.get(key) == value for key, value in self._key.items()):
+            self.completed = state.get('completed', [])
+        return self.completed
+
+    def add(self, offset):
+        """Mark part as completed, saving the resume state"""
+
+        with self._lock:
+            self.completed.append(offset)
+            state = dict(self._key)
+            state['completed'] = sorted(self.completed)
+            file_utils.write_file_atomic(self._state_file, json_utils.encode(state))
+
+
+def _download_part(session, url, file_name, part, buffer_size):
+    """Download a byte range into a (preallocated) file at its offset
+
+    Parameters
+    ----------
+    session : object
+        the HTTP session
+    url : str
+        the URL of the artifact
     file_name : str
-        the local file name where the artifact should be downloaded
+        the local (preallocated) file
+    part : dict
+        the part state: {'offset': 0, 'position': 0, 'end': 0}, position is
+        advanced as bytes are written, so a retry resumes within the part
+    buffer_size : int
+        the size (in bytes) of each read and write
 
     Returns
     -------
     None
     """
 
-    response = requests.request(
+    response = session.request(
         'GET',
         url,
+        headers={'Range': 'bytes=%s-%s' % (part['position'], part['end'])},
         stream=True
     )
-    with open(file_name, 'wb+') as file_object:
-        for chunk in response.iter_content(chunk_size=1024):
-            # filter out keep-alive new lines
-            if chunk:
+    try:
+        _check_download_response(url, response)
+        if response.status_code != 206:
+            raise HTTPError('Range request not supported for URL: %s' % url)
+        with open(file_name, 'r+b') as file_object:
+            file_object.seek(part['position'])
+            for chunk in response.iter_content(chunk_size=buffer_size):
                 file_object.write(chunk)
+                part['position'] += len(chunk)
+    finally:
+        response.close()
+
+    if part['position'] != part['end'] + 1:
+        raise HTTPError('Incomplete range response for URL: %s (%s-%s)' % (
+            url, part['position'], part['end']))
+
+
+def _download_part_retried(session, url, file_name, part, buffer_size):
+    """Download a byte range, retrying with backoff (resuming within the part)
+
+    See _download_part() and retry_utils.RetryPolicy
+
+    Returns
+    -------
+    None
+    """
+
+    retry_utils.RetryPolicy(
+        'http.download_part',
+        tries=constants.DOWNLOAD['RETRIES'] + 1,
+        timeout=constants.RETRY_POLICY['LONG_TIMEOUT_IN_SECS']
+    ).call(_download_part, session, url, file_name, part, buffer_size)
+
+
+def _get_download_parts(info, part_size, completed):
+    """Get the (not completed) parts of a ranged download
+
+    Returns
+    -------
+    object
+        the parts queue: {'offset': 0, 'position': 0, 'end': 0}
+    """
+
+    parts = queue.Queue()
+    for offset in range(0, info['size'], part_size):
+        if offset not in completed:
+            parts.put({
+                'offset': offset,
+                'position': offset,
+                'end': min(offset + part_size, info['size']) - 1
+            })
+    return parts
+
+
+def _run_download_workers(connections, parts, download):
+    """Download parts using concurrent workers, until done or a part fails
+
+    Parameters
+    ----------
+    connections : int
+        the number of workers
+    parts : object
+        the parts queue
+    download : function
+        downloads a part
+
+    Returns
+    -------
+    list
+        the errors
+    """
+
+    errors = []
+
+    def _worker():
+        while not errors:
+            try:
+                part = parts.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                download(part)
+            except Exception as err:  # pylint: disable=broad-except
+                errors.append(err)
+
+    workers = [threading.Thread(target=_worker) for _ in range(connections)]
+    for worker in workers:
+        worker.daemon = True
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return errors
+
+
+def _download_ranges(session, info, file_name, state_file, **kwargs):
+    """Download parts concurrently, each worker writing at the part offset
+
+    Returns
+    -------
+    None
+    """
+
+    part_size = kwargs.pop('part_size')
+    buffer_size = kwargs.pop('buffer_size')
+    url = info['url']
+
+    # note: resume state is keyed by the requested URL, redirect targets may be signed
+    state = _DownloadState(state_file, kwargs.pop('state_url'), info, part_size)
+    if not state.load() or not os.path.exists(file_name):
+        state.completed = []
+        with open(file_name, 'wb') as file_object:
+            # preallocate, so parts can be written at their offsets in any order
+            file_object.truncate(info['size'])
+    else:
+        logger.debug('Resuming download: %s (%s parts complete)' % (url, len(state.completed)))
+
+    def _download(part):
+        _download_part_retried(session, url, file_name, part, buffer_size)
+        state.add(part['offset'])
+
+    errors = _run_download_workers(
+        kwargs.pop('connections'), _get_download_parts(info, part_size, state.completed), _download)
+    if errors:
+        # keep the partial file and state, so the next attempt resumes
+        raise errors[0]
+
+
+def _download_stream(session, url, file_name, buffer_size):
+    """Download using a single (streamed) request
+
+    Returns
+    -------
+    None
+    """
+
+    response = session.request('GET', url, stream=True)
+    try:
+        _check_download_response(url, response)
+        with open(file_name, 'wb') as file_object:
+            for chunk in response.iter_content(chunk_size=buffer_size):
+                # filter out keep-alive new lines
+                if chunk:
+                    file_object.write(chunk)
+    finally:
+        response.close()
+
+
+def download_to_file(url, file_name, **kwargs):
+    """Downloads an artifact to a local file
+
+    Notes
+    -----
+    If the server supports byte ranges the artifact is downloaded in parts
+    using concurrent range requests, each written at its offset in a
+    preallocated file.  Progress is recorded next to the file, a failed
+    download resumes from the completed parts when called again.
+
+    Otherwise uses a stream (single request) to avoid loading into memory
+
+    Parameters
+    ----------
+    url : str
+        the URL where the artifact should be downloaded from
+    file_name : str
+        the local file name where the artifact should be downloaded
+    **kwargs :
+        optional keyword arguments
+
+    Keyword Arguments
+    -----------------
+    connections : int
+        the maximum number of concurrent range requests
+    part_size : int
+        the size (in bytes) of each range request
+    buffer_size : int
+        the size (in bytes) of each read and write
+    sha256 : str
+        the expected SHA-256 checksum, verified once downloaded
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ChecksumMismatchError
+        if the downloaded file does not match the expected checksum
+    """
+
+    connections = kwargs.pop('connections', constants.DOWNLOAD['CONNECTIONS'])
+    part_size = kwargs.pop('part_size', constants.DOWNLOAD['PART_SIZE'])
+    buffer_size = kwargs.pop('buffer_size', constants.DOWNLOAD['BUFFER_SIZE'])
+    sha256 = kwargs.pop('sha256', None)
+
+    part_file = '%s.part' % file_name
+    state_file = '%s.part.json' % file_name
+
+    # downloads are typically one-off (CDN, GitHub), use a transient session
+    with _create_session(connections) as session:
+        info = _get_download_info(session, url)
+        if info['size'] and info['ranges']:
+            _download_ranges(
+                session,
+                info,
+                part_file,
+                state_file,
+                state_url=url,
+                connections=connections,
+                part_size=part_size,
+                buffer_size=buffer_size
+            )
+        else:
+            _download_stream(session, url, part_file, buffer_size)
+
+    if os.path.exists(state_file):
+        os.remove(state_file)
+
+    if sha256:
+        file_hash = file_utils.get_file_hash(part_file, chunk_size=buffer_size)
+        if file_hash != sha256.lower():
+            os.remove(part_file)
+            raise ChecksumMismatchError('Checksum mismatch for %s: expected %s got %s' % (
+                url, sha256, file_hash))
 
+    file_utils.rename_file(part_file, file_name)
 
-# pylint: disable=too-many-locals
-def make_request(host, uri, **kwargs):
+
+def _is_ssl_warning_enabled():
+    """Checks if the insecure request warning should be logged"""
+
+    return os.environ.get(constants.ENV_VARS['DISABLE_SSL_WARNINGS'], 'false').lower() == 'false'
+
+
+def _make_session_request(session, method, url, **kwargs):
+    """Makes request using a requests session, logging insecure request warnings
+
+    Parameters
+    ----------
+    session : object
+        the HTTP session to use, None for a transient session
+    method : str
+        the HTTP method
+    url : str
+        the URL
+    **kwargs :
+        keyword arguments for session.request()
+
+    Returns
+    -------
+    object
+        the response
+    """
+
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        # Cause all warnings to always be triggered.
+        warnings.simplefilter("always")
+        transient_session = None
+        if session is None:
+            session = transient_session = _create_session(1)
+        try:
+            response = session.request(method, url, **kwargs)
+        finally:
+            if transient_session is not None:
+                transient_session.close()
+    if caught_warnings and \
+            caught_warnings[0].category == urllib3.exceptions.InsecureRequestWarning and \
+            _is_ssl_warning_enabled():
+        logger.warning('SSL Insecure request, '
+                       'recommend adding a valid certificate to the device')
+    return response
+
+
+def _get_endpoint_key(host, port, uri):
+    """Get endpoint (compression support cache) key, ignoring any query string"""
+
+    return (host, int(port), uri.split('?')[0].rstrip('/'))
+
+
+def get_compression_support(host, port, uri):
+    """Get (cached) request body compression support of an endpoint
+
+    Parameters
+    ----------
+    host : str
+        the host
+    port : int
+        the port
+    uri : str
+        the endpoint URI: /mgmt/shared/appsvcs/declare
+
+    Returns
+    -------
+    bool
+        whether the endpoint accepted (True) or rejected (False) a compressed
+        request body, or None if unknown
+    """
+
+    with _COMPRESSION_SUPPORT_LOCK:
+        return _COMPRESSION_SUPPORT.get(_get_endpoint_key(host, port, uri))
+
+
+def set_compression_support(host, port, uri, supported):
+    """Set (or with supported None, remove) request body compression support of an endpoint
+
+    Parameters
+    ----------
+    host : str
+        the host
+    port : int
+        the port
+    uri : str
+        the endpoint URI: /mgmt/shared/appsvcs/declare
+    supported : bool
+        whether the endpoint accepts a compressed request body
+
+    Returns
+    -------
+    None
+    """
+
+    key = _get_endpoint_key(host, port, uri)
+    with _COMPRESSION_SUPPORT_LOCK:
+        if supported is None:
+            _COMPRESSION_SUPPORT.pop(key, None)
+        else:
+            _COMPRESSION_SUPPORT[key] = supported
+
+
+def _get_compressed_body(body, data):
+    """Get (gzip) compressed request body data
+
+    Parameters
+    ----------
+    body : object
+        the body, a json_utils.PreparedBody is compressed once
+    data : bytes
+        the (encoded) body data
+
+    Returns
+    -------
+    bytes
+        the compressed body
+    """
+
+    level = constants.HTTP_COMPRESSION['LEVEL']
+    if isinstance(body, json_utils.PreparedBody):
+        return body.get_compressed(level)
+    return json_utils.gzip_compress(data, level)
+
+
+def _get_body_data(body):
+    """Get (JSON) request body data, encoding unless already encoded
+
+    Parameters
+    ----------
+    body : object
+        the body: an object, or already encoded JSON (bytes, bytearray,
+        memoryview, json_utils.PreparedBody)
+
+    Returns
+    -------
+    bytes
+        the encoded body
+    """
+
+    if isinstance(body, json_utils.PreparedBody):
+        return body.data
+    if isinstance(body, (bytes, bytearray)):
+        return body
+    if isinstance(body, memoryview):
+        return body.tobytes()
+    return json_utils.encode(body)
+
+
+def _decode_response(response):
+    """Decode (JSON) response body, using the JSON codec
+
+    Parameters
+    ----------
+    response : object
+        the response
+
+    Returns
+    -------
+    object
+        the decoded response body
+
+    Raises
+    ------
+    ValueError
+        if the response body is not valid JSON
+    """
+
+    # requests decodes using the standard library, decode the content instead
+    if isinstance(response, requests.Response):
+        try:
+            return json_utils.decode(response.content)
+        except ValueError:
+            pass  # not UTF-8 perhaps, let requests guess the encoding
+    return response.json()
+
+
+def _iter_response_items(response, path):
+    """Yields the items of the array at path, from a streamed response
+
+    Parameters
+    ----------
+    response : object
+        the (streamed) response
+    path : str
+        the array path, see json_utils.iter_array_items()
+
+    Returns
+    -------
+    generator
+        yields each item, the response is closed once complete
+    """
+
+    try:
+        for item in json_utils.iter_array_items(
+                response.iter_content(chunk_size=constants.HTTP_STREAM['CHUNK_SIZE']), path):
+            yield item
+    finally:
+        response.close()
+
+
+def _prepare_body(body, body_content_type, headers, compress_endpoint):
+    """Prepare (encode) request body, and the compressed body to attempt
+
+    Parameters
+    ----------
+    body : object
+        the body, see make_request()
+    body_content_type : str
+        the body content type: json or raw (sent as-is)
+    headers : dict
+        the request headers, updated with the body content type
+    compress_endpoint : tuple
+        the endpoint to compress large JSON bodies for, unless it rejected a
+        compressed body before: (host, port, uri) - None to not compress
+
+    Returns
+    -------
+    tuple
+        the body and the compressed body (None if not compressed):
+        (b'{}', None)
+    """
+
+    if not body or body_content_type != 'json':
+        return body, None
+
+    headers.update({'Content-Type': 'application/json'})
+    data = _get_body_data(body)
+    if compress_endpoint is not None and len(data) >= constants.HTTP_COMPRESSION['MIN_SIZE'] \
+            and get_compression_support(*compress_endpoint) is not False:
+        return data, _get_compressed_body(body, data)
+    return data, None
+
+
+def _make_compressed_request(request, compressed_body, endpoint):
+    """Makes request with a compressed body, retrying uncompressed if rejected
+
+    The endpoint compression support is recorded, see get_compression_support()
+
+    Parameters
+    ----------
+    request : function
+        sends the request, with the (compressed) body data if provided
+    compressed_body : bytes
+        the compressed body
+    endpoint : tuple
+        the endpoint: (host, port, uri)
+
+    Returns
+    -------
+    object
+        the response
+    """
+
+    host, port, uri = endpoint
+    response = request(compressed_body)
+    rejected_status_code = response.status_code
+    if rejected_status_code in constants.HTTP_COMPRESSION['REJECTED_STATUS_CODES']:
+        # compressed body rejected (perhaps), retry uncompressed
+        logger.debug('HTTP request compression rejected: %s %s' % (rejected_status_code, uri))
+        response.close()
+        response = request()
+        if rejected_status_code == 415 or response.status_code < 400:
+            set_compression_support(host, port, uri, False)
+    elif response.status_code < 400:
+        set_compression_support(host, port, uri, True)
+    return response
+
+
+def _get_response_body(response, status_code):
+    """Get response body
+
+    Determine response body using the following logic
+    1) if the content-length header exists and is 0: None
+    2) response is valid JSON: decode JSON to native python object (dict, list)
+    3) otherwise the raw content: {'body': b''}
+    """
+
+    headers = response.headers
+    if (status_code == 204) or \
+            ('content-length' in headers.keys() and headers['content-length'] == '0'):
+        return None
+    try:
+        return _decode_response(response)
+    except ValueError:
+        return {"body": response.content}
+
+
+def _get_streamed_response_body(response, status_code, stream_path):
+    """Get (streamed) response body, an iterator of the items of the array at stream_path"""
+
+    if status_code == 204 or response.headers.get('content-length') == '0':
+        response.close()
+        return iter([])
+    return _iter_response_items(response, stream_path)
+
+
+def _get_return_value(response_body, status_code, headers, **kwargs):
+    """Get make_request() return value, see the advanced_return and return_headers options"""
+
+    # optionally return tuple containing status code, response, (future)
+    if kwargs.pop('advanced_return', False):
+        if kwargs.pop('return_headers', False):
+            return (response_body, status_code, headers)
+        return (response_body, status_code)
+
+    # finally, simply return response data
+    return response_body
+
+
+def make_request(host, uri, **kwargs):  # pylint: disable=too-many-locals
     """Makes request to device (HTTP/S)
 
     Parameters
@@ -67,7 +803,9 @@ def make_request(host, uri, **kwargs):
     headers : str
         the HTTP headers to use (may override defaults)
     body : str
-        the HTTP body to use
+        the HTTP body to use: an object (encoded as JSON) or, sent as-is,
+        already encoded JSON: bytes, bytearray, memoryview or
+        json_utils.PreparedBody
     body_content_type : str
         the HTTP body content type to use
     bool_response : bool
@@ -76,6 +814,23 @@ def make_request(host, uri, **kwargs):
         use basic auth: {'user': 'foo', 'password': 'bar'}
     advanced_return : bool
         return additional information, like HTTP status code to caller
+    return_headers : bool
+        with advanced_return, also return the HTTP response headers:
+        (response_body, status_code, headers)
+    timeout : int
+        the request timeout (in seconds)
+    session : object
+        the HTTP session to use, see get_session() - defaults to a transient
+        session which is closed once the request completes
+    transport : object
+        the HTTP transport to use instead of a session, see transport_utils
+    stream_path : str
+        stream the response, incrementally decoding (and returning a generator
+        of) the items of the array at this path - see json_utils.iter_array_items()
+    compress : bool
+        request a gzip compressed response and compress (gzip) JSON request
+        bodies of at least HTTP_COMPRESSION['MIN_SIZE'] bytes - unless the
+        endpoint rejected a compressed body before, see get_compression_support()
 
     Returns
     -------
@@ -90,20 +845,26 @@ def make_request(host, uri, **kwargs):
     port = kwargs.pop('port', 443)
     method = kwargs.pop('method', 'GET').lower()
     headers.update(kwargs.pop('headers', {}))
-    query_parameters = kwargs.pop('query_parameters', {})
-
-    # check for body, normalize
-    body = kwargs.pop('body', None)
-    body_content_type = kwargs.pop('body_content_type', 'json')  # json (default), raw
-    if body and body_content_type == 'json':
-        headers.update({'Content-Type': 'application/json'})
-        body = json.dumps(body)
+    session = kwargs.pop('session', None)
+    transport = kwargs.pop('transport', None)
+    stream_path = kwargs.pop('stream_path', None)
+    compress = kwargs.pop('compress', False)
+
+    # check for body, normalize (and optionally compress)
+    body, compressed_body = _prepare_body(
+        kwargs.pop('body', None),
+        kwargs.pop('body_content_type', 'json'),  # json (default), raw
+        headers,
+        (host, port, uri) if compress else None
+    )
+    if compress:
+        headers.setdefault('Accept-Encoding', 'gzip')
 
     # check for auth options
     auth = None
     basic_auth = kwargs.pop('basic_auth', None)
     if basic_auth:
-        auth = requests.auth.HTTPBasicAuth(basic_auth['user'], basic_auth['password'])
+        auth = (basic_auth['user'], basic_auth['password'])
 
     # note: certain requests *may* contain large payloads, do *not* log body
     logger.debug('Making HTTP request: %s %s' % (method.upper(), uri))
@@ -111,24 +872,31 @@ def make_request(host, uri, **kwargs):
     url = 'https://%s:%s%s' % (host, port, uri)
 
     # make request
-    with warnings.catch_warnings(record=True) as caught_warnings:
-        # Cause all warnings to always be triggered.
-        warnings.simplefilter("always")
-        response = requests.request(method,
-                                    url,
-                                    headers=headers,
-                                    params=query_parameters,
-                                    data=body,
-                                    auth=auth,
-                                    timeout=constants.HTTP_TIMEOUT['DFL'],
-                                    verify=constants.HTTP_VERIFY)
-        if caught_warnings and \
-                caught_warnings[0].category == urllib3.exceptions.InsecureRequestWarning:
-            if constants.ENV_VARS.get('DISABLE_SSL_WARNINGS') not in os.environ.keys() or (
-                    constants.ENV_VARS.get('DISABLE_SSL_WARNINGS') in os.environ.keys() and
-                    os.environ[constants.ENV_VARS.get('DISABLE_SSL_WARNINGS')].lower() == 'false'):
-                logger.warning('SSL Insecure request, '
-                               'recommend adding a valid certificate to the device')
+    request_kwargs = {
+        'headers': headers,
+        'params': kwargs.pop('query_parameters', {}),
+        'data': body,
+        'auth': auth,
+        'timeout': kwargs.pop('timeout', constants.HTTP_TIMEOUT['DFL']),
+        'verify': constants.HTTP_VERIFY
+    }
+    if stream_path is not None:
+        request_kwargs['stream'] = True
+
+    def _request(data=None):
+        """Send request, optionally with a (compressed) body"""
+        _kwargs = dict(request_kwargs)
+        if data is not None:
+            _kwargs.update(data=data, headers=dict(headers, **{'Content-Encoding': 'gzip'}))
+        if transport is not None:
+            # the transport handles (insecure request) warnings itself
+            return transport.request(method, url, **_kwargs)
+        return _make_session_request(session, method, url, **_kwargs)
+
+    if compressed_body is None:
+        response = _request()
+    else:
+        response = _make_compressed_request(_request, compressed_body, (host, port, uri))
     # return boolean response, if requested
     if kwargs.pop('bool_response', False):
         return response.ok
@@ -136,19 +904,14 @@ def make_request(host, uri, **kwargs):
     status_code = response.status_code
     status_reason = response.reason
 
-    # determine response body using the following logic
-    # 1) if the content-length header exists and is 0: set to empty dict
-    # 2) response is valid JSON: decode JSON to native python object (dict, list)
-    headers = response.headers
-    if (status_code == 204) or \
-            ('content-length' in headers.keys() and headers['content-length'] == '0'):
-        response_body = None
-    else:
-        try:
-            response_body = response.json()
-        except ValueError:
-            response_body = {"body": response.content}
+    # stream (successful) response, error responses are decoded as usual
+    if stream_path is not None and str(status_code)[:1] not in ['4', '5']:
+        logger.debug('HTTP response: %s %s (streamed)' % (status_code, status_reason))
+        return _get_return_value(
+            _get_streamed_response_body(response, status_code, stream_path),
+            status_code, response.headers, **kwargs)
 
+    response_body = _get_response_body(response, status_code)
 
     # helpful debug
     logger.debug('HTTP response: %s %s' % (status_code, status_reason))
@@ -156,16 +919,17 @@ def make_request(host, uri, **kwargs):
 
     # raise exception on 4xx and 5xx status code(s)
     if str(status_code)[:1] in ['4', '5']:
-        raise HTTPError('Bad request for URL: %s code: %s reason: %s body: %s' % (
-            url, status_code, status_reason, response_body
-        ))
-
-    # optionally return tuple containing status code, response, (future)
-    if kwargs.pop('advanced_return', False):
-        return (response_body, status_code)
-
-    # finally, simply return response data
-    return response_body
+        raise HTTPError(
+            'Bad request for URL: %s code: %s reason: %s body: %s' % (
+                url, status_code, status_reason, response_body),
+            status_code=status_code,
+            reason=status_reason,
+            headers=response.headers,
+            url=url,
+            body=response_body
+        )
+
+    return _get_return_value(response_body, status_code, response.headers, **kwargs)
 
 
 def parse_url(url):
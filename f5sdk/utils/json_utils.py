@@ -0,0 +1,495 @@
+"""Python module containing the JSON codec and incremental (streaming) JSON decoding
+
+    The codec used to encode request bodies and decode responses, config
+    files and metadata is the fastest installed: orjson, ujson or the
+    standard library json module.
+
+    Example - Encode, decode::
+
+        from f5sdk.utils import json_utils
+
+        data = json_utils.encode({'class': 'AS3'})  # bytes (UTF-8)
+        declaration = json_utils.decode(data)
+
+    Example - Pre-serialized body, encoded once and sent to many devices::
+
+        body = json_utils.PreparedBody(declaration)
+        for device in devices:
+            device.make_request('/mgmt/shared/appsvcs/declare', method='POST', body=body)
+
+    Example - Codec set using environment variable::
+
+        # export F5_SDK_JSON_CODEC='json'
+
+    Example - Items of a (streamed) iControl REST collection::
+
+        with open('pools.json', 'rb') as _f:
+            for item in json_utils.iter_array_items(iter(lambda: _f.read(65536), b''), 'items'):
+                print(item['name'])
+"""
+
+import codecs
+import json
+import os
+import zlib
+
+from f5sdk import constants
+from f5sdk.exceptions import InputRequiredError
+from f5sdk.logger import Logger
+
+logger = Logger(__name__).get_logger()  # pylint: disable=invalid-name
+
+# supported codecs, in order of preference
+JSON_CODECS = ['orjson', 'ujson', 'json']
+
+# the codec in use: {'name': 'json', 'encode': function, 'decode': function}
+_CODEC = {}
+
+# whitespace, as defined by JSON
+WHITESPACE = ' \t\n\r'
+
+# characters a number may contain
+NUMBER = '-+.0123456789eE'
+
+# compact the buffer once this many characters have been consumed
+COMPACT_SIZE = 65536
+
+
+def _stdlib_encode(obj):
+    """Encode using the standard library"""
+
+    return json.dumps(obj).encode('utf-8')
+
+
+def _load_codec(name):
+    """Load codec, returns (encode, decode) functions or None if not installed"""
+
+    if name == 'orjson':
+        try:
+            import orjson
+        except ImportError:
+            return None
+        return (orjson.dumps, orjson.loads)
+    if name == 'ujson':
+        try:
+            import ujson
+        except ImportError:
+            return None
+        return (
+            lambda obj: ujson.dumps(
+                obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8'),
+            ujson.loads
+        )
+    return (_stdlib_encode, json.loads)
+
+
+def set_codec(name=None):
+    """Set the JSON codec
+
+    Parameters
+    ----------
+    name : str
+        the codec: orjson, ujson or json (standard library).  If not set, the
+        codec in F5_SDK_JSON_CODEC (if set, and installed) or the first
+        installed codec in JSON_CODECS is used
+
+    Returns
+    -------
+    str
+        the codec name
+
+    Raises
+    ------
+    InputRequiredError
+        if the codec is unknown, or not installed
+    """
+
+    if name is not None and name not in JSON_CODECS:
+        raise InputRequiredError('JSON codec must be one of: %s' % JSON_CODECS)
+
+    if name is not None:
+        functions = _load_codec(name)
+        if functions is None:
+            raise InputRequiredError('JSON codec is not installed: %s' % name)
+    else:
+        preferred = os.environ.get(constants.ENV_VARS['JSON_CODEC'])
+        names = ([preferred] if preferred in JSON_CODECS else []) + JSON_CODECS
+        for name in names:  # pylint: disable=redefined-argument-from-local
+            functions = _load_codec(name)
+            if functions is not None:
+                break
+
+    logger.debug('JSON codec: %s' % name)
+    _CODEC.update({'name': name, 'encode': functions[0], 'decode': functions[1]})
+    return name
+
+
+def get_codec():
+    """Get the JSON codec
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    str
+        the codec name: orjson, ujson or json
+    """
+
+    return _CODEC.get('name') or set_codec()
+
+
+def encode(obj):
+    """Encode object as JSON, using the codec
+
+    Notes
+    -----
+    Objects the codec does not support (such as non-string keys, or
+    integers larger than 64 bits for orjson) are encoded using the standard
+    library.  Non-ASCII characters may not be escaped.
+
+    Parameters
+    ----------
+    obj : object
+        the object: dict, list, etc.
+
+    Returns
+    -------
+    bytes
+        the JSON document (UTF-8)
+
+    Raises
+    ------
+    TypeError
+        if the object is not JSON serializable
+    """
+
+    if not _CODEC:
+        set_codec()
+    try:
+        return _CODEC['encode'](obj)
+    except (TypeError, OverflowError):
+        return _stdlib_encode(obj)
+
+
+def decode(data):
+    """Decode JSON, using the codec
+
+    Parameters
+    ----------
+    data : bytes
+        the JSON document: bytes (UTF-8) or str
+
+    Returns
+    -------
+    object
+        the decoded object: dict, list, etc.
+
+    Raises
+    ------
+    ValueError
+        if the document is not valid JSON
+    """
+
+    if not _CODEC:
+        set_codec()
+    return _CODEC['decode'](data)
+
+
+def gzip_compress(data, level):
+    """Compress data (gzip format)
+
+    Parameters
+    ----------
+    data : bytes
+        the data
+    level : int
+        the compression level: 1 (fastest) - 9 (smallest)
+
+    Returns
+    -------
+    bytes
+        the compressed data
+    """
+
+    # wbits 16 + 15: gzip header and trailer
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class PreparedBody(object):
+    """A class used as a pre-serialized (encoded JSON) request body, sent as-is
+
+    Attributes
+    ----------
+    data : bytes
+        the encoded body (UTF-8)
+
+    Notes
+    -----
+    The body is serialized once, and may be sent (unchanged) to any number
+    of devices - see make_request.  A body prepared from a file is read but
+    not parsed, so it is not validated locally.
+
+    Methods
+    -------
+    from_file()
+        Refer to method documentation
+    get_compressed()
+        Refer to method documentation
+    """
+
+    def __init__(self, body):
+        """Class initialization
+
+        Parameters
+        ----------
+        body : object
+            the body: dict, list, etc. (encoded using the codec) or already
+            encoded JSON: bytes, bytearray or memoryview
+
+        Returns
+        -------
+        None
+        """
+
+        if isinstance(body, PreparedBody):
+            body = body.data
+        if isinstance(body, (bytearray, memoryview)):
+            body = bytes(body)
+        self.data = body if isinstance(body, bytes) else encode(body)
+        self._compressed = {}
+
+    @classmethod
+    def from_file(cls, file_name):
+        """Prepare body from a (JSON) file, without parsing it
+
+        Parameters
+        ----------
+        file_name : str
+            the JSON file
+
+        Returns
+        -------
+        object
+            the prepared body
+        """
+
+        with open(file_name, 'rb') as _f:
+            return cls(_f.read())
+
+    def get_compressed(self, level):
+        """Get the (gzip) compressed body, compressed once per level
+
+        Parameters
+        ----------
+        level : int
+            the compression level: 1 (fastest) - 9 (smallest)
+
+        Returns
+        -------
+        bytes
+            the compressed body
+        """
+
+        if level not in self._compressed:
+            self._compressed[level] = gzip_compress(self.data, level)
+        return self._compressed[level]
+
+    def __len__(self):
+        return len(self.data)
+
+
+class _Reader(object):
+    """A class used to read (decoded) characters from chunks of JSON bytes"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+
+    def fill(self):
+        """Read the next chunk into the buffer - returns False at the end of input"""
+
+        if self.eof:
+            return False
+        if self.position >= COMPACT_SIZE:
+            self.buffer = self.buffer[self.position:]
+            self.position = 0
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.buffer += self._decoder.decode(b'', final=True)
+            self.eof = True
+            return False
+        self.buffer += chunk if not isinstance(chunk, bytes) else self._decoder.decode(chunk)
+        return True
+
+    def peek(self):
+        """Get the next non-whitespace character (not consumed), None at the end of input"""
+
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.fill():
+                return None
+
+    def expect(self, characters):
+        """Consume the next non-whitespace character, which must be one of characters"""
+
+        character = self.peek()
+        if character is None or character not in characters:
+            raise ValueError('Expecting one of %r at position %s, got %r' % (
+                characters, self.position, character))
+        self.position += 1
+        return character
+
+    def decode(self, decoder):
+        """Decode the next value (which is materialized)"""
+
+        character = self.peek()
+        if character is not None and character in NUMBER:
+            # a number may continue in the next chunk, read it completely
+            end = self.position
+            while True:
+                while end < len(self.buffer) and self.buffer[end] in NUMBER:
+                    end += 1
+                if end < len(self.buffer):
+                    break
+                start = len(self.buffer) - self.position
+                if not self.fill():
+                    break
+                end = self.position + start
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.position)
+            except ValueError:
+                # value is incomplete, unless at the end of input
+                if not self.fill():
+                    raise
+                continue
+            self.position = end
+            return value
+
+    def _skip_string(self):
+        """Skip the rest of the string at the position - returns False if more input is required"""
+
+        while self.position < len(self.buffer):
+            character = self.buffer[self.position]
+            if character == '\\':
+                if self.position + 1 >= len(self.buffer):
+                    return False
+                self.position += 2
+                continue
+            self.position += 1
+            if character == '"':
+                return True
+        return False
+
+    def _skip_buffered(self, state):
+        """Skip the buffered part of the next value - returns True at the end of the value
+
+        The skip state (string and nesting depth) is kept in state, across chunks
+        """
+
+        while self.position < len(self.buffer):
+            if state['in_string']:
+                if not self._skip_string():
+                    return False
+                state['in_string'] = False
+                if state['depth'] == 0:
+                    return True
+                continue
+            character = self.buffer[self.position]
+            if character == '"':
+                state['in_string'] = True
+            elif character in '[{':
+                state['depth'] += 1
+            elif character in ']}':
+                if state['depth'] == 0:
+                    return True
+                state['depth'] -= 1
+                if state['depth'] == 0:
+                    self.position += 1
+                    return True
+            elif (character == ',' or character in WHITESPACE) and state['depth'] == 0:
+                return True
+            self.position += 1
+        return False
+
+    def skip(self):
+        """Skip the next value, without materializing it"""
+
+        state = {'in_string': False, 'depth': 0}
+        self.peek()
+        while not self._skip_buffered(state):
+            if not self.fill():
+                if state['in_string'] or state['depth']:
+                    raise ValueError('Unterminated value at end of input')
+                return
+
+
+def _find_path(reader, decoder, path):
+    """Consume input up to (and including) the opening bracket of the array at path"""
+
+    for key in path:
+        reader.expect('{')
+        while True:
+            if reader.peek() == '}':
+                raise KeyError(key)
+            name = reader.decode(decoder)
+            reader.expect(':')
+            if name == key:
+                break
+            reader.skip()
+            if reader.expect(',}') == '}':
+                raise KeyError(key)
+    reader.expect('[')
+
+
+def iter_array_items(chunks, path):
+    """Incrementally decodes JSON, yielding the items of the array at a path
+
+    Notes
+    -----
+    Only the current item is materialized, the rest of the document is
+    scanned (and discarded) as it is read.  Values before the array are
+    skipped, values after it are not read.
+
+    Parameters
+    ----------
+    chunks : iterable
+        the JSON document, in chunks (bytes or str)
+    path : str
+        the (dot separated) path of the array: 'items' or 'declaration.items',
+        an empty path for a top level array
+
+    Returns
+    -------
+    generator
+        yields each (decoded) array item
+
+    Raises
+    ------
+    KeyError
+        if the document does not contain the path
+    ValueError
+        if the document is not valid JSON (up to the end of the array)
+    """
+
+    decoder = json.JSONDecoder()
+    reader = _Reader(chunks)
+
+    _find_path(reader, decoder, [i for i in path.split('.') if i] if path else [])
+
+    if reader.peek() == ']':
+        return
+    while True:
+        yield reader.decode(decoder)
+        if reader.expect(',]') == ']':
+            return
@@ -1,8 +1,11 @@
 """Python module containing helper utility functions """
 
+from datetime import datetime
+
 from f5sdk.constants import COMPARISON_OPERATORS
 from f5sdk.exceptions import InputRequiredError
 from . import file_utils
+from . import json_utils
 
 
 def resolve_config(config, config_file, **kwargs):
@@ -16,6 +19,9 @@ def resolve_config(config, config_file, **kwargs):
         configuration file (to resolve)
     required : bool
         when false, input is not required and none object may be returned
+    prepare : bool
+        return the config pre-serialized (see json_utils.PreparedBody), a
+        configuration file is read but not parsed
 
     Returns
     -------
@@ -28,6 +34,10 @@ def resolve_config(config, config_file, **kwargs):
             raise InputRequiredError('One of config|config_file must be provided')
         return None
 
+    if kwargs.pop('prepare', False):
+        if config_file:
+            return json_utils.PreparedBody.from_file(config_file)
+        return json_utils.PreparedBody(config)
     if config_file:
         config = file_utils.load_file(config_file)
     return config
@@ -57,3 +67,52 @@ def compare_versions(version1, version2, operator):
             compare_pass = False
 
     return compare_pass
+
+
+def get_token_expires_in(token_details):
+    """Get the number of seconds until a token expires
+
+    Parameters
+    ----------
+    token_details : dict
+        the token details, containing the (local, ISO 8601) expiration date:
+        {'token': 'token', 'expirationDate': '2019-01-01T01:01:01.000001'}
+
+    Returns
+    -------
+    float
+        the number of seconds until the token expires (negative if expired),
+        or None if the expiration date is unknown
+    """
+
+    expiration_date = (token_details or {}).get('expirationDate')
+    if not expiration_date:
+        return None
+    for date_format in ['%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S']:
+        try:
+            expires = datetime.strptime(expiration_date, date_format)
+        except ValueError:
+            continue
+        return (expires - datetime.now()).total_seconds()
+    return None
+
+
+def is_token_expiring(token_details, margin):
+    """Checks if a token has expired, or expires within margin
+
+    Parameters
+    ----------
+    token_details : dict
+        the token details - see get_token_expires_in()
+    margin : int
+        the number of seconds before expiry a token is considered expiring
+
+    Returns
+    -------
+    bool
+        boolean true if the token is expiring, false if valid or the
+        expiration date is unknown
+    """
+
+    expires_in = get_token_expires_in(token_details)
+    return expires_in is not None and expires_in <= margin
@@ -0,0 +1,218 @@
+"""Python module containing the list/show query builder
+
+    Example - Projection and filtering::
+
+        from f5sdk.bigip.dns import PoolsClient
+        from f5sdk.utils.query_utils import Query
+
+        query = Query().select('name', 'fullPath').filter('partition', 'Common')
+        for pool in PoolsClient(device, record_type='a').iter_list(query=query):
+            print(pool.name, pool.fullPath)
+
+    Example - Expand subcollections::
+
+        PoolsClient(device, record_type='a').show(
+            name='my_pool', query=Query().expand_subcollections())
+"""
+
+import collections
+import re
+
+from f5sdk.exceptions import InputRequiredError
+
+QUERY_STYLES = ['bigip', 'bigiq', 'cs']
+
+# record types, keyed by fields
+_RECORD_TYPES = {}
+
+
+def get_record_type(fields):
+    """Get (cached) lightweight record type for a set of fields
+
+    Parameters
+    ----------
+    fields : tuple
+        the field names, invalid identifier characters are replaced with '_':
+        ('name', 'fullPath')
+
+    Returns
+    -------
+    object
+        the record type (namedtuple)
+    """
+
+    record_type = _RECORD_TYPES.get(fields)
+    if record_type is None:
+        record_type = collections.namedtuple(
+            'Record', [re.sub(r'\W', '_', i) for i in fields], rename=True)
+        _RECORD_TYPES[fields] = record_type
+    return record_type
+
+
+class Query(object):
+    """A class used to build list/show query parameters: projection, filtering
+    and subcollection expansion
+
+    Notes
+    -----
+    iControl REST (BIG-IP, BIG-IQ) queries use $select, $filter and
+    expandSubcollections.  BIG-IP only supports filtering on partition,
+    BIG-IQ (OData) filter values are quoted.  Cloud Services (CS) queries
+    use 'eq' filters as plain query parameters, the projection is applied
+    to the response.
+
+    With a projection, items are returned as lightweight records
+    (namedtuple) containing only the selected fields.
+
+    Methods
+    -------
+    select()
+        Refer to method documentation
+    filter()
+        Refer to method documentation
+    expand_subcollections()
+        Refer to method documentation
+    get_query_parameters()
+        Refer to method documentation
+    to_record()
+        Refer to method documentation
+    """
+
+    def __init__(self):
+        """Class initialization
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self.fields = ()
+        self._filters = []
+        self._expand_subcollections = False
+
+    def select(self, *fields):
+        """Select (project) fields
+
+        Parameters
+        ----------
+        *fields : str
+            the fields to select: 'name', 'fullPath'
+
+        Returns
+        -------
+        object
+            the query
+        """
+
+        self.fields = self.fields + tuple(i for i in fields if i not in self.fields)
+        return self
+
+    def filter(self, field, value, operator='eq'):
+        """Filter on a field, multiple filters are combined (and)
+
+        Parameters
+        ----------
+        field : str
+            the field: 'partition'
+        value : str
+            the value: 'Common'
+        operator : str
+            the comparison operator: 'eq', 'ne', 'gt', 'lt', etc.
+
+        Returns
+        -------
+        object
+            the query
+        """
+
+        self._filters.append((field, operator, value))
+        return self
+
+    def expand_subcollections(self, expand=True):
+        """Expand subcollections (such as pool members) in the response
+
+        Parameters
+        ----------
+        expand : bool
+            expand subcollections
+
+        Returns
+        -------
+        object
+            the query
+        """
+
+        self._expand_subcollections = expand
+        return self
+
+    @staticmethod
+    def _format_value(value, style):
+        """Format filter value"""
+
+        if style == 'bigiq' and not isinstance(value, (bool, int, float)):
+            return "'%s'" % str(value).replace("'", "''")
+        if isinstance(value, bool):
+            return str(value).lower()
+        return str(value)
+
+    def get_query_parameters(self, style='bigip'):
+        """Get request query parameters
+
+        Parameters
+        ----------
+        style : str
+            the query style: bigip, bigiq or cs
+
+        Returns
+        -------
+        dict
+            the query parameters:
+            {'$select': 'name,fullPath', '$filter': 'partition eq Common'}
+
+        Raises
+        ------
+        InputRequiredError
+            if the style is unknown, or a filter is not supported by the style
+        """
+
+        if style not in QUERY_STYLES:
+            raise InputRequiredError('Query style must be one of: %s' % QUERY_STYLES)
+
+        query_parameters = {}
+        if style == 'cs':
+            for field, operator, value in self._filters:
+                if operator != 'eq':
+                    raise InputRequiredError('CS queries only support eq filters: %s' % field)
+                query_parameters[field] = value
+            return query_parameters
+
+        if self.fields:
+            query_parameters['$select'] = ','.join(self.fields)
+        if self._filters:
+            query_parameters['$filter'] = ' and '.join([
+                '%s %s %s' % (field, operator, self._format_value(value, style))
+                for field, operator, value in self._filters
+            ])
+        if self._expand_subcollections:
+            query_parameters['expandSubcollections'] = 'true'
+        return query_parameters
+
+    def to_record(self, item):
+        """Convert item to a lightweight record, containing the selected fields
+
+        Parameters
+        ----------
+        item : dict
+            the item, missing fields are set to None
+
+        Returns
+        -------
+        object
+            the record (namedtuple)
+        """
+
+        return get_record_type(self.fields)(*[item.get(i) for i in self.fields])
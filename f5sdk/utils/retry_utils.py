@@ -0,0 +1,478 @@
+"""Python module containing the retry policy engine
+
+    Retries back off exponentially with full jitter (a random delay between
+    zero and the exponential delay), so clients failing together do not
+    retry together.  Each operation has a deadline, and all retries share a
+    process-wide retry budget (see RetryBudget) which sheds retries once a
+    fleet of clients is failing.
+
+    HTTP errors are classified (see HTTPError.retryable): client errors such
+    as 400 or 401 are not retried, and the Retry-After header of 429 and 503
+    responses is honored.
+
+    Example - Decorator::
+
+        from f5sdk.utils import retry_utils
+
+        @retry_utils.retry('bigip.get_token', exceptions=HTTPError)
+        def get_token():
+            return make_request('/mgmt/shared/authn/login', method='POST', body=body)
+
+    Example - Explicit attempts (such as polling)::
+
+        state = retry_utils.RetryPolicy('service.is_available').start()
+        while not is_available():
+            delay = state.next_delay()
+            if delay is None:
+                break  # deadline passed, or retry budget exhausted
+            time.sleep(delay)
+
+    Example - Metrics::
+
+        retry_utils.get_retry_metrics()
+        # {'bigip.get_token': {'calls': 1, 'attempts': 3, 'retries': 2, ...}}
+"""
+
+import functools
+import random
+import threading
+import time
+
+from f5sdk.logger import Logger
+from f5sdk import constants
+from f5sdk.exceptions import HTTPError
+
+LOGGER = Logger(__name__).get_logger()
+
+_BUDGET = None
+_BUDGET_LOCK = threading.Lock()
+
+# retry metrics, keyed by operation
+_METRICS = {}
+_METRICS_LOCK = threading.Lock()
+
+METRICS_FIELDS = [
+    'calls', 'attempts', 'retries', 'successes', 'failures', 'not_retryable',
+    'deadline_exceeded', 'budget_exhausted', 'retry_delay_secs', 'elapsed_secs'
+]
+
+
+def _update_metrics(operation, **increments):
+    """Increment operation metrics"""
+
+    with _METRICS_LOCK:
+        metrics = _METRICS.setdefault(operation, dict((i, 0) for i in METRICS_FIELDS))
+        for key, value in increments.items():
+            metrics[key] += value
+
+
+def get_retry_metrics(operation=None):
+    """Get retry metrics
+
+    Parameters
+    ----------
+    operation : str
+        the operation, if not set all operations are returned
+
+    Returns
+    -------
+    dict
+        the metrics (a copy), of the operation or keyed by operation::
+            {
+                'calls': 1,
+                'attempts': 3,
+                'retries': 2,
+                'successes': 1,
+                'failures': 0,
+                'not_retryable': 0,
+                'deadline_exceeded': 0,
+                'budget_exhausted': 0,
+                'retry_delay_secs': 1.5,
+                'elapsed_secs': 2.1
+            }
+    """
+
+    with _METRICS_LOCK:
+        if operation is not None:
+            return dict(_METRICS.get(operation) or dict((i, 0) for i in METRICS_FIELDS))
+        return dict((key, dict(value)) for key, value in _METRICS.items())
+
+
+def reset_retry_metrics():
+    """Reset retry metrics
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+    """
+
+    with _METRICS_LOCK:
+        _METRICS.clear()
+
+
+class RetryBudget(object):
+    """A class used as a retry budget (token bucket), shared by retry policies
+
+    Notes
+    -----
+    Each retry takes a token, the bucket refills at a fixed rate.  Once the
+    bucket is empty retries are not made - the operation fails with its
+    last error - so failing devices (or a failing fleet) cannot multiply
+    the request rate.  First attempts never take a token.
+
+    Methods
+    -------
+    acquire()
+        Refer to method documentation
+    """
+
+    def __init__(self, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        capacity : int
+            the maximum number of tokens (retries in a burst)
+        refill_per_sec : float
+            the number of tokens added each second
+
+        Returns
+        -------
+        None
+        """
+
+        self.capacity = kwargs.pop('capacity', constants.RETRY_BUDGET['CAPACITY'])
+        self.refill_per_sec = kwargs.pop('refill_per_sec', constants.RETRY_BUDGET['REFILL_PER_SEC'])
+
+        self._tokens = float(self.capacity)
+        self._refilled_at = time.time()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        """ The number of tokens available """
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self):
+        """Refill tokens, for the time elapsed (lock held)"""
+
+        now = time.time()
+        self._tokens = min(
+            float(self.capacity), self._tokens + (now - self._refilled_at) * self.refill_per_sec)
+        self._refilled_at = now
+
+    def acquire(self):
+        """Take a token, for a retry
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bool
+            True if a token was taken (the retry may be made)
+        """
+
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def get_retry_budget():
+    """Get the process-wide (shared) retry budget
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    object
+        the retry budget (see RetryBudget)
+    """
+
+    global _BUDGET  # pylint: disable=global-statement
+
+    with _BUDGET_LOCK:
+        if _BUDGET is None:
+            _BUDGET = RetryBudget()
+        return _BUDGET
+
+
+class RetryState(object):
+    """A class used to track the attempts of a single call, see RetryPolicy.start()
+
+    Methods
+    -------
+    next_delay()
+        Refer to method documentation
+    succeeded()
+        Refer to method documentation
+    """
+
+    def __init__(self, policy):
+        """Class initialization
+
+        Parameters
+        ----------
+        policy : object
+            the retry policy
+
+        Returns
+        -------
+        None
+        """
+
+        self._policy = policy
+        self._started_at = time.time()
+        self._deadline = self._started_at + policy.timeout
+        self._ended = False
+        self.attempts = 1
+
+        _update_metrics(policy.operation, calls=1, attempts=1)
+
+    def _end(self, **increments):
+        """Record the end of the call"""
+
+        self._ended = True
+        _update_metrics(
+            self._policy.operation, elapsed_secs=time.time() - self._started_at, **increments)
+
+    def next_delay(self, error=None):
+        """Get the delay before the next attempt, after a failed attempt
+
+        Parameters
+        ----------
+        error : object
+            the error of the failed attempt (logged), an HTTPError is retried
+            only if retryable - honoring any Retry-After
+
+        Returns
+        -------
+        float
+            the number of seconds to wait before the next attempt, or None if
+            no further attempts should be made: error not retryable, attempts
+            exhausted, deadline passed (or Retry-After beyond the deadline) or
+            retry budget exhausted
+        """
+
+        policy = self._policy
+        remaining = self._deadline - time.time()
+
+        retry_after = None
+        if isinstance(error, HTTPError) and policy.classify:
+            if not error.retryable and error.status_code not in policy.retry_status_codes:
+                self._end(failures=1, not_retryable=1)
+                return None
+            retry_after = error.retry_after
+
+        if (policy.tries is not None and self.attempts >= policy.tries) or remaining <= 0 \
+                or (retry_after is not None and retry_after > remaining):
+            self._end(failures=1, deadline_exceeded=1 if remaining <= 0 else 0)
+            return None
+        if not policy.budget.acquire():
+            LOGGER.warning('Retry budget exhausted, not retrying %s: %s' % (
+                policy.operation, error))
+            self._end(failures=1, budget_exhausted=1)
+            return None
+
+        backoff = policy.backoff
+        delay = min(
+            backoff['max_delay'],
+            backoff['initial_delay'] * backoff['multiplier'] ** (self.attempts - 1)
+        )
+        if backoff['jitter']:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        delay = min(delay, remaining)
+
+        self.attempts += 1
+        _update_metrics(policy.operation, attempts=1, retries=1, retry_delay_secs=delay)
+        LOGGER.debug('%s failed: %s, retrying in %.2f seconds' % (policy.operation, error, delay))
+        return delay
+
+    def succeeded(self):
+        """Record a successful attempt
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        if not self._ended:
+            self._end(successes=1)
+
+
+class RetryPolicy(object):
+    """A class used as a retry policy: exponential backoff with full jitter,
+    a deadline and a (shared) retry budget
+
+    Attributes
+    ----------
+    operation : str
+        the operation name, metrics are keyed by it
+    backoff : dict
+        the backoff settings: initial_delay, max_delay, multiplier and jitter
+
+    Methods
+    -------
+    start()
+        Refer to method documentation
+    call()
+        Refer to method documentation
+    """
+
+    def __init__(self, operation, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        operation : str
+            the operation name: 'bigip.get_token'
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        exceptions : tuple
+            the exceptions which should be retried (default: Exception)
+        retry_status_codes : list
+            HTTP status codes to retry, in addition to retryable errors (see
+            HTTPError.retryable): [400]
+        classify : bool
+            classify HTTP errors (default: True), otherwise any HTTP error is
+            retried - such as while a service restarts
+        timeout : float
+            the deadline (in seconds) for all attempts
+        tries : int
+            the maximum number of attempts (default: unlimited, until the deadline)
+        initial_delay : float
+            the (maximum) delay after the first attempt
+        max_delay : float
+            the maximum delay
+        multiplier : float
+            the delay multiplier, applied after each attempt
+        jitter : bool
+            randomize each delay between zero and the (exponential) delay
+        budget : object
+            the retry budget (default: the shared budget, see get_retry_budget())
+
+        Returns
+        -------
+        None
+        """
+
+        self.operation = operation
+        self.exceptions = kwargs.pop('exceptions', Exception)
+        self.retry_status_codes = kwargs.pop('retry_status_codes', None) or []
+        self.classify = kwargs.pop('classify', True)
+        self.timeout = kwargs.pop('timeout', constants.RETRY_POLICY['TIMEOUT_IN_SECS'])
+        self.tries = kwargs.pop('tries', None)
+        self.backoff = {
+            'initial_delay': kwargs.pop(
+                'initial_delay', constants.RETRY_POLICY['INITIAL_DELAY_IN_SECS']),
+            'max_delay': kwargs.pop('max_delay', constants.RETRY_POLICY['MAX_DELAY_IN_SECS']),
+            'multiplier': kwargs.pop('multiplier', constants.RETRY_POLICY['MULTIPLIER']),
+            'jitter': kwargs.pop('jitter', True)
+        }
+        self.budget = kwargs.pop('budget', None) or get_retry_budget()
+
+    def start(self):
+        """Start a call, tracking its attempts - see RetryState
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        object
+            the retry state
+        """
+
+        return RetryState(self)
+
+    def call(self, function, *args, **kwargs):
+        """Call function, retrying (blocking) on failure
+
+        Parameters
+        ----------
+        function : function
+            the (single attempt) function to call
+        *args :
+            positional arguments for the function
+        **kwargs :
+            keyword arguments for the function
+
+        Returns
+        -------
+        any
+            the function response
+
+        Raises
+        ------
+        Exception
+            the last error, once no further attempts should be made
+        """
+
+        state = self.start()
+        while True:
+            try:
+                response = function(*args, **kwargs)
+            except self.exceptions as err:  # pylint: disable=broad-except
+                delay = state.next_delay(err)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            state.succeeded()
+            return response
+
+
+def retry(operation, **policy_kwargs):
+    """Decorator: retry function using a retry policy
+
+    Notes
+    -----
+    The policy is created on each call, so defaults reflect the current
+    constants
+
+    Parameters
+    ----------
+    operation : str
+        the operation name: 'bigip.get_token'
+    **policy_kwargs :
+        the retry policy keyword arguments, see RetryPolicy
+
+    Returns
+    -------
+    function
+        the decorator
+    """
+
+    def _decorator(function):
+        @functools.wraps(function)
+        def _wrapper(*args, **kwargs):
+            return RetryPolicy(operation, **policy_kwargs).call(function, *args, **kwargs)
+        return _wrapper
+    return _decorator
@@ -0,0 +1,269 @@
+"""Python module containing helper SSH utility functions
+
+    Example - Basic::
+
+        from f5sdk.utils import ssh_utils
+
+        connection = ssh_utils.SSHConnection('192.0.2.10', username='admin', password='admin')
+        # subsequent commands reuse the connection (transport)
+        stdout, stderr = connection.exec_command('tmsh show sys version')
+        connection.close()
+"""
+
+import os
+import socket
+import threading
+import time
+import warnings
+import paramiko
+
+from f5sdk.logger import Logger
+from f5sdk import constants
+
+LOGGER = Logger(__name__).get_logger()
+
+SSH_EXCEPTIONS = (
+    paramiko.ssh_exception.SSHException,
+    paramiko.ssh_exception.AuthenticationException,
+    paramiko.ssh_exception.BadHostKeyException
+)
+
+# loaded private keys, keyed by file name - (mtime, key)
+_PRIVATE_KEYS = {}
+_PRIVATE_KEYS_LOCK = threading.Lock()
+
+
+def load_private_key(private_key_file):
+    """Loads (RSA) private key, cached until the file is modified
+
+    Parameters
+    ----------
+    private_key_file : str
+        the file containing the private key
+
+    Returns
+    -------
+    object
+        the private key
+    """
+
+    private_key_file = os.path.expanduser(private_key_file)
+    try:
+        mtime = os.stat(private_key_file).st_mtime
+    except OSError:
+        # not cached, let paramiko report the error
+        mtime = None
+
+    with _PRIVATE_KEYS_LOCK:
+        cached = _PRIVATE_KEYS.get(private_key_file)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return cached[1]
+
+    private_key = paramiko.RSAKey.from_private_key_file(private_key_file)
+    if mtime is not None:
+        with _PRIVATE_KEYS_LOCK:
+            _PRIVATE_KEYS[private_key_file] = (mtime, private_key)
+    return private_key
+
+
+class SSHConnection(object):
+    """A class used as a persistent SSH connection to a device
+
+    Notes
+    -----
+    The connection is established on first use and kept open across
+    commands, each command runs in its own channel on the (shared)
+    transport.  A connection unused for the idle timeout is closed (by a
+    timer thread), so idle clients do not hold sessions on the device.  A
+    connection no longer active is re-established on next use.
+
+    Methods
+    -------
+    exec_command()
+        Refer to method documentation
+    close()
+        Refer to method documentation
+    """
+
+    def __init__(self, host, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        host : str
+            the hostname of the device
+        **kwargs :
+            keyword arguments for paramiko SSHClient.connect() (username,
+            password, pkey, etc.), plus:
+
+        Keyword Arguments
+        -----------------
+        idle_timeout : int
+            the number of seconds an unused connection is kept open
+
+        Returns
+        -------
+        None
+        """
+
+        self.host = host
+        self.idle_timeout = kwargs.pop('idle_timeout', constants.SSH['IDLE_TIMEOUT_IN_SECS'])
+        self._connect_kwargs = kwargs
+
+        self._client = None
+        self._last_used = 0
+        self._lock = threading.Lock()
+        # commands in progress, and the timer closing the connection once idle
+        self._idle = {'in_use': 0, 'timer': None}
+
+    def _connect(self):
+        """Connect to the device
+
+        Returns
+        -------
+        object
+            the (connected) paramiko SSH client
+        """
+
+        LOGGER.debug('Opening SSH connection: %s' % self.host)
+
+        # workaround for deprecation warning described here, until fixed
+        # https://github.com/paramiko/paramiko/issues/1369
+        # workaround: temporarily catch warnings on client.connect
+        with warnings.catch_warnings(record=True) as _:
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.client.AutoAddPolicy)
+            try:
+                client.connect(self.host, **self._connect_kwargs)
+            except SSH_EXCEPTIONS as _e:
+                LOGGER.error(_e)
+                raise _e
+        return client
+
+    def _is_usable(self):
+        """Checks if the current connection can be reused (caller holds the lock)"""
+
+        if self._client is None:
+            return False
+        if time.time() - self._last_used > self.idle_timeout:
+            LOGGER.debug('SSH connection idle, reconnecting: %s' % self.host)
+            return False
+        transport = self._client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def _get_client(self):
+        """Get connected client, (re)connecting as required
+
+        Returns
+        -------
+        tuple
+            the paramiko SSH client and whether it was reused: (client, True)
+        """
+
+        with self._lock:
+            reused = self._is_usable()
+            if not reused:
+                self._close()
+                self._client = self._connect()
+            self._last_used = time.time()
+            return self._client, reused
+
+    def _schedule_idle_close(self):
+        """Schedule closing the connection once idle (caller holds the lock)"""
+
+        self._cancel_idle_close()
+        if self._client is None:
+            return
+        timer = threading.Timer(self.idle_timeout, self._close_if_idle)
+        timer.daemon = True
+        timer.start()
+        self._idle['timer'] = timer
+
+    def _cancel_idle_close(self):
+        """Cancel closing the connection once idle (caller holds the lock)"""
+
+        if self._idle['timer'] is not None:
+            self._idle['timer'].cancel()
+            self._idle['timer'] = None
+
+    def _close_if_idle(self):
+        """Close the connection, if unused for the idle timeout (timer thread)"""
+
+        with self._lock:
+            if self._client is None or self._idle['in_use'] \
+                    or time.time() - self._last_used < self.idle_timeout:
+                return
+            LOGGER.debug('SSH connection idle, closing: %s' % self.host)
+            self._close()
+
+    def exec_command(self, command):
+        """Executes command on the device
+
+        Notes
+        -----
+        If a reused connection fails the command is retried once, on a
+        new connection
+
+        Parameters
+        ----------
+        command : str
+            the command to execute
+
+        Returns
+        -------
+        tuple
+            the command stdout and stderr: ('stdout', 'stderr')
+        """
+
+        with self._lock:
+            self._idle['in_use'] += 1
+        try:
+            return self._exec_command(command)
+        finally:
+            with self._lock:
+                self._idle['in_use'] -= 1
+                self._last_used = time.time()
+                if not self._idle['in_use']:
+                    self._schedule_idle_close()
+
+    def _exec_command(self, command):
+        """Executes command on the device, see exec_command()"""
+
+        client, reused = self._get_client()
+        try:
+            result = client.exec_command(command)
+        except (paramiko.ssh_exception.SSHException, EOFError, socket.error) as err:
+            if not reused:
+                raise
+            LOGGER.debug('SSH connection lost, reconnecting: %s' % err)
+            self.close()
+            client, _ = self._get_client()
+            result = client.exec_command(command)
+
+        # command output (tuple): stdin, stdout, stderr
+        stdout = result[1].read().decode('utf-8')
+        stderr = result[2].read().decode('utf-8')
+        return stdout, stderr
+
+    def _close(self):
+        """Close connection (caller holds the lock)"""
+
+        self._cancel_idle_close()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def close(self):
+        """Closes the connection
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            self._close()
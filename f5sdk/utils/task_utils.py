@@ -0,0 +1,380 @@
+"""Python module containing the (shared) async task poller
+
+    Example - Basic::
+
+        from f5sdk.utils import task_utils
+
+        def poll():
+            response = mgmt_client.make_request('/mgmt/shared/iapp/package-management-tasks/1')
+            return response['status'] == 'FINISHED', response
+
+        future = task_utils.get_task_poller().submit(poll, timeout=120)
+        # block until complete, or use future.add_done_callback()
+        response = future.result()
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+try:
+    import queue
+except ImportError:  # python 2.x support
+    import Queue as queue
+
+from f5sdk.logger import Logger
+from f5sdk import constants
+from f5sdk.exceptions import TaskTimeoutError
+
+LOGGER = Logger(__name__).get_logger()
+
+_POLLER = None
+_POLLER_LOCK = threading.Lock()
+
+
+class TaskFuture(object):
+    """A class representing the eventual result of an async task
+
+    Methods
+    -------
+    done()
+        Refer to method documentation
+    result()
+        Refer to method documentation
+    exception()
+        Refer to method documentation
+    add_done_callback()
+        Refer to method documentation
+    """
+
+    def __init__(self):
+        """Class initialization
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        self._condition = threading.Condition()
+        self._done = False
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    def _set(self, result, exception):
+        """Set result (or exception) and run any callbacks"""
+
+        with self._condition:
+            self._result = result
+            self._exception = exception
+            self._done = True
+            self._condition.notify_all()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            self._run_callback(callback)
+
+    def _run_callback(self, callback):
+        try:
+            callback(self)
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception('Task callback raised an exception')
+
+    def set_result(self, result):
+        """Set the task result, completing the future"""
+
+        self._set(result, None)
+
+    def set_exception(self, exception):
+        """Set the task exception, completing the future"""
+
+        self._set(None, exception)
+
+    def done(self):
+        """Checks if the task is complete
+
+        Returns
+        -------
+        bool
+            boolean true if the task has completed (or failed)
+        """
+
+        return self._done
+
+    def exception(self, timeout=None):
+        """Waits for the task, returning its exception
+
+        Parameters
+        ----------
+        timeout : int
+            the maximum number of seconds to wait, defaults to no limit
+
+        Returns
+        -------
+        object
+            the task exception, or None if the task succeeded
+
+        Raises
+        ------
+        TaskTimeoutError
+            if the task has not completed within the timeout
+        """
+
+        with self._condition:
+            if not self._done:
+                self._condition.wait(timeout)
+            if not self._done:
+                raise TaskTimeoutError('Task not complete after %s seconds' % timeout)
+        return self._exception
+
+    def result(self, timeout=None):
+        """Waits for the task, returning its result
+
+        Parameters
+        ----------
+        timeout : int
+            the maximum number of seconds to wait, defaults to no limit
+
+        Returns
+        -------
+        dict
+            the task result
+
+        Raises
+        ------
+        Exception
+            the task exception, if the task failed
+        """
+
+        exception = self.exception(timeout)
+        if exception is not None:
+            raise exception
+        return self._result
+
+    def add_done_callback(self, callback):
+        """Adds a callback, called with the future once the task completes
+
+        Notes
+        -----
+        Called immediately if the task has already completed, otherwise
+        called from a poller thread
+
+        Parameters
+        ----------
+        callback : function
+            the function to call
+
+        Returns
+        -------
+        None
+        """
+
+        with self._condition:
+            if not self._done:
+                self._callbacks.append(callback)
+                return
+        self._run_callback(callback)
+
+
+class TaskPoller(object):
+    """A class used to poll many async tasks from a single scheduler
+
+    Notes
+    -----
+    Outstanding tasks are held in one schedule (no thread per task), a small
+    pool of worker threads performs the polls.  The delay between polls of a
+    task starts small and backs off (up to a maximum) while it is running.
+
+    Methods
+    -------
+    submit()
+        Refer to method documentation
+    """
+
+    def __init__(self, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        workers : int
+            the number of worker threads performing polls
+        initial_delay : float
+            the delay (in seconds) after the first poll of a task
+        max_delay : float
+            the maximum delay (in seconds) between polls of a task
+        backoff : float
+            the multiplier applied to the delay after each poll
+
+        Returns
+        -------
+        None
+        """
+
+        self._workers = kwargs.pop('workers', constants.TASK_POLLER['WORKERS'])
+        self._initial_delay = kwargs.pop(
+            'initial_delay', constants.TASK_POLLER['INITIAL_DELAY_IN_SECS'])
+        self._max_delay = kwargs.pop('max_delay', constants.TASK_POLLER['MAX_DELAY_IN_SECS'])
+        self._backoff = kwargs.pop('backoff', constants.TASK_POLLER['BACKOFF'])
+
+        self._condition = threading.Condition()
+        self._schedule = []
+        self._counter = itertools.count()
+        self._queue = queue.Queue()
+        self._started = False
+
+    def _start(self):
+        """Start scheduler and worker threads (if not started)"""
+
+        with self._condition:
+            if self._started:
+                return
+            self._started = True
+
+        targets = [self._run_scheduler] + [self._run_worker] * self._workers
+        for target in targets:
+            thread = threading.Thread(target=target)
+            thread.daemon = True
+            thread.start()
+
+    def _schedule_task(self, task, delay):
+        """Schedule task to be polled after delay (seconds)"""
+
+        with self._condition:
+            heapq.heappush(self._schedule, (time.time() + delay, next(self._counter), task))
+            self._condition.notify()
+
+    def _run_scheduler(self):
+        """Scheduler thread: hand tasks to the workers as they become due"""
+
+        while True:
+            with self._condition:
+                while not self._schedule:
+                    self._condition.wait()
+                due = self._schedule[0][0] - time.time()
+                if due > 0:
+                    self._condition.wait(due)
+                    continue
+                task = heapq.heappop(self._schedule)[2]
+            self._queue.put(task)
+
+    def _run_worker(self):
+        """Worker thread: poll tasks"""
+
+        while True:
+            self._poll(self._queue.get())
+
+    def _poll(self, task):
+        """Poll task once, then complete or reschedule it
+
+        Parameters
+        ----------
+        task : dict
+            the task state
+
+        Returns
+        -------
+        None
+        """
+
+        future = task['future']
+        try:
+            finished, response = task['poll']()
+        except Exception as err:  # pylint: disable=broad-except
+            if not task['retry_exceptions']:
+                future.set_exception(err)
+                return
+            LOGGER.debug('Task poll failed, retrying: %s' % err)
+            task['last_error'] = err
+            finished, response = False, None
+
+        if finished:
+            future.set_result(response)
+            return
+
+        remaining = task['deadline'] - time.time()
+        if remaining <= 0:
+            future.set_exception(task['last_error'] or TaskTimeoutError(
+                'Task not complete after %s seconds' % task['timeout']))
+            return
+
+        delay = min(task['delay'], remaining)
+        task['delay'] = min(task['delay'] * self._backoff, self._max_delay)
+        self._schedule_task(task, delay)
+
+    def submit(self, poll, **kwargs):
+        """Submits a task to poll, the first poll happens immediately
+
+        Parameters
+        ----------
+        poll : function
+            the function to poll the task, returns a tuple of whether the task
+            is finished and the task response: (True, {})
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        timeout : int
+            the number of seconds to poll before the task fails with the last
+            poll exception or TaskTimeoutError
+        retry_exceptions : bool
+            continue polling when the poll function raises an exception,
+            by default the exception fails the task
+        callback : function
+            the function to call with the future once the task completes
+
+        Returns
+        -------
+        object
+            the task future (see TaskFuture)
+        """
+
+        timeout = kwargs.pop('timeout', constants.TASK_POLLER['TIMEOUT_IN_SECS'])
+        callback = kwargs.pop('callback', None)
+
+        future = TaskFuture()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        self._start()
+        self._schedule_task({
+            'poll': poll,
+            'future': future,
+            'timeout': timeout,
+            'deadline': time.time() + timeout,
+            'delay': self._initial_delay,
+            'retry_exceptions': kwargs.pop('retry_exceptions', False),
+            'last_error': None
+        }, 0)
+        return future
+
+
+def get_task_poller():
+    """Get the process-wide (shared) task poller
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    object
+        the task poller (see TaskPoller)
+    """
+
+    global _POLLER  # pylint: disable=global-statement
+
+    with _POLLER_LOCK:
+        if _POLLER is None:
+            _POLLER = TaskPoller()
+        return _POLLER
@@ -0,0 +1,416 @@
+"""Python module containing HTTP transports, used by make_request
+
+    A transport is any object with a request() method matching the
+    requests.Session.request() signature subset used by make_request
+    (see Transport), management clients accept one using the transport
+    keyword argument.
+
+    Example - Pooled urllib3 transport::
+
+        from f5sdk.bigip import ManagementClient
+        from f5sdk.utils import transport_utils
+
+        transport = transport_utils.Urllib3Transport(pool_size=20)
+        device = ManagementClient('192.0.2.10', user='admin', password='admin',
+                                  transport=transport)
+
+    Example - In-memory transport (tests, benchmarks)::
+
+        transport = transport_utils.InMemoryTransport(
+            lambda method, url, **kwargs: (200, {'version': '15.1.0'}, {})
+        )
+        device = ManagementClient('192.0.2.10', token='token', skip_ready_check=True,
+                                  transport=transport)
+"""
+
+import os
+import threading
+import warnings
+import requests
+import urllib3
+
+try:
+    from urllib.parse import urlencode
+except ImportError:  # python 2.x support
+    from urllib import urlencode
+
+from f5sdk import constants
+from f5sdk.logger import Logger
+
+from . import json_utils
+
+logger = Logger(__name__).get_logger()  # pylint: disable=invalid-name
+
+
+class Response(object):
+    """A class used as a transport response, a subset of requests.Response
+
+    Attributes
+    ----------
+    status_code : int
+        the HTTP status code
+    reason : str
+        the HTTP status reason
+    headers : dict
+        the HTTP response headers (case-insensitive)
+    content : bytes
+        the HTTP response body (read on first access, when streamed)
+
+    Methods
+    -------
+    json()
+        Refer to method documentation
+    iter_content()
+        Refer to method documentation
+    close()
+        Refer to method documentation
+    """
+
+    def __init__(self, status_code, reason, headers, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        status_code : int
+            the HTTP status code
+        reason : str
+            the HTTP status reason
+        headers : dict
+            the HTTP response headers (case-insensitive)
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        content : bytes
+            the HTTP response body
+        raw : object
+            the (unread) urllib3 response, when streamed
+
+        Returns
+        -------
+        None
+        """
+
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self._content = kwargs.pop('content', None)
+        self._raw = kwargs.pop('raw', None)
+
+    @property
+    def content(self):
+        """ The HTTP response body """
+        if self._content is None:
+            self._content = self._raw.data if self._raw is not None else b''
+        return self._content
+
+    def iter_content(self, chunk_size=1):
+        """Iterates over the response body, in chunks
+
+        Parameters
+        ----------
+        chunk_size : int
+            the (maximum) chunk size, in bytes
+
+        Returns
+        -------
+        generator
+            yields each chunk (bytes)
+        """
+
+        if self._raw is not None and self._content is None:
+            for chunk in self._raw.stream(chunk_size):
+                yield chunk
+            return
+        for index in range(0, len(self.content), chunk_size):
+            yield self.content[index:index + chunk_size]
+
+    def close(self):
+        """Closes the response, releasing the connection
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+        if self._raw is not None:
+            self._raw.release_conn()
+
+    @property
+    def ok(self):  # pylint: disable=invalid-name
+        """ Boolean true if the status code is less than 400 """
+        return self.status_code < 400
+
+    def json(self):
+        """Decodes the response body (JSON)
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        dict
+            the decoded response body
+
+        Raises
+        ------
+        ValueError
+            if the response body is not valid JSON
+        """
+
+        return json_utils.decode(self.content)
+
+
+class Transport(object):
+    """A class used as the HTTP transport interface
+
+    Methods
+    -------
+    request()
+        Refer to method documentation
+    close()
+        Refer to method documentation
+    """
+
+    def request(self, method, url, **kwargs):
+        """Makes HTTP request
+
+        Parameters
+        ----------
+        method : str
+            the HTTP method
+        url : str
+            the URL
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        headers : dict
+            the HTTP headers
+        params : dict
+            the HTTP query parameters
+        data : str
+            the HTTP body
+        auth : tuple
+            basic auth: ('user', 'password')
+        timeout : int
+            the request timeout (in seconds)
+        verify : bool
+            verify the server certificate
+        stream : bool
+            do not read the response body until accessed, see
+            Response.iter_content()
+
+        Returns
+        -------
+        object
+            the response, see Response
+        """
+
+        raise NotImplementedError
+
+    def close(self):
+        """Closes the transport, releasing any connections
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+
+
+class RequestsTransport(Transport):
+    """A class used as a requests (session) transport, with its own connection pool
+
+    Notes
+    -----
+    This is the behaviour of management clients without a transport, except
+    the connection pool is not shared with other clients for the same device
+    """
+
+    def __init__(self, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        pool_size : int
+            the maximum number of connections to keep in the pool (per host)
+
+        Returns
+        -------
+        None
+        """
+
+        pool_size = kwargs.pop('pool_size', None) or constants.HTTP_POOL['SIZE']
+
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def request(self, method, url, **kwargs):
+        """See Transport.request()"""
+
+        return self._session.request(method, url, **kwargs)
+
+    def close(self):
+        """See Transport.close()"""
+
+        self._session.close()
+
+
+class Urllib3Transport(Transport):
+    """A class used as a pooled urllib3 transport, with minimal per request overhead
+
+    Notes
+    -----
+    Requests go directly to a urllib3 pool manager - no session, hooks,
+    cookie handling or environment (proxy) lookups per request.  Neither
+    redirects nor retries are followed.  When certificates are not verified
+    the insecure request warning is logged once, on creation, rather than on
+    every request.
+    """
+
+    def __init__(self, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        pool_size : int
+            the maximum number of connections to keep in the pool (per host)
+        verify : bool
+            verify the server certificate
+
+        Returns
+        -------
+        None
+        """
+
+        pool_size = kwargs.pop('pool_size', None) or constants.HTTP_POOL['SIZE']
+        self.verify = kwargs.pop('verify', constants.HTTP_VERIFY)
+
+        self._pool = urllib3.PoolManager(
+            maxsize=pool_size,
+            cert_reqs='CERT_REQUIRED' if self.verify else 'CERT_NONE'
+        )
+        if not self.verify:
+            if os.environ.get(
+                    constants.ENV_VARS['DISABLE_SSL_WARNINGS'], 'false').lower() == 'false':
+                logger.warning('SSL Insecure request, '
+                               'recommend adding a valid certificate to the device')
+
+    def request(self, method, url, **kwargs):
+        """See Transport.request()"""
+
+        headers = kwargs.pop('headers', None) or {}
+        params = kwargs.pop('params', None)
+        body = kwargs.pop('data', None)
+        auth = kwargs.pop('auth', None)
+        timeout = kwargs.pop('timeout', None)
+        stream = kwargs.pop('stream', False)
+
+        if params:
+            url = '%s?%s' % (url, urlencode(params, doseq=True))
+        if auth:
+            headers = dict(headers)
+            headers.update(urllib3.util.make_headers(basic_auth='%s:%s' % auth))
+        if body is not None and not isinstance(body, bytes):
+            body = body.encode('utf-8')
+
+        with warnings.catch_warnings():
+            if not self.verify:
+                # logged once, on creation
+                warnings.simplefilter('ignore', urllib3.exceptions.InsecureRequestWarning)
+            response = self._pool.urlopen(
+                method.upper(),
+                url,
+                body=body,
+                headers=headers,
+                timeout=timeout,
+                retries=False,
+                redirect=False,
+                preload_content=not stream
+            )
+        if stream:
+            return Response(response.status, response.reason, response.headers, raw=response)
+        return Response(response.status, response.reason, response.headers, content=response.data)
+
+    def close(self):
+        """See Transport.close()"""
+
+        self._pool.clear()
+
+
+class InMemoryTransport(Transport):
+    """A class used as an in-memory transport, requests never leave the process
+
+    Attributes
+    ----------
+    requests : list
+        the requests made: [{'method': 'GET', 'url': '', 'kwargs': {}}]
+
+    Notes
+    -----
+    Intended for tests and benchmarks
+    """
+
+    def __init__(self, handler, **kwargs):
+        """Class initialization
+
+        Parameters
+        ----------
+        handler : function
+            called with the request method, URL and keyword arguments (see
+            Transport.request()) and returning the response status code,
+            body (dict, or bytes) and headers: (200, {}, {})
+        **kwargs :
+            optional keyword arguments
+
+        Keyword Arguments
+        -----------------
+        record : bool
+            record the requests made
+
+        Returns
+        -------
+        None
+        """
+
+        self._handler = handler
+        self._record = kwargs.pop('record', True)
+        self._lock = threading.Lock()
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        """See Transport.request()"""
+
+        if self._record:
+            with self._lock:
+                self.requests.append({'method': method.upper(), 'url': url, 'kwargs': kwargs})
+
+        status_code, body, headers = self._handler(method.upper(), url, **kwargs)
+        if not isinstance(body, bytes):
+            body = json_utils.encode(body) if body is not None else b''
+        headers = requests.structures.CaseInsensitiveDict(headers or {})
+        headers.setdefault('Content-Length', str(len(body)))
+        return Response(status_code, '', headers, content=body)
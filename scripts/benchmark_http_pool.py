@@ -0,0 +1,128 @@
+"""Benchmark: pooled (keep-alive) vs. per-call HTTPS connections
+
+Starts a local HTTPS stand-in for iControl REST (self-signed certificate,
+generated using the openssl CLI) and measures sequential calls/sec for
+requests.request (new connection per call) and http_utils.make_request
+using a pooled session.
+
+    Example::
+
+        python3 scripts/benchmark_http_pool.py --requests 500
+"""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import warnings
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import requests
+
+os.environ.setdefault('F5_DISABLE_SSL_WARNINGS', 'true')
+
+from f5sdk.utils import http_utils  # pylint: disable=wrong-import-position
+
+RESPONSE_BODY = json.dumps({'items': [{'name': 'foo'}]}).encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """ iControl REST stand-in: returns a small JSON document """
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        BaseHTTPRequestHandler.setup(self)
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def start_server(cert_dir, handler=_Handler):
+    """Start the HTTPS stand-in on an ephemeral port, returns (server, port)"""
+
+    cert_file = os.path.join(cert_dir, 'cert.pem')
+    key_file = os.path.join(cert_dir, 'key.pem')
+    subprocess.check_call(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-subj', '/CN=localhost', '-keyout', key_file, '-out', cert_file],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    server = _Server(('127.0.0.1', 0), handler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server, server.server_address[1]
+
+
+def measure(func, count):
+    """Returns calls/sec for func()"""
+
+    start = time.time()
+    for _ in range(count):
+        func()
+    return count / (time.time() - start)
+
+
+def main():
+    """ Entry point """
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    cert_dir = tempfile.mkdtemp()
+    server, port = start_server(cert_dir)
+    url = 'https://127.0.0.1:%s/mgmt/tm/sys' % port
+
+    try:
+        per_call = measure(
+            lambda: requests.request('GET', url, verify=False), args.requests)
+
+        session = http_utils.get_session('127.0.0.1', port)
+        pooled = measure(
+            lambda: http_utils.make_request(
+                '127.0.0.1', '/mgmt/tm/sys', port=port, session=session),
+            args.requests)
+        http_utils.release_session('127.0.0.1', port)
+    finally:
+        server.shutdown()
+        shutil.rmtree(cert_dir)
+
+    print('requests.request (new connection per call): %.0f calls/sec' % per_call)
+    print('http_utils.make_request (pooled session):   %.0f calls/sec' % pooled)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""Benchmark: JSON codecs on large AS3 declarations
+
+Encodes and decodes a synthetic AS3 declaration (many tenants, each with
+HTTP applications, pools and members) using each installed codec (see
+json_utils.JSON_CODECS), and measures http_utils.make_request POSTing the
+declaration using the InMemoryTransport - which never leaves the process,
+so it measures the SDK overhead alone - and file_utils.load_file.
+
+    Example::
+
+        python3 scripts/benchmark_json_codec.py --tenants 500 --runs 10
+"""
+
+import argparse
+import gc
+import os
+import shutil
+import tempfile
+import time
+
+from f5sdk.exceptions import InputRequiredError
+from f5sdk.utils import file_utils, http_utils, json_utils, transport_utils
+
+URI = '/mgmt/shared/appsvcs/declare'
+
+
+def get_declaration(tenants, applications=10, members=20):
+    """Synthetic AS3 declaration"""
+
+    declaration = {
+        'class': 'AS3',
+        'action': 'deploy',
+        'persist': True,
+        'declaration': {
+            'class': 'ADC',
+            'schemaVersion': '3.18.0',
+            'id': 'benchmark',
+            'label': 'Benchmark \u00e9',
+            'remark': 'Synthetic declaration'
+        }
+    }
+    for tenant in range(tenants):
+        tenant_body = {'class': 'Tenant'}
+        for application in range(applications):
+            name = 'app_%s' % application
+            tenant_body[name] = {
+                'class': 'Application',
+                'template': 'http',
+                'serviceMain': {
+                    'class': 'Service_HTTP',
+                    'virtualAddresses': ['10.%s.%s.1' % (tenant % 256, application)],
+                    'virtualPort': 80,
+                    'pool': '%s_pool' % name,
+                    'persistenceMethods': ['cookie'],
+                    'profileHTTP': {'use': '/Common/http'}
+                },
+                '%s_pool' % name: {
+                    'class': 'Pool',
+                    'monitors': ['http'],
+                    'loadBalancingMode': 'least-connections-member',
+                    'minimumMembersActive': 1,
+                    'members': [{
+                        'servicePort': 8080,
+                        'serverAddresses': [
+                            '192.0.%s.%s' % (application, member) for member in range(members)
+                        ],
+                        'shareNodes': True,
+                        'ratio': 1,
+                        'connectionLimit': 0,
+                        'enable': True
+                    }]
+                }
+            }
+        declaration['declaration']['tenant_%s' % tenant] = tenant_body
+    return declaration
+
+
+def measure(func, runs):
+    """Run func runs times, returns the mean milliseconds per run (garbage
+    collection disabled, as timeit does)"""
+
+    func()  # warm up
+    gc.disable()
+    try:
+        start = time.time()
+        for _ in range(runs):
+            func()
+        return (time.time() - start) * 1000 / runs
+    finally:
+        gc.enable()
+
+
+def main():
+    """ Entry point """
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--tenants', type=int, default=500)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    declaration = get_declaration(args.tenants)
+    transport = transport_utils.InMemoryTransport(
+        lambda method, url, **kwargs: (200, {'results': [{'code': 200}]}, {}), record=False)
+
+    temp_dir = tempfile.mkdtemp()
+    declaration_file = os.path.join(temp_dir, 'declaration.json')
+    with open(declaration_file, 'wb') as _f:
+        _f.write(json_utils.encode(declaration))
+
+    results = []
+    try:
+        for codec in json_utils.JSON_CODECS:
+            try:
+                json_utils.set_codec(codec)
+            except InputRequiredError:
+                print('%s: not installed, skipped' % codec)
+                continue
+            data = json_utils.encode(declaration)
+            results.append((codec, len(data), [
+                measure(lambda: json_utils.encode(declaration), args.runs),
+                measure(lambda data=data: json_utils.decode(data), args.runs),
+                measure(lambda: http_utils.make_request(
+                    '127.0.0.1', URI, method='POST', body=declaration, transport=transport),
+                        args.runs),
+                measure(lambda: file_utils.load_file(declaration_file), args.runs)
+            ]))
+    finally:
+        shutil.rmtree(temp_dir)
+
+    print('%-8s %8s %10s %10s %14s %10s' % (
+        'codec', 'MB', 'encode ms', 'decode ms', 'make_request ms', 'load ms'))
+    for codec, size, timings in results:
+        print('%-8s %8.1f %10.1f %10.1f %14.1f %10.1f' % ((codec, size / 1e6) + tuple(timings)))
+
+
+if __name__ == '__main__':
+    main()
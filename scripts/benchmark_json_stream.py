@@ -0,0 +1,122 @@
+"""Benchmark: peak memory of full vs. streamed (incremental) JSON decoding
+
+Serves a synthetic iControl REST collection (100k items by default) from
+the local HTTPS stand-in (see benchmark_http_pool.py) and measures the
+peak traced memory (tracemalloc) and time of http_utils.make_request
+iterating the items: fully decoded, and streamed using stream_path.
+
+    Example::
+
+        python3 scripts/benchmark_json_stream.py --items 100000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+os.environ.setdefault('F5_DISABLE_SSL_WARNINGS', 'true')
+
+# pylint: disable=wrong-import-position
+from f5sdk.utils import http_utils
+
+from benchmark_http_pool import start_server, _Handler
+
+URI = '/mgmt/tm/ltm/pool'
+CHUNK_SIZE = 64 * 1024
+
+
+def get_response_body(count):
+    """Synthetic collection response body, of count items"""
+
+    return json.dumps({
+        'kind': 'tm:ltm:pool:poolcollectionstate',
+        'selfLink': 'https://localhost/mgmt/tm/ltm/pool',
+        'items': [{
+            'kind': 'tm:ltm:pool:poolstate',
+            'name': 'pool_%s' % i,
+            'partition': 'Common',
+            'fullPath': '/Common/pool_%s' % i,
+            'generation': i,
+            'loadBalancingMode': 'round-robin',
+            'minActiveMembers': 0,
+            'monitor': '/Common/http '
+        } for i in range(count)]
+    }).encode('utf-8')
+
+
+def get_handler(body):
+    """Handler returning body, using chunked transfer encoding"""
+
+    class _StreamHandler(_Handler):
+        """ iControl REST stand-in: returns a large (chunked) JSON document """
+
+        def _reply(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for index in range(0, len(body), CHUNK_SIZE):
+                chunk = body[index:index + CHUNK_SIZE]
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            self.wfile.write(b'0\r\n\r\n')
+
+        do_GET = _reply
+
+    return _StreamHandler
+
+
+def measure_memory(func):
+    """Run func, returns (seconds, peak traced memory in bytes)"""
+
+    tracemalloc.start()
+    start = time.time()
+    func()
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    """ Entry point """
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--items', type=int, default=100000)
+    args = parser.parse_args()
+
+    body = get_response_body(args.items)
+
+    warnings.simplefilter('ignore')
+    cert_dir = tempfile.mkdtemp()
+    server, port = start_server(cert_dir, handler=get_handler(body))
+
+    def _full():
+        response = http_utils.make_request('127.0.0.1', URI, port=port)
+        assert sum(1 for _ in response['items']) == args.items
+
+    def _streamed():
+        response = http_utils.make_request('127.0.0.1', URI, port=port, stream_path='items')
+        assert sum(1 for _ in response) == args.items
+
+    results = []
+    try:
+        # warm up (connection, imports) outside of the measurements
+        _streamed()
+        for name, func in [('full decode', _full), ('streamed (stream_path)', _streamed)]:
+            results.append((name, measure_memory(func)))
+    finally:
+        server.shutdown()
+        shutil.rmtree(cert_dir)
+
+    print('response body: %.1f MB, %s items' % (len(body) / 1e6, args.items))
+    for name, (elapsed, peak) in results:
+        print('%-24s %8.2f s %10.1f MB peak' % (name, elapsed, peak / 1e6))
+
+
+if __name__ == '__main__':
+    main()
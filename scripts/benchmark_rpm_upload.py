@@ -0,0 +1,153 @@
+"""Benchmark: RPM upload - read into memory (legacy) vs. memory-mapped slices
+
+Starts a local HTTPS stand-in for the iControl REST file-transfer endpoint
+and uploads a generated file using each implementation, in a child process
+per implementation, reporting throughput (MB/s) and peak RSS.
+
+    Example::
+
+        python3 scripts/benchmark_rpm_upload.py --size-mb 256 --chunk-size 1048576
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from http.server import BaseHTTPRequestHandler
+
+from benchmark_http_pool import start_server
+
+os.environ.setdefault('F5_DISABLE_SSL_WARNINGS', 'true')
+
+# pylint: disable=wrong-import-position
+from f5sdk.bigip import ManagementClient
+from f5sdk.bigip.extension.package import OperationClient
+from f5sdk.logger import Logger
+
+UPLOAD_URI = '/mgmt/shared/file-transfer/uploads/%s'
+
+
+class _UploadHandler(BaseHTTPRequestHandler):
+    """ file-transfer stand-in: discards the slice, acknowledges the range """
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        BaseHTTPRequestHandler.setup(self)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """ Handle upload slice """
+
+        remaining = int(self.headers.get('Content-Length') or 0)
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1024 * 1024)))
+
+        start_end, total = self.headers['Content-Range'].split('/')
+        end = int(start_end.split('-')[1])
+        body = json.dumps({'remainingByteCount': int(total) - end - 1}).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def legacy_upload(client, file_name, chunk_size):
+    """Previous implementation: reads the whole file to size it, posts copied slices"""
+
+    uri = UPLOAD_URI % (file_name.split('/')[-1])
+
+    file_object = open(file_name, 'rb')
+    file_size = len(file_object.read())
+    file_object.seek(0)
+    start_index = 0
+    while True:
+        file_slice = file_object.read(chunk_size)
+        if not file_slice:
+            break
+        end = start_index + len(file_slice)
+        client.make_request(
+            uri,
+            method='POST',
+            headers={
+                'Content-Range': '%s-%s/%s' % (start_index, end - 1, file_size),
+                'Content-Type': 'application/octet-stream'
+            },
+            body=file_slice,
+            body_content_type='raw'
+        )
+        start_index = end
+    file_object.close()
+
+
+def run_child(args):
+    """Child process: run a single upload, print JSON results"""
+
+    client = ManagementClient('127.0.0.1', port=args.port, token='token', skip_ready_check=True)
+    start = time.time()
+    if args.mode == 'legacy':
+        legacy_upload(client, args.file, args.chunk_size)
+    else:
+        package_client = OperationClient(
+            client, 'as3', None, None, logger=Logger(__name__).get_logger())
+        package_client._upload_rpm(  # pylint: disable=protected-access
+            args.file, delete_file=False, chunk_size=args.chunk_size)
+    elapsed = time.time() - start
+
+    # note: ru_maxrss is reported in KB on linux
+    print(json.dumps({
+        'mb_per_sec': os.path.getsize(args.file) / (1024.0 * 1024) / elapsed,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    }))
+
+
+def main():
+    """ Entry point """
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--size-mb', type=int, default=256)
+    parser.add_argument('--chunk-size', type=int, default=1024 * 1024)
+    parser.add_argument('--mode', choices=['legacy', 'streaming'])
+    parser.add_argument('--port', type=int)
+    parser.add_argument('--file')
+    args = parser.parse_args()
+
+    if args.mode:
+        run_child(args)
+        return
+
+    work_dir = tempfile.mkdtemp()
+    server, port = start_server(work_dir, handler=_UploadHandler)
+    file_name = os.path.join(work_dir, 'f5-benchmark.noarch.rpm')
+    with open(file_name, 'wb') as file_object:
+        for _ in range(args.size_mb):
+            file_object.write(os.urandom(1024 * 1024))
+
+    try:
+        for mode in ['legacy', 'streaming']:
+            output = subprocess.check_output([
+                sys.executable, __file__, '--mode', mode, '--port', str(port),
+                '--file', file_name, '--chunk-size', str(args.chunk_size)
+            ])
+            result = json.loads(output.decode('utf-8').strip().split('\n')[-1])
+            print('%-9s upload: %7.1f MB/s  peak RSS %7.1f MB' % (
+                mode, result['mb_per_sec'], result['peak_rss_mb']))
+    finally:
+        server.shutdown()
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: per-request overhead of each make_request transport
+
+Measures sequential calls/sec (and microseconds per call) of
+http_utils.make_request for each transport: the default shared requests
+session, RequestsTransport and Urllib3Transport against a local HTTPS
+stand-in for iControl REST (see benchmark_http_pool.py), plus the
+InMemoryTransport - which never leaves the process, so it measures the
+SDK overhead alone.
+
+    Example::
+
+        python3 scripts/benchmark_transport.py --requests 2000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import warnings
+
+os.environ.setdefault('F5_DISABLE_SSL_WARNINGS', 'true')
+
+# pylint: disable=wrong-import-position
+from f5sdk.utils import http_utils, transport_utils
+
+from benchmark_http_pool import start_server, measure
+
+URI = '/mgmt/tm/sys'
+RESPONSE_BODY = json.dumps({'items': [{'name': 'foo'}]}).encode('utf-8')
+
+
+def main():
+    """ Entry point """
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    cert_dir = tempfile.mkdtemp()
+    server, port = start_server(cert_dir)
+
+    results = []
+    try:
+        session = http_utils.get_session('127.0.0.1', port)
+        results.append(('shared requests session (default)', measure(
+            lambda: http_utils.make_request('127.0.0.1', URI, port=port, session=session),
+            args.requests)))
+        http_utils.release_session('127.0.0.1', port)
+
+        for name, transport in [
+                ('RequestsTransport', transport_utils.RequestsTransport()),
+                ('Urllib3Transport', transport_utils.Urllib3Transport()),
+                ('InMemoryTransport (no network)', transport_utils.InMemoryTransport(
+                    lambda method, url, **kwargs: (200, RESPONSE_BODY, {}), record=False))]:
+            results.append((name, measure(
+                lambda transport=transport: http_utils.make_request(
+                    '127.0.0.1', URI, port=port, transport=transport),
+                args.requests)))
+            transport.close()
+    finally:
+        server.shutdown()
+        shutil.rmtree(cert_dir)
+
+    for name, calls_per_sec in results:
+        print('%-36s %8.0f calls/sec %8.1f us/call' % (name, calls_per_sec, 1e6 / calls_per_sec))
+
+
+if __name__ == '__main__':
+    main()
@@ -57,7 +57,6 @@ setuptools.setup(
     },
     install_requires=[
         'requests>=2',
-        'retry>=0',
         'paramiko>=2'
     ]
 )
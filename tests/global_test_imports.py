@@ -6,6 +6,13 @@ try:
     from unittest.mock import Mock, MagicMock, PropertyMock, patch, call
 except ImportError:  # python 2.x support
     from mock import Mock, MagicMock, PropertyMock, patch, call
+try:
+    import asyncio
+except ImportError:  # python 2.x support
+    asyncio = None
+
+# asyncio clients require python 3
+REQUIRES_ASYNCIO = pytest.mark.skipif(asyncio is None, reason='requires asyncio (python 3)')
 
 __all__ = [
     'unittest',
@@ -14,5 +21,7 @@ __all__ = [
     'MagicMock',
     'PropertyMock',
     'patch',
-    'call'
+    'call',
+    'asyncio',
+    'REQUIRES_ASYNCIO'
 ]
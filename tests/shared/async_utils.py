@@ -0,0 +1,50 @@
+"""asyncio utility module for test framework
+
+Note
+----
+
+Requires python 3, import only when asyncio is available
+"""
+
+
+async def run_sequence(*functions):
+    """Run functions in order, on a single event loop
+
+    Parameters
+    ----------
+    *functions :
+        functions returning either an awaitable or an async iterable
+
+    Returns
+    -------
+    list
+        the result of each function, async iterables are collected into a list
+    """
+
+    results = []
+    for function in functions:
+        response = function()
+        if hasattr(response, '__aiter__'):
+            results.append([i async for i in response])
+        else:
+            results.append(await response)
+    return results
+
+
+def make_async(function):
+    """Wrap a (synchronous) function as a coroutine function, for mocks
+
+    Parameters
+    ----------
+    function : function
+        the function
+
+    Returns
+    -------
+    function
+        the coroutine function, returning the result of function
+    """
+
+    async def _function(*args, **kwargs):
+        return function(*args, **kwargs)
+    return _function
@@ -11,7 +11,7 @@ DEFAULT_API_ENDPOINT = 'api.cloudservices.f5.com'
 FULL_HOST = 'https://%s:%s' % (HOST, PORT)
 
 MOCK = {
-    'requests': 'requests.request'
+    'requests': 'requests.Session.request'
 }
 
 F5_CS = {
@@ -32,6 +32,11 @@ class MockRequestsResponse:
         """ Mock function """
         return [self.body]
 
+    @staticmethod
+    def close():
+        """ Mock function """
+        return None
+
 
 class ExecCommand(object):
     """ Mock exec_command response instance """
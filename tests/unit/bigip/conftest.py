@@ -2,7 +2,7 @@
 
 from f5sdk.bigip import ManagementClient
 
-from ...global_test_imports import pytest, Mock
+from ...global_test_imports import pytest, Mock, asyncio
 from ...shared import constants
 
 REQ = constants.MOCK['requests']
@@ -14,6 +14,13 @@ TOKEN = constants.TOKEN
 PORT = constants.PORT
 
 
+@pytest.fixture(autouse=True)
+def discovered_ports_fixture(mocker):
+    """ Test fixture: Empty (process-wide) discovered port cache"""
+
+    return mocker.patch.dict('f5sdk.bigip.mgmt_client._DISCOVERED_PORTS', clear=True)
+
+
 @pytest.fixture
 def mgmt_client(mocker):
     """ Test fixture: create mgmt client """
@@ -32,3 +39,23 @@ def mgmt_client(mocker):
         'skip_ready_check': True
     }
     return ManagementClient(HOST, **kwargs)
+
+
+@pytest.fixture
+def async_mgmt_client(mocker):
+    """ Test fixture: create (logged in) asyncio mgmt client """
+    from f5sdk.bigip import AsyncManagementClient
+
+    token_response = {
+        'token': {
+            'token': TOKEN,
+            'selfLink': 'https://localhost/mgmt/shared/authz/tokens/mytoken'
+        }
+    }
+    mocker.patch(REQ).return_value.json = Mock(return_value=token_response)
+
+    client = AsyncManagementClient(
+        HOST, user=USER, password=USER_PWD, port=PORT, skip_ready_check=True)
+    asyncio.run(client.login())
+    yield client
+    asyncio.run(client.close())
@@ -1,9 +1,11 @@
 """ Test BIG-IP DNS pools client """
 
 from f5sdk.bigip.dns import PoolsClient
+from f5sdk.utils.query_utils import Query
 
 from ....global_test_imports import pytest
 from ....shared import constants
+from ....shared import mock_utils
 from ... import utils
 
 REQ = constants.MOCK['requests']
@@ -28,3 +30,98 @@ class TestPoolsClient(object):
             client,
             mocker=mocker
         )
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_iter_list_next_link(mgmt_client, mocker):
+        """Test: iter_list() follows nextLink paging
+
+        Assertions
+        ----------
+        - All items, from all pages, should be yielded in order
+        - First page should be requested using $top/$skip
+        - Next page should be requested using the nextLink URI and query
+        """
+
+        mock_request = mocker.patch(REQ)
+        mock_request.side_effect = [
+            mock_utils.MockRequestsResponse({
+                'items': [{'name': 'pool1'}, {'name': 'pool2'}],
+                'nextLink': 'https://localhost/mgmt/tm/gtm/pool/a?$top=2&$skip=2&ver=14.1.0'
+            }),
+            mock_utils.MockRequestsResponse({'items': [{'name': 'pool3'}]})
+        ]
+
+        client = PoolsClient(mgmt_client, record_type='a')
+        items = list(client.iter_list(page_size=2, prefetch=True))
+
+        assert [i['name'] for i in items] == ['pool1', 'pool2', 'pool3']
+        assert mock_request.call_args_list[0][1]['params'] == {'$top': 2, '$skip': 0}
+        assert mock_request.call_args_list[1][0][1].endswith('/mgmt/tm/gtm/pool/a')
+        assert mock_request.call_args_list[1][1]['params'] == {
+            '$top': '2', '$skip': '2', 'ver': '14.1.0'}
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_iter_list_total_pages(mgmt_client, mocker):
+        """Test: iter_list() follows totalPages paging, lazily
+
+        Assertions
+        ----------
+        - Next page should not be requested until the current page is consumed
+        - Next page should be requested using $skip
+        - Iteration should stop after the last page
+        """
+
+        mock_request = mocker.patch(REQ)
+        mock_request.side_effect = [
+            mock_utils.MockRequestsResponse(
+                {'items': [{'name': 'pool1'}], 'pageIndex': 1, 'totalPages': 2}),
+            mock_utils.MockRequestsResponse(
+                {'items': [{'name': 'pool2'}], 'pageIndex': 2, 'totalPages': 2})
+        ]
+
+        items = PoolsClient(mgmt_client).iter_list(page_size=1)
+        assert next(items) == {'name': 'pool1'}
+        assert mock_request.call_count == 1
+        assert list(items) == [{'name': 'pool2'}]
+        assert mock_request.call_count == 2
+        assert mock_request.call_args_list[1][1]['params'] == {'$top': 1, '$skip': 1}
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_iter_list_single_page(mgmt_client, mocker):
+        """Test: iter_list() with a response without paging properties
+
+        Assertions
+        ----------
+        - Items should be yielded from a single request
+        """
+
+        mock_request = mocker.patch(REQ)
+        mock_request.return_value = mock_utils.MockRequestsResponse({'items': [{'name': 'pool1'}]})
+
+        assert list(PoolsClient(mgmt_client).iter_list()) == [{'name': 'pool1'}]
+        assert mock_request.call_count == 1
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_list_query(mgmt_client, mocker):
+        """Test: list() with a query (projection and filter)
+
+        Assertions
+        ----------
+        - Request should include $select and $filter
+        - Items should be returned as records
+        """
+
+        mock_request = mocker.patch(REQ)
+        mock_request.return_value = mock_utils.MockRequestsResponse(
+            {'items': [{'name': 'pool1', 'fullPath': '/Common/pool1'}]})
+
+        records = PoolsClient(mgmt_client).list(
+            query=Query().select('name', 'fullPath').filter('partition', 'Common'))
+
+        assert mock_request.call_args[1]['params'] == {
+            '$select': 'name,fullPath', '$filter': 'partition eq Common'}
+        assert [(i.name, i.fullPath) for i in records] == [('pool1', '/Common/pool1')]
@@ -1,27 +1,49 @@
 """ Test fixtures """
 
 import importlib
+import os
+
+from f5sdk.utils import cache_utils
 
 from ....global_test_imports import pytest
 
 
+@pytest.fixture(autouse=True)
+def artifact_cache_fixture(mocker, tmpdir):
+    """ Test fixture: Shared artifact cache, in a temporary directory"""
+
+    artifact_cache = cache_utils.ArtifactCache(cache_dir=str(tmpdir.join('cache')))
+    mocker.patch('f5sdk.utils.cache_utils._ARTIFACT_CACHE', artifact_cache)
+    return artifact_cache
+
+
+@pytest.fixture(autouse=True)
+def metadata_cache_fixture(mocker, tmpdir):
+    """ Test fixture: Empty extension metadata cache (process-wide and on-disk)"""
+
+    mocker.patch.dict(os.environ, {'F5_SDK_CACHE_DIR': str(tmpdir.join('cache'))})
+    return mocker.patch.dict(
+        'f5sdk.bigip.extension.extension_metadata._METADATA_CACHE', clear=True)
+
+
 @pytest.fixture(name="get_extension_client_class")
 def get_extension_client_class_fixture():
     """ Test fixture: Get Extension Client Class (Factory)"""
 
     def _func(**kwargs):
         component = kwargs.pop('component', 'as3')
+        prefix = 'Async' if kwargs.pop('use_async', False) else ''
 
         module = importlib.import_module('f5sdk.bigip.extension')
 
         if component == 'as3':
-            extension_client_class = getattr(module, 'AS3Client')
+            extension_client_class = getattr(module, prefix + 'AS3Client')
         elif component == 'do':
-            extension_client_class = getattr(module, 'DOClient')
+            extension_client_class = getattr(module, prefix + 'DOClient')
         elif component == 'ts':
-            extension_client_class = getattr(module, 'TSClient')
+            extension_client_class = getattr(module, prefix + 'TSClient')
         elif component == 'cf':
-            extension_client_class = getattr(module, 'CFClient')
+            extension_client_class = getattr(module, prefix + 'CFClient')
         else:
             raise Exception('Unknown component: {}'.format(component))
 
@@ -29,6 +51,7 @@ def get_extension_client_class_fixture():
 
     return _func
 
+
 @pytest.fixture(name="create_extension_client")
 @pytest.mark.usefixtures("get_extension_client_class")
 @pytest.mark.usefixtures("mgmt_client")
@@ -52,3 +75,21 @@ def create_extension_client_fixture(mgmt_client, get_extension_client_class):
         return extension_client_class(mgmt_client, **kwargs)
 
     return _func
+
+
+@pytest.fixture(name="create_async_extension_client")
+@pytest.mark.usefixtures("get_extension_client_class")
+@pytest.mark.usefixtures("async_mgmt_client")
+def create_async_extension_client_fixture(async_mgmt_client, get_extension_client_class):
+    """ Test fixture: Create asyncio Extension Client (Factory)"""
+
+    def _func(**kwargs):
+        component = kwargs.pop('component', 'as3')
+        version = kwargs.pop('version', None)
+
+        extension_client_class = get_extension_client_class(component=component, use_async=True)
+        if version is not None:
+            return extension_client_class(async_mgmt_client, version=version)
+        return extension_client_class(async_mgmt_client)
+
+    return _func
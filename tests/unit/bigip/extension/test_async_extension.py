@@ -0,0 +1,337 @@
+""" Test asyncio Extension Clients """
+
+import json
+
+from f5sdk import exceptions
+from f5sdk.utils import retry_utils
+
+from ....global_test_imports import pytest, Mock, asyncio, REQUIRES_ASYNCIO
+from ....shared import constants
+from ....shared import mock_utils
+from .utils import FIXED_INFO, create_idempotent_response
+
+REQUESTS = constants.MOCK['requests']
+
+
+@REQUIRES_ASYNCIO
+@pytest.mark.parametrize("component", ["as3", "do", "ts", "cf"])
+class TestAsyncExtensionClients(object):
+    """Test asyncio Extension Clients - Iterates through each parametrized component"""
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_install(component, create_async_extension_client, mocker):
+        """Test: install
+
+        Assertions
+        ----------
+        - install() response should equal component and version
+        """
+
+        extension_client = create_async_extension_client(
+            component=component,
+            version=FIXED_INFO[component]['version']
+        )
+
+        mock_conditions = [
+            {
+                'type': 'url',
+                'value': 'github.com',
+                'response': {'body': 'foo'.encode()}
+            },
+            {
+                'type': 'url',
+                'value': '/mgmt/shared/file-transfer/uploads',
+                'response': {'body': {'id': 'xxxx'}}
+            },
+            {
+                'type': 'url',
+                'value': '/mgmt/shared/iapp/package-management-tasks',
+                'response': {
+                    'body': {
+                        'id': 'xxxx',
+                        'status': 'FINISHED',
+                        'queryResponse': [
+                            {
+                                'name': FIXED_INFO[component]['name'],
+                                'packageName': FIXED_INFO[component]['package_name']
+                            }
+                        ]
+                    }
+                }
+            }
+        ]
+        mocker.patch(REQUESTS).side_effect = mock_utils.create_response(
+            {},
+            conditional=mock_conditions
+        )
+
+        assert asyncio.run(extension_client.package.install()) == {
+            'component': component,
+            'version': FIXED_INFO[component]['version']
+        }
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_install_idempotent(component, create_async_extension_client, mocker, tmpdir):
+        """Test: idempotent install, with the package file already on the device
+
+        Assertions
+        ----------
+        - The remote file should be checked
+        - The package should not be uploaded
+        """
+
+        extension_client = create_async_extension_client(
+            component=component,
+            version=FIXED_INFO[component]['version']
+        )
+        package_file = tmpdir.join('%s.rpm' % FIXED_INFO[component]['package_name'])
+        package_file.write('foo')
+        mock_request = mocker.patch(REQUESTS, side_effect=create_idempotent_response(
+            [],
+            '3\n2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae  %s\n' % (
+                package_file)
+        ))
+
+        asyncio.run(extension_client.package.install(
+            package_url='file://%s' % package_file,
+            idempotent=True
+        ))
+
+        called_uris = [i[0][1] for i in mock_request.call_args_list]
+        assert [i for i in called_uris if '/mgmt/tm/util/bash' in i]
+        assert not [i for i in mock_request.call_args_list if 'file-transfer/uploads' in i[0][1]]
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_install_login_required(component, create_async_extension_client):
+        """Test: install before the management client has logged in
+
+        Assertions
+        ----------
+        - install() should raise AuthRequiredError
+        """
+
+        extension_client = create_async_extension_client(component=component)
+        extension_client._client.client = None  # pylint: disable=protected-access
+
+        with pytest.raises(exceptions.AuthRequiredError):
+            asyncio.run(extension_client.package.install())
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_uninstall(component, create_async_extension_client, mocker):
+        """Test: uninstall
+
+        Assertions
+        ----------
+        - uninstall() response should equal component and version
+        - UNINSTALL task should be created for the installed package
+        """
+
+        extension_client = create_async_extension_client(
+            component=component,
+            version=FIXED_INFO[component]['version']
+        )
+
+        mock_request = mocker.patch(REQUESTS)
+        mock_request.side_effect = mock_utils.create_response({
+            'id': 'xxxx',
+            'status': 'FINISHED',
+            'queryResponse': [
+                {
+                    'name': FIXED_INFO[component]['name'],
+                    'packageName': FIXED_INFO[component]['package_name']
+                }
+            ]
+        })
+
+        assert asyncio.run(extension_client.package.uninstall()) == {
+            'component': component,
+            'version': FIXED_INFO[component]['version']
+        }
+        _, kwargs = mock_request.call_args_list[2]
+        assert json.loads(kwargs['data']) == {
+            'operation': 'UNINSTALL',
+            'packageName': FIXED_INFO[component]['package_name']
+        }
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_is_installed(component, create_async_extension_client, mocker):
+        """Test: is_installed (not installed)
+
+        Assertions
+        ----------
+        - is_installed() response should have installed=False
+        """
+
+        extension_client = create_async_extension_client(component=component)
+
+        mocker.patch(REQUESTS).side_effect = mock_utils.create_response({
+            'id': 'xxxx',
+            'status': 'FINISHED',
+            'queryResponse': []
+        })
+
+        assert not asyncio.run(extension_client.package.is_installed())['installed']
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_create(component, create_async_extension_client, mocker):
+        """Test: create
+
+        Assertions
+        ----------
+        - create() response should equal requests response
+        """
+
+        extension_client = create_async_extension_client(component=component)
+
+        mock_response = {'message': 'success'}
+        mocker.patch(REQUESTS).return_value.json = Mock(return_value=mock_response)
+
+        assert asyncio.run(
+            extension_client.service.create(config={'config': 'foo'})) == mock_response
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_create_async(component, create_async_extension_client, mocker):
+        """Test: create async (202 accepted) response
+
+        Assertions
+        ----------
+        - create() response should equal task requests response
+        - make_request() second call uri should equal task uri
+        """
+
+        extension_client = create_async_extension_client(component=component)
+
+        mock_response = {'foo': 'bar'}
+        make_request_mock = mocker.patch(
+            'f5sdk.utils.http_utils.make_request',
+            side_effect=[({'selfLink': 'https://localhost/foo/1234'}, 202), (mock_response, 200)]
+        )
+
+        response = asyncio.run(extension_client.service.create(config={'foo': 'bar'}))
+        assert response == mock_response
+        assert make_request_mock.call_count == 2
+        args, _ = make_request_mock.call_args_list[1]
+        assert args[1] == '/foo/1234'
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_is_available(component, create_async_extension_client, mocker):
+        """Test: is_available
+
+        Assertions
+        ----------
+        - is_available() response should be boolean (True)
+        """
+
+        extension_client = create_async_extension_client(component=component)
+
+        mocker.patch(REQUESTS).return_value.json = Mock(return_value={'message': 'success'})
+
+        assert asyncio.run(extension_client.service.is_available())
+
+
+@REQUIRES_ASYNCIO
+class TestAsyncComponentServiceClients(object):
+    """Test asyncio component specific service clients """
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_as3_delete(create_async_extension_client, mocker):
+        """Test: AS3 delete
+
+        Assertions
+        ----------
+        - delete() response should equal requests response
+        """
+
+        extension_client = create_async_extension_client(component='as3')
+
+        mock_response = {'message': 'success'}
+        mocker.patch(REQUESTS).return_value.json = Mock(return_value=mock_response)
+
+        assert asyncio.run(extension_client.service.delete()) == mock_response
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_do_show_inspect(create_async_extension_client, mocker):
+        """Test: DO show_inspect with query parameters
+
+        Assertions
+        ----------
+        - show_inspect() request uri should include query parameters
+        """
+
+        extension_client = create_async_extension_client(component='do')
+
+        mock_request = mocker.patch(REQUESTS)
+        mock_request.return_value.json = Mock(return_value={'message': 'success'})
+
+        asyncio.run(
+            extension_client.service.show_inspect(query_parameters={'targetHost': '1.2.3.4'}))
+        args, _ = mock_request.call_args
+        assert args[1].endswith('/mgmt/shared/declarative-onboarding/inspect?targetHost=1.2.3.4')
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_cf_trigger_and_reset(create_async_extension_client, mocker):
+        """Test: CF trigger, show_trigger and reset
+
+        Assertions
+        ----------
+        - trigger(), show_trigger() and reset() responses should equal requests response
+        """
+
+        extension_client = create_async_extension_client(component='cf')
+
+        mock_response = {'message': 'success'}
+        mocker.patch(REQUESTS).return_value.json = Mock(return_value=mock_response)
+
+        assert asyncio.run(extension_client.service.trigger()) == mock_response
+        assert asyncio.run(extension_client.service.show_trigger()) == mock_response
+        assert asyncio.run(extension_client.service.reset()) == mock_response
+
+
+@REQUIRES_ASYNCIO
+class TestAsyncPackageTaskStatus(object):
+    """Test asyncio package management task status polling """
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_async_extension_client")
+    def test_check_rpm_task_status(create_async_extension_client, mocker):
+        """Test: task status is polled using the retry policy
+
+        Assertions
+        ----------
+        - Task status should be polled until the task is finished
+        - Each delay should be at most RPM_TASK_STATUS['DELAY_IN_SECS'], without blocking
+        - Retry metrics should count the polls
+        """
+
+        retry_utils.reset_retry_metrics()
+        extension_client = create_async_extension_client(component='as3')
+        mocker.patch(REQUESTS).side_effect = [
+            mock_utils.MockRequestsResponse({'id': 'xxxx', 'status': i})
+            for i in ['STARTED', 'STARTED', 'FINISHED']
+        ]
+        delays = []
+
+        async def _sleep(delay):
+            delays.append(delay)
+        mocker.patch('asyncio.sleep', side_effect=_sleep)
+
+        # pylint: disable=protected-access
+        response = asyncio.run(extension_client.package._check_rpm_task_status('xxxx'))
+
+        assert response['status'] == 'FINISHED'
+        assert len(delays) == 2
+        assert max(delays) <= 1
+        metrics = retry_utils.get_retry_metrics('package.check_rpm_task_status')
+        assert metrics['retries'] == 2
+        assert metrics['successes'] == 1
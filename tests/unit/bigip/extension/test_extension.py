@@ -1,4 +1,4 @@
-""" Test AS3 Client """
+""" Test Extension Clients """
 
 import json
 import tempfile
@@ -6,63 +6,14 @@ import shutil
 from os import path
 
 from f5sdk import exceptions
-from f5sdk.utils import http_utils
+from f5sdk.utils import http_utils, json_utils
 
 from ....global_test_imports import pytest, Mock, PropertyMock
 from ....shared import constants
 from ....shared import mock_utils
+from .utils import EXAMPLE_EXTENSION_METADATA, FIXED_INFO
 
 REQUESTS = constants.MOCK['requests']
-EXAMPLE_VERSION_INFO = {
-    'x.x.x': {
-        'latest': True
-    },
-    'x.x.y': {
-        'latest': False
-    }
-}
-EXAMPLE_EXTENSION_METADATA = {
-    'components': {
-        'as3': {
-            'versions': EXAMPLE_VERSION_INFO
-        },
-        'do': {
-            'versions': EXAMPLE_VERSION_INFO
-        },
-        'ts': {
-            'versions': EXAMPLE_VERSION_INFO
-        },
-        'cf': {
-            'versions': EXAMPLE_VERSION_INFO
-        }
-    }
-}
-FIXED_INFO = {
-    'as3': {
-        'version': '3.10.0',
-        'name': 'f5-appsvcs',
-        'package_name': 'f5-appsvcs-3.10.0-5.noarch',
-        'previous_version': '3.9.0',
-    },
-    'do': {
-        'version': '1.10.0',
-        'name': 'f5-declarative-onboarding',
-        'package_name': 'f5-declarative-onboarding-1.10.0-2.noarch',
-        'previous_version': '1.9.0',
-    },
-    'ts': {
-        'version': '1.10.0',
-        'name': 'f5-telemetry',
-        'package_name': 'f5-telemetry-1.10.0-2.noarch',
-        'previous_version': '1.9.0',
-    },
-    'cf': {
-        'version': '1.1.0',
-        'name': 'f5-cloud-failover',
-        'package_name': 'f5-cloud-failover-1.1.0-0.noarch',
-        'previous_version': '1.0.0',
-    }
-}
 
 
 # pylint: disable=too-many-public-methods
@@ -300,6 +251,44 @@ class TestExtensionClients(object):
             'version': FIXED_INFO[component]['version']
         }
 
+    @staticmethod
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_install_downloads_once(component, create_extension_client, mocker):
+        """Test: install (repeated, such as across devices) downloads the package once
+
+        Assertions
+        ----------
+        - download_to_file() should be called once
+        """
+
+        extension_client = create_extension_client(
+            component=component,
+            version=FIXED_INFO[component]['version']
+        )
+
+        mocker.patch(REQUESTS).return_value.json = Mock(
+            return_value={
+                'id': 'xxxx',
+                'status': 'FINISHED',
+                'queryResponse': [
+                    {
+                        'name': FIXED_INFO[component]['name'],
+                        'packageName': FIXED_INFO[component]['package_name']
+                    }
+                ]
+            }
+        )
+
+        def _download(url, file_name):  # pylint: disable=unused-argument
+            with open(file_name, 'wb') as _f:
+                _f.write(b'foo')
+        mock_download = mocker.patch(
+            "f5sdk.utils.http_utils.download_to_file", side_effect=_download)
+
+        extension_client.package.install()
+        extension_client.package.install()
+        assert mock_download.call_count == 1
+
     @staticmethod
     @pytest.mark.usefixtures("create_extension_client")
     def test_install_package_url_invalid(component, create_extension_client):
@@ -636,6 +625,31 @@ class TestExtensionClients(object):
 
         assert extension_client.service.create(config_file=config_file) == mock_response
 
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_create_prepared(self, component, create_extension_client, mocker):
+        """Test: create with a pre-serialized config, and config file
+
+        Assertions
+        ----------
+        - Prepared config should be sent as-is
+        - Config file should be sent as-is (not parsed and re-encoded)
+        """
+
+        extension_client = create_extension_client(component=component)
+
+        mock_request = mocker.patch(REQUESTS)
+        mock_request.return_value.json = Mock(return_value={'message': 'success'})
+
+        body = json_utils.PreparedBody({'config': 'foo'})
+        extension_client.service.create(config=body)
+        assert mock_request.call_args[1]['data'] is body.data
+
+        config_file = path.join(self.test_tmp_dir, 'config.json')
+        with open(config_file, 'wb') as _f:
+            _f.write(b'{ "config" : "foo" }')
+        extension_client.service.create(config_file=config_file)
+        assert mock_request.call_args[1]['data'] == b'{ "config" : "foo" }'
+
     @staticmethod
     @pytest.mark.usefixtures("create_extension_client")
     def test_create_no_config(component, create_extension_client):
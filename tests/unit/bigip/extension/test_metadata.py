@@ -0,0 +1,119 @@
+""" Test Extension Metadata """
+
+import json
+
+from f5sdk.bigip.extension.extension_metadata import MetadataClient
+
+from ....shared import constants
+from ....shared import mock_utils
+from .utils import EXAMPLE_EXTENSION_METADATA
+
+REQUESTS = constants.MOCK['requests']
+
+
+class TestMetadataCache(object):
+    """Test process-wide extension metadata (cache) """
+
+    @staticmethod
+    def test_local_metadata_loaded_once(mocker):
+        """Test: local metadata is loaded once, and reloaded when modified
+
+        Assertions
+        ----------
+        - Metadata file should be parsed once for many metadata clients
+        - Metadata file should be parsed again once its mtime changes
+        """
+
+        mock_loads = mocker.patch(
+            'f5sdk.bigip.extension.extension_metadata.json_utils.decode', side_effect=json.loads)
+
+        for component in ['as3', 'do', 'ts', 'cf'] * 10:
+            MetadataClient(component, None)
+        assert mock_loads.call_count == 1
+
+        mock_stat = mocker.patch('f5sdk.bigip.extension.extension_metadata.os.stat')
+        mock_stat.return_value.st_mtime = 0
+        MetadataClient('as3', None)
+        assert mock_loads.call_count == 2
+
+    @staticmethod
+    def test_index():
+        """Test: metadata index lookups
+
+        Assertions
+        ----------
+        - get_latest_version() should be the version flagged latest
+        - get_versions_list() should be sorted by version, latest first
+        - get_component_package_name() should be the package name prefix
+        """
+
+        metadata_client = MetadataClient('as3', '3.10.0')
+        versions = metadata_client.get_versions_list()
+
+        assert metadata_client.get_latest_version() == versions[0]
+        assert versions == sorted(
+            versions, key=lambda v: [int(i) for i in v.split('.')], reverse=True)
+        assert metadata_client.get_component_package_name() == 'f5-appsvcs'
+
+    @staticmethod
+    def test_remote_metadata_revalidated(mocker):
+        """Test: CDN metadata is revalidated using the ETag
+
+        Assertions
+        ----------
+        - CDN should be requested once within the revalidate interval
+        - CDN should be revalidated with If-None-Match once the interval passes
+        - Cached metadata should be used if not modified (304)
+        """
+
+        response = mock_utils.MockRequestsResponse(EXAMPLE_EXTENSION_METADATA)
+        response.headers = {'etag': '"1"'}
+        mock_request = mocker.patch(REQUESTS, return_value=response)
+        mock_time = mocker.patch('time.time', return_value=100)
+
+        assert MetadataClient('as3', None, use_latest_metadata=True).version == 'x.x.x'
+        assert MetadataClient('do', None, use_latest_metadata=True).version == 'x.x.x'
+        assert mock_request.call_count == 1
+
+        not_modified = mock_utils.MockRequestsResponse(None)
+        not_modified.status_code = 304
+        mock_request.return_value = not_modified
+        mock_time.return_value = 1000
+
+        assert MetadataClient('as3', None, use_latest_metadata=True).version == 'x.x.x'
+        assert mock_request.call_count == 2
+        assert mock_request.call_args[1]['headers']['If-None-Match'] == '"1"'
+
+
+    @staticmethod
+    def test_remote_metadata_disk_cache(mocker):
+        """Test: CDN metadata is shared using the on-disk cache
+
+        Assertions
+        ----------
+        - CDN should not be requested by another process within max age
+        - CDN should be revalidated with If-Modified-Since once older than max age
+        - Stale cached metadata should be used if the CDN request fails
+        """
+
+        response = mock_utils.MockRequestsResponse(EXAMPLE_EXTENSION_METADATA)
+        response.headers = {'last-modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+        mock_request = mocker.patch(REQUESTS, return_value=response)
+        mock_time = mocker.patch('time.time', return_value=100)
+
+        MetadataClient('as3', None, use_latest_metadata=True)
+        # simulate another process: empty process-wide cache
+        mocker.patch.dict(
+            'f5sdk.bigip.extension.extension_metadata._METADATA_CACHE', clear=True)
+        assert MetadataClient('as3', None, use_latest_metadata=True).version == 'x.x.x'
+        assert mock_request.call_count == 1
+
+        mocker.patch.dict(
+            'f5sdk.bigip.extension.extension_metadata._METADATA_CACHE', clear=True)
+        mock_request.side_effect = Exception('Error')
+        mock_time.return_value = 1000
+
+        assert MetadataClient('as3', None, use_latest_metadata=True, max_age=60).version == 'x.x.x'
+        assert mock_request.call_count == 2
+        assert mock_request.call_args[1]['headers']['If-Modified-Since'] == \
+            'Wed, 21 Oct 2015 07:28:00 GMT'
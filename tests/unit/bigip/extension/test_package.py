@@ -0,0 +1,330 @@
+""" Test Extension Package Clients """
+
+import shlex
+from os import path
+
+from f5sdk import constants as project_constants
+from f5sdk import exceptions
+from f5sdk.bigip.extension.package.inventory import PackageInventory
+from f5sdk.bigip.extension.package.operation import OperationClient
+from f5sdk.utils import retry_utils
+
+from ....global_test_imports import pytest, Mock
+from ....shared import constants
+from ....shared import mock_utils
+from .utils import FIXED_INFO, create_idempotent_response, get_posted_operations
+
+REQUESTS = constants.MOCK['requests']
+
+
+@pytest.mark.parametrize("component", ["as3", "do", "ts", "cf"])
+class TestPackageIdempotentInstall(object):
+    """Test idempotent package install - Iterates through each parametrized component"""
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_install_idempotent_installed(component, create_extension_client, mocker):
+        """Test: idempotent install, with the package already installed
+
+        Assertions
+        ----------
+        - install() response should equal component and installed version
+        - The package should not be downloaded, uploaded or installed
+        """
+
+        extension_client = create_extension_client(
+            component=component,
+            version=FIXED_INFO[component]['version']
+        )
+        mock_request = mocker.patch(REQUESTS, side_effect=create_idempotent_response([{
+            'name': FIXED_INFO[component]['name'],
+            'packageName': FIXED_INFO[component]['package_name']
+        }], ''))
+        mock_download = mocker.patch("f5sdk.utils.http_utils.download_to_file")
+
+        assert extension_client.package.install(idempotent=True) == {
+            'component': component,
+            'version': FIXED_INFO[component]['version']
+        }
+        assert mock_download.call_count == 0
+        assert get_posted_operations(mock_request) == ['QUERY']
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_install_idempotent_uploaded(component, create_extension_client,
+                                         mocker, tmpdir):
+        """Test: idempotent install, with the package file already on the device
+
+        Assertions
+        ----------
+        - The package should not be uploaded
+        - The package should be installed
+        """
+
+        extension_client = create_extension_client(
+            component=component,
+            version=FIXED_INFO[component]['version']
+        )
+        package_file = tmpdir.join('%s.rpm' % FIXED_INFO[component]['package_name'])
+        package_file.write('foo')
+        mock_request = mocker.patch(REQUESTS, side_effect=create_idempotent_response(
+            [],
+            '3\n2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e886266e7ae  %s\n' % (
+                package_file)
+        ))
+
+        extension_client.package.install(package_url='file://%s' % package_file, idempotent=True)
+
+        called_uris = [i[0][1] for i in mock_request.call_args_list]
+        assert not [i for i in called_uris if 'file-transfer/uploads' in i]
+        assert get_posted_operations(mock_request) == ['QUERY', 'run', 'INSTALL', 'QUERY']
+
+    @staticmethod
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_install_idempotent_upload_changed(component, create_extension_client,
+                                               mocker, tmpdir):
+        """Test: idempotent install, with a different package file on the device
+
+        Assertions
+        ----------
+        - The package should be uploaded
+        """
+
+        extension_client = create_extension_client(
+            component=component,
+            version=FIXED_INFO[component]['version']
+        )
+        package_file = tmpdir.join('%s.rpm' % FIXED_INFO[component]['package_name'])
+        package_file.write('foo')
+        mock_request = mocker.patch(REQUESTS, side_effect=create_idempotent_response(
+            [], '3\n%s  %s\n' % ('0' * 64, package_file)
+        ))
+
+        extension_client.package.install(package_url='file://%s' % package_file, idempotent=True)
+
+        called_uris = [i[0][1] for i in mock_request.call_args_list]
+        assert [i for i in called_uris if 'file-transfer/uploads' in i]
+
+
+class TestPackageUpload(object):
+    """Test package (RPM) upload """
+
+    @staticmethod
+    def _create_file(tmpdir, size):
+        file_name = str(tmpdir.join('pkg.rpm'))
+        with open(file_name, 'wb') as file_object:
+            file_object.write(bytearray(i % 256 for i in range(size)))
+        return file_name
+
+    @staticmethod
+    def _mock_upload(mocker, responses):
+        """Mock upload requests, recording each Content-Range and body"""
+
+        uploads = []
+        responses = iter(responses)
+
+        def _request(*args, **kwargs):  # pylint: disable=unused-argument
+            uploads.append((kwargs['headers']['Content-Range'], bytes(kwargs['data'])))
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return mock_utils.MockRequestsResponse(response)
+
+        mocker.patch(REQUESTS).side_effect = _request
+        return uploads
+
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_upload_rpm(self, create_extension_client, mocker, tmpdir):
+        """Test: upload RPM in slices
+
+        Assertions
+        ----------
+        - Each slice should be uploaded with the correct Content-Range
+        - The uploaded slices should equal the file contents
+        """
+        # pylint: disable=protected-access
+
+        file_name = self._create_file(tmpdir, 2560)
+        uploads = self._mock_upload(mocker, [{}, {}, {}])
+
+        package_client = create_extension_client(component='as3').package
+        package_client._upload_rpm(file_name, delete_file=False, chunk_size=1024)
+
+        assert [i[0] for i in uploads] == ['0-1023/2560', '1024-2047/2560', '2048-2559/2560']
+        with open(file_name, 'rb') as file_object:
+            assert b''.join([i[1] for i in uploads]) == file_object.read()
+
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_upload_rpm_resume(self, create_extension_client, mocker, tmpdir):
+        """Test: interrupted upload should resume from the last acknowledged offset
+
+        Assertions
+        ----------
+        - Failed slice should be retried from the same offset, after a backoff delay
+        - Upload should continue from the offset acknowledged by the device
+        """
+        # pylint: disable=protected-access
+
+        retry_utils.reset_retry_metrics()
+        mock_sleep = mocker.patch('time.sleep')
+        file_name = self._create_file(tmpdir, 2560)
+        uploads = self._mock_upload(mocker, [
+            {'remainingByteCount': 2048},
+            exceptions.HTTPError('connection reset'),
+            {},
+            {}
+        ])
+
+        package_client = create_extension_client(component='as3').package
+        package_client._upload_rpm(file_name, delete_file=False, chunk_size=1024)
+
+        assert [i[0] for i in uploads] == [
+            '0-1023/2560', '512-1535/2560', '512-1535/2560', '1536-2559/2560'
+        ]
+        assert mock_sleep.call_count == 1
+        assert 0 <= mock_sleep.call_args[0][0] \
+            <= project_constants.RETRY_POLICY['INITIAL_DELAY_IN_SECS']
+        metrics = retry_utils.get_retry_metrics('package.upload_slice')
+        assert (metrics['calls'], metrics['retries']) == (3, 1)
+
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_upload_rpm_retries_exceeded(self, create_extension_client, mocker, tmpdir):
+        """Test: upload should fail once retries are exhausted
+
+        Assertions
+        ----------
+        - HTTPError should be raised
+        - Local file should not be deleted
+        """
+        # pylint: disable=protected-access
+
+        mocker.patch('time.sleep')
+        file_name = self._create_file(tmpdir, 10)
+        self._mock_upload(mocker, [exceptions.HTTPError('connection reset')] * 3)
+
+        package_client = create_extension_client(component='as3').package
+        with pytest.raises(exceptions.HTTPError):
+            package_client._upload_rpm(file_name, chunk_size=1024)
+        assert path.exists(file_name)
+
+
+class TestPackageInventory(object):
+    """Test installed package inventory (cache) """
+
+    @staticmethod
+    def _mock_query(mocker):
+        """Mock package management requests, installed packages include AS3 and DO"""
+
+        mock_request = mocker.patch(REQUESTS)
+        mock_request.side_effect = mock_utils.create_response({}, conditional=[{
+            'type': 'url',
+            'value': '/mgmt/shared/iapp/package-management-tasks',
+            'response': {'body': {
+                'id': 'xxxx',
+                'status': 'FINISHED',
+                'queryResponse': [
+                    {'name': FIXED_INFO[i]['name'], 'packageName': FIXED_INFO[i]['package_name']}
+                    for i in ['as3', 'do']
+                ]
+            }}
+        }])
+        return mock_request
+
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_query_shared(self, create_extension_client, mocker):
+        """Test: one QUERY serves all components
+
+        Assertions
+        ----------
+        - is_installed() should be correct for each component
+        - One QUERY task should be created
+        """
+
+        mock_request = self._mock_query(mocker)
+
+        installed = [create_extension_client(component=i).package.is_installed()['installed']
+                     for i in ['as3', 'do', 'ts', 'cf']]
+
+        assert installed == [True, True, False, False]
+        assert get_posted_operations(mock_request) == ['QUERY']
+
+    @pytest.mark.usefixtures("create_extension_client")
+    def test_invalidate_after_uninstall(self, create_extension_client, mocker):
+        """Test: UNINSTALL task invalidates the inventory
+
+        Assertions
+        ----------
+        - A QUERY task should be created after the UNINSTALL task
+        """
+
+        mock_request = self._mock_query(mocker)
+        package_client = create_extension_client(component='as3').package
+
+        package_client.uninstall()
+        package_client.is_installed()
+
+        assert get_posted_operations(mock_request) == ['QUERY', 'UNINSTALL', 'QUERY']
+
+    @staticmethod
+    def test_ttl(mocker):
+        """Test: inventory expires after the TTL
+
+        Assertions
+        ----------
+        - The query function should be called once within the TTL
+        - The query function should be called again once expired
+        """
+
+        mock_time = mocker.patch('time.time', return_value=100)
+        query = Mock(return_value={'queryResponse': []})
+        inventory = PackageInventory(ttl=30)
+
+        inventory.get(query)
+        inventory.get(query)
+        assert query.call_count == 1
+
+        mock_time.return_value = 131
+        inventory.get(query)
+        assert query.call_count == 2
+
+    @staticmethod
+    def test_set_discarded_after_invalidate():
+        """Test: QUERY response started before an invalidation is discarded
+
+        Assertions
+        ----------
+        - get_cached() should return None
+        """
+
+        inventory = PackageInventory()
+        generation = inventory.generation
+        inventory.invalidate()
+        inventory.set({'queryResponse': []}, generation=generation)
+
+        assert inventory.get_cached() is None
+
+
+class TestPackageRemoteFile(object):
+    """Test remote package file information """
+
+    @staticmethod
+    def test_remote_file_info_body_quoted():
+        """Test: remote file info command, with shell metacharacters in the file name
+
+        Assertions
+        ----------
+        - The file name should be passed to each command as a single (quoted) word
+        """
+
+        remote_file = "/var/config/rest/downloads/it's a; reboot.rpm"
+
+        # pylint: disable=protected-access
+        body = OperationClient._get_remote_file_info_body(remote_file)
+        option, script = shlex.split(body['utilCmdArgs'])
+
+        assert option == '-c'
+        assert shlex.split(script) == [
+            'test', '-f', remote_file, '&&',
+            'stat', '-c', '%s', remote_file, '&&',
+            'sha256sum', remote_file
+        ]
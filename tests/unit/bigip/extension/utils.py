@@ -0,0 +1,103 @@
+"""Utility module for bigip extension test cases """
+
+import json
+
+# local test imports
+from ....shared import mock_utils
+
+EXAMPLE_VERSION_INFO = {
+    'x.x.x': {
+        'latest': True
+    },
+    'x.x.y': {
+        'latest': False
+    }
+}
+EXAMPLE_EXTENSION_METADATA = {
+    'components': {
+        'as3': {
+            'versions': EXAMPLE_VERSION_INFO
+        },
+        'do': {
+            'versions': EXAMPLE_VERSION_INFO
+        },
+        'ts': {
+            'versions': EXAMPLE_VERSION_INFO
+        },
+        'cf': {
+            'versions': EXAMPLE_VERSION_INFO
+        }
+    }
+}
+FIXED_INFO = {
+    'as3': {
+        'version': '3.10.0',
+        'name': 'f5-appsvcs',
+        'package_name': 'f5-appsvcs-3.10.0-5.noarch',
+        'previous_version': '3.9.0',
+    },
+    'do': {
+        'version': '1.10.0',
+        'name': 'f5-declarative-onboarding',
+        'package_name': 'f5-declarative-onboarding-1.10.0-2.noarch',
+        'previous_version': '1.9.0',
+    },
+    'ts': {
+        'version': '1.10.0',
+        'name': 'f5-telemetry',
+        'package_name': 'f5-telemetry-1.10.0-2.noarch',
+        'previous_version': '1.9.0',
+    },
+    'cf': {
+        'version': '1.1.0',
+        'name': 'f5-cloud-failover',
+        'package_name': 'f5-cloud-failover-1.1.0-0.noarch',
+        'previous_version': '1.0.0',
+    }
+}
+
+
+def create_idempotent_response(query_response, bash_response):
+    """Create mock requests.request side effect for an idempotent install
+
+    Parameters
+    ----------
+    query_response : list
+        the package management task query response (installed packages)
+    bash_response : str
+        the bash command result (remote package file info)
+
+    Returns
+    -------
+    function
+        requests.request side effect
+    """
+
+    def _func(*args, **kwargs):  # pylint: disable=unused-argument
+        if '/mgmt/tm/util/bash' in args[1]:
+            body = {'commandResult': bash_response}
+        elif 'file-transfer/uploads' in args[1]:
+            body = {}
+        else:
+            body = {'id': 'xxxx', 'status': 'FINISHED', 'queryResponse': query_response}
+        return mock_utils.MockRequestsResponse(body)
+    return _func
+
+
+def get_posted_operations(mock_request):
+    """Get the operation (or command) of each JSON POST request
+
+    Parameters
+    ----------
+    mock_request : obj
+        the requests.request mock
+
+    Returns
+    -------
+    list
+        the operation (or command) of each JSON POST request, in order
+    """
+
+    bodies = [json.loads(i[1]['data']) for i in mock_request.call_args_list
+              if i[0][0] == 'post' and i[1]['headers'].get('Content-Type') == 'application/json']
+    return [i.get('operation', i.get('command')) for i in bodies]
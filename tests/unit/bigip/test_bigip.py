@@ -1,13 +1,18 @@
 """ Test BIG-IP module """
 
 import base64
+import json
 import socket
 import os
+import time
+from datetime import datetime, timedelta
 from paramiko import ssh_exception
 from f5sdk import exceptions
 from f5sdk import constants as project_constants
+from f5sdk.bigip import ManagementClient
+from f5sdk.utils import cache_utils, http_utils, retry_utils, ssh_utils
 
-from ...global_test_imports import pytest, Mock, PropertyMock, call
+from ...global_test_imports import pytest, Mock, PropertyMock, call, asyncio, REQUIRES_ASYNCIO
 
 from ...shared import constants
 from ...shared import mock_utils
@@ -31,20 +36,6 @@ TOKEN_RESPONSE = {
 
 class TestBigIp(object):
     """Test Class: bigip module """
-
-    @classmethod
-    def setup_class(cls):
-        """" Setup func """
-
-        with open(os.path.join(os.path.dirname(__file__), 'sample_rsa_key')) as _f:
-            _file = _f.read()
-
-        cls.private_key = base64.b64decode(_file).decode('utf-8')
-
-    @classmethod
-    def teardown_class(cls):
-        """" Teardown func """
-
     @staticmethod
     @pytest.mark.usefixtures("mgmt_client")
     def test_mgmt_client(mgmt_client):
@@ -57,94 +48,6 @@ class TestBigIp(object):
 
         assert mgmt_client.token == TOKEN
 
-    @staticmethod
-    def test_mgmt_client_with_incorrect_creds(mocker):
-        """Test: Initialize mgmt client with wrong credentials
-
-        Assertions
-        ----------
-        - Mgmt client throws exception InvalidAuthError
-        """
-        mocker.patch(REQ).side_effect = exceptions.HTTPError(constants.FAILED_AUTHENTICATION)
-        with pytest.raises(exceptions.InvalidAuthError):
-            BigIpUtils.get_mgmt_client(user=USER, pwd=USER_PWD)
-
-    @staticmethod
-    def test_mgmt_client_with_bad_initial_request(mocker):
-        """Test: Initialize mgmt client with bad request on first call,
-        followed by valid token response and then token refresh should succeed
-
-        Assertions
-        ----------
-        - Mgmt client is initialized successfully
-        """
-
-        mocker.patch(REQ).side_effect = [
-            exceptions.HTTPError(constants.BAD_REQUEST_BODY),
-            mock_utils.MockRequestsResponse(TOKEN_RESPONSE),
-            mock_utils.MockRequestsResponse({})
-        ]
-
-        mgmt_client = BigIpUtils.get_mgmt_client(user=USER, pwd=USER_PWD)
-        assert mgmt_client.token == TOKEN
-
-    def test_mgmt_client_key_auth(self, mocker):
-        """Test: Initialize mgmt client using key-based auth
-
-        Assertions
-        ----------
-        - Mock ssh client instance exec_command should start with 'tmsh modify'
-        - Device instance token should match 'TOKEN'
-        """
-
-        mocker.patch(REQ).return_value.json = Mock(return_value=TOKEN_RESPONSE)
-        mock_ssh_client_instance = mock_utils.create_ssh_client(
-            mocker.patch('paramiko.SSHClient'),
-            'auth user %s { description user shell bash }' % (USER)
-        )
-        mocker.patch('paramiko.rsakey.open', mocker.mock_open(read_data=self.private_key))
-        mocker.patch('paramiko.pkey.open', mocker.mock_open(read_data=self.private_key))
-
-        device = BigIpUtils.get_mgmt_client(
-            user=USER, pwd=USER_PWD, private_key_file='foo')
-
-        calls = [
-            call(' list auth user %s' % (USER)),
-            call('tmsh modify auth user %s password %s' % (USER, USER_PWD))
-        ]
-        mock_ssh_client_instance.exec_command.assert_has_calls(calls)
-        assert device.token == TOKEN
-
-    def test_mgmt_client_key_auth_bash(self, mocker):
-        """Test: Initialize mgmt client using key-based auth - 'shell bash'
-
-        'list auth user <user>' command response containing 'shell tmsh' means
-        command should NOT start with 'tmsh'
-
-        Assertions
-        ----------
-        - Mock ssh client instance exec_command should start with ' modify'
-        - Device instance token should match 'TOKEN'
-        """
-
-        mocker.patch(REQ).return_value.json = Mock(return_value=TOKEN_RESPONSE)
-        mock_ssh_client_instance = mock_utils.create_ssh_client(
-            mocker.patch('paramiko.SSHClient'),
-            'auth user %s { description user shell tmsh }' % (USER)
-        )
-        mocker.patch('paramiko.rsakey.open', mocker.mock_open(read_data=self.private_key))
-        mocker.patch('paramiko.pkey.open', mocker.mock_open(read_data=self.private_key))
-
-        device = BigIpUtils.get_mgmt_client(
-            user=USER, pwd=USER_PWD, private_key_file='foo')
-
-        calls = [
-            call(' list auth user %s' % (USER)),
-            call(' modify auth user %s password %s' % (USER, USER_PWD))
-        ]
-        mock_ssh_client_instance.exec_command.assert_has_calls(calls)
-        assert device.token == TOKEN
-
     @staticmethod
     def test_port_discovery(mocker):
         """Test: Port discovery during mgmt client init
@@ -190,6 +93,48 @@ class TestBigIp(object):
         mock_socket.connect.assert_called()
         assert device.port == DFL_MGMT_PORT
 
+    @staticmethod
+    def test_port_discovery_1nic(mocker):
+        """Test: Port discovery - only 8443 accepts connections
+
+        Assertions
+        ----------
+        - Device port should be 8443
+        - Discovered port should be cached, no further connections made
+        """
+
+        def _connect(address):
+            if address[1] == 443:
+                raise OSError
+        mock_socket = mocker.patch('socket.socket').return_value
+        mock_socket.connect.side_effect = _connect
+
+        device = BigIpUtils.get_mgmt_client(token=TOKEN, port=None)
+        assert device.port == 8443
+
+        mock_socket.connect.reset_mock()
+        device = BigIpUtils.get_mgmt_client(token=TOKEN, port=None)
+        assert device.port == 8443
+        mock_socket.connect.assert_not_called()
+
+    @staticmethod
+    def test_port_discovery_prefers_default_port(mocker):
+        """Test: Port discovery - 443 responds after 8443, within the preference delay
+
+        Assertions
+        ----------
+        - Device port should be 443
+        """
+
+        def _connect(address):
+            if address[1] == 443:
+                time.sleep(0.05)
+        mocker.patch('socket.socket').return_value.connect.side_effect = _connect
+        mocker.patch.dict(project_constants.DEVICE_READY, {'PORT_PREFERENCE_DELAY_IN_SECS': 5})
+
+        device = BigIpUtils.get_mgmt_client(token=TOKEN, port=None)
+        assert device.port == 443
+
     @staticmethod
     def test_port_is_int(mocker):
         """Test: Kwarg port of type string is cast to an int
@@ -233,6 +178,7 @@ class TestBigIp(object):
         mock_socket.connect.side_effect = socket.timeout
 
         mocker.patch('time.sleep')
+        mocker.patch.dict(project_constants.DEVICE_READY, {'TIMEOUT_IN_SECS': 0})
 
         pytest.raises(
             exceptions.DeviceReadyError,
@@ -313,6 +259,171 @@ class TestBigIp(object):
 
         assert mgmt_client.make_request('/', bool_response=True)
 
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_make_request_content_length_header_zero(mgmt_client, mocker):
+        """Test: make_request with Content-Length header set to '0'
+
+        Assertions
+        ----------
+        - Response should equal empty dict
+        """
+
+        mock_request = mocker.patch(REQ).return_value
+        mock_request.json = Mock(return_value={'foo': 'bar'})
+        type(mock_request).headers = PropertyMock(return_value={'content-length': '0'})
+
+        assert mgmt_client.make_request('/') is None
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_make_request_with_204_status_code(mgmt_client, mocker):
+        """Test: make_request with Content-Length header set to '0'
+
+        Assertions
+        ----------
+        - Response should equal empty dict
+        """
+
+        mock_request = mocker.patch(REQ).return_value
+        type(mock_request).status_code = PropertyMock(return_value=204)
+
+        assert mgmt_client.make_request('/') is None
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_make_request_reuses_session(mgmt_client, mocker):
+        """Test: make_request should reuse the device (keep-alive) session
+
+        Assertions
+        ----------
+        - Clients for the same device should share a session
+        - Requests should be made using the shared session
+        """
+        # pylint: disable=protected-access
+
+        mock_request = mocker.patch(REQ)
+
+        other_client = BigIpUtils.get_mgmt_client(token=TOKEN)
+        assert other_client._http['session'] is mgmt_client._http['session']
+
+        mgmt_client.make_request('/')
+        other_client.make_request('/')
+        assert mock_request.call_count == 2
+
+    @staticmethod
+    def test_close(mocker):
+        """Test: close should release the device session
+
+        Assertions
+        ----------
+        - Session should be closed once the last client using it is closed
+        """
+        # pylint: disable=protected-access
+
+        mock_close = mocker.patch('requests.Session.close')
+
+        # use a dedicated port, sessions are shared by host:port
+        with BigIpUtils.get_mgmt_client(token=TOKEN, port=9443) as device:
+            other_device = BigIpUtils.get_mgmt_client(token=TOKEN, port=9443)
+            other_device.close()
+            assert mock_close.call_count == 0
+        assert device._http['session'] is None
+        assert mock_close.call_count == 1
+
+    @staticmethod
+    def test_session_pool_growth():
+        """Test: requesting a larger pool should grow the shared session in place
+
+        Assertions
+        ----------
+        - Clients should keep sharing the same session object
+        """
+        # pylint: disable=protected-access
+
+        session = http_utils.get_session(HOST, 9445, pool_size=1)
+        grown_session = http_utils.get_session(HOST, 9445, pool_size=20)
+
+        assert grown_session is session
+        assert session.get_adapter('https://')._pool_maxsize == 20
+
+        http_utils.release_session(HOST, 9445)
+        http_utils.release_session(HOST, 9445)
+
+
+class TestBigIpSSH(object):
+    """Test Class: bigip module (SSH and bash requests) """
+
+    @classmethod
+    def setup_class(cls):
+        """" Setup func """
+
+        with open(os.path.join(os.path.dirname(__file__), 'sample_rsa_key')) as _f:
+            _file = _f.read()
+
+        cls.private_key = base64.b64decode(_file).decode('utf-8')
+
+    @classmethod
+    def teardown_class(cls):
+        """" Teardown func """
+
+    def test_mgmt_client_key_auth(self, mocker):
+        """Test: Initialize mgmt client using key-based auth
+
+        Assertions
+        ----------
+        - Mock ssh client instance exec_command should start with 'tmsh modify'
+        - Device instance token should match 'TOKEN'
+        """
+
+        mocker.patch(REQ).return_value.json = Mock(return_value=TOKEN_RESPONSE)
+        mock_ssh_client_instance = mock_utils.create_ssh_client(
+            mocker.patch('paramiko.SSHClient'),
+            'auth user %s { description user shell bash }' % (USER)
+        )
+        mocker.patch('paramiko.rsakey.open', mocker.mock_open(read_data=self.private_key))
+        mocker.patch('paramiko.pkey.open', mocker.mock_open(read_data=self.private_key))
+
+        device = BigIpUtils.get_mgmt_client(
+            user=USER, pwd=USER_PWD, private_key_file='foo')
+
+        calls = [
+            call(' list auth user %s' % (USER)),
+            call('tmsh modify auth user %s password %s' % (USER, USER_PWD))
+        ]
+        mock_ssh_client_instance.exec_command.assert_has_calls(calls)
+        assert device.token == TOKEN
+
+    def test_mgmt_client_key_auth_bash(self, mocker):
+        """Test: Initialize mgmt client using key-based auth - 'shell bash'
+
+        'list auth user <user>' command response containing 'shell tmsh' means
+        command should NOT start with 'tmsh'
+
+        Assertions
+        ----------
+        - Mock ssh client instance exec_command should start with ' modify'
+        - Device instance token should match 'TOKEN'
+        """
+
+        mocker.patch(REQ).return_value.json = Mock(return_value=TOKEN_RESPONSE)
+        mock_ssh_client_instance = mock_utils.create_ssh_client(
+            mocker.patch('paramiko.SSHClient'),
+            'auth user %s { description user shell tmsh }' % (USER)
+        )
+        mocker.patch('paramiko.rsakey.open', mocker.mock_open(read_data=self.private_key))
+        mocker.patch('paramiko.pkey.open', mocker.mock_open(read_data=self.private_key))
+
+        device = BigIpUtils.get_mgmt_client(
+            user=USER, pwd=USER_PWD, private_key_file='foo')
+
+        calls = [
+            call(' list auth user %s' % (USER)),
+            call(' modify auth user %s password %s' % (USER, USER_PWD))
+        ]
+        mock_ssh_client_instance.exec_command.assert_has_calls(calls)
+        assert device.token == TOKEN
+
     @staticmethod
     @pytest.mark.usefixtures("mgmt_client")
     def test_make_ssh_request_stderr(mgmt_client, mocker):
@@ -348,31 +459,470 @@ class TestBigIp(object):
 
     @staticmethod
     @pytest.mark.usefixtures("mgmt_client")
-    def test_make_request_content_length_header_zero(mgmt_client, mocker):
-        """Test: make_request with Content-Length header set to '0'
+    def test_make_ssh_request_reuses_connection(mgmt_client, mocker):
+        """Test: make_ssh_request - connection is kept open across requests
 
         Assertions
         ----------
-        - Response should equal empty dict
+        - SSH client should connect once for multiple requests
+        - SSH client should reconnect once the connection has been idle
+        - SSH client should be closed by close()
         """
 
-        mock_request = mocker.patch(REQ).return_value
-        mock_request.json = Mock(return_value={'foo': 'bar'})
-        type(mock_request).headers = PropertyMock(return_value={'content-length': '0'})
+        mock_ssh_client_instance = mock_utils.create_ssh_client(
+            mocker.patch('paramiko.SSHClient'), 'response')
+        mock_time = mocker.patch('time.time', return_value=100)
 
-        assert mgmt_client.make_request('/') is None
+        assert mgmt_client.make_ssh_request('command') == 'response'
+        assert mgmt_client.make_ssh_request('command') == 'response'
+        assert mock_ssh_client_instance.connect.call_count == 1
+
+        mock_time.return_value = 100 + project_constants.SSH['IDLE_TIMEOUT_IN_SECS'] + 1
+        mgmt_client.make_ssh_request('command')
+        assert mock_ssh_client_instance.connect.call_count == 2
+
+        mgmt_client.close()
+        assert mock_ssh_client_instance.close.call_count == 2
 
     @staticmethod
     @pytest.mark.usefixtures("mgmt_client")
-    def test_make_request_with_204_status_code(mgmt_client, mocker):
-        """Test: make_request with Content-Length header set to '0'
+    def test_make_ssh_request_reconnect(mgmt_client, mocker):
+        """Test: make_ssh_request - lost connection is re-established
 
         Assertions
         ----------
-        - Response should equal empty dict
+        - Request should succeed on a new connection
         """
 
-        mock_request = mocker.patch(REQ).return_value
-        type(mock_request).status_code = PropertyMock(return_value=204)
+        mock_ssh_client_instance = mock_utils.create_ssh_client(
+            mocker.patch('paramiko.SSHClient'), 'response')
+        mgmt_client.make_ssh_request('command')
 
-        assert mgmt_client.make_request('/') is None
+        exec_command = mock_ssh_client_instance.exec_command
+        mock_ssh_client_instance.exec_command = Mock(
+            side_effect=[EOFError(), exec_command.return_value])
+
+        assert mgmt_client.make_ssh_request('command') == 'response'
+        assert mock_ssh_client_instance.connect.call_count == 2
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_make_ssh_requests(mgmt_client, mocker):
+        """Test: make_ssh_requests - batch of commands over one connection
+
+        Assertions
+        ----------
+        - Each command should have a result, with the stderr error
+        - SSH client should connect once
+        - stop_on_error should skip the remaining commands
+        """
+
+        mock_ssh_client_instance = mock_utils.create_ssh_client(
+            mocker.patch('paramiko.SSHClient'), 'response', stderr='error')
+
+        results = mgmt_client.make_ssh_requests(['command1', 'command2'])
+        assert [i['command'] for i in results] == ['command1', 'command2']
+        assert isinstance(results[0]['error'], exceptions.SSHCommandStdError)
+        assert mock_ssh_client_instance.connect.call_count == 1
+
+        results = mgmt_client.make_ssh_requests(['command1', 'command2'], stop_on_error=True)
+        assert len(results) == 1
+
+    @staticmethod
+    def test_make_bash_requests(mocker):
+        """Test: make_bash_requests - batch of commands in one REST request
+
+        Assertions
+        ----------
+        - Commands should be sent to the bash utility in a single request
+        - Each command should have its stdout as response, stderr as error
+        - make_ssh_request should use the REST backend, if selected
+        """
+
+        mocker.patch('uuid.uuid4').return_value.hex = 'marker'
+        marker = '__F5SDK_marker'
+        mock_request = mocker.patch(REQ)
+        mock_request.return_value.json = Mock(return_value={
+            'commandResult': 'out1\n\n%s:out:0:0\n\n%s:err:0\n'
+                             '\n%s:out:1:1\nerr2\n\n%s:err:1' % ((marker,) * 4)
+        })
+
+        mgmt_client = ManagementClient(
+            HOST, port=DFL_MGMT_PORT, token=TOKEN, skip_ready_check=True,
+            command_backend='rest')
+        results = mgmt_client.make_bash_requests(['command1', "echo 'two'"])
+
+        assert mock_request.call_count == 1
+        args, kwargs = mock_request.call_args
+        assert args[1].endswith(project_constants.COMMANDS['BASH_URI'])
+        assert "echo '\"'\"'two'\"'\"'" in json.loads(kwargs['data'])['utilCmdArgs']
+        assert results[0] == {'command': 'command1', 'response': 'out1', 'error': None}
+        assert isinstance(results[1]['error'], exceptions.BashCommandStdError)
+
+        assert mgmt_client.make_ssh_request('command1') == 'out1'
+
+    @staticmethod
+    def test_make_bash_request_unexpected_response(mocker):
+        """Test: make_bash_request - response without command output
+
+        Assertions
+        ----------
+        - BashCommandStdError exception should be raised
+        """
+
+        mocker.patch(REQ).return_value.json = Mock(return_value={})
+
+        mgmt_client = ManagementClient(HOST, port=DFL_MGMT_PORT, token=TOKEN, skip_ready_check=True)
+        pytest.raises(exceptions.BashCommandStdError, mgmt_client.make_bash_request, 'command')
+
+    @staticmethod
+    def test_load_private_key_cached(mocker, tmpdir):
+        """Test: private key is loaded once
+
+        Assertions
+        ----------
+        - Private key file should be parsed once
+        """
+
+        private_key_file = tmpdir.join('key')
+        private_key_file.write('key')
+        mock_load = mocker.patch('paramiko.RSAKey.from_private_key_file')
+
+        ssh_utils.load_private_key(str(private_key_file))
+        ssh_utils.load_private_key(str(private_key_file))
+        assert mock_load.call_count == 1
+
+
+class TestBigIpHTTPErrors(object):
+    """Test Class: bigip module (HTTP errors, authentication and retries) """
+
+    @staticmethod
+    def test_mgmt_client_with_incorrect_creds(mocker):
+        """Test: Initialize mgmt client with wrong credentials
+
+        Assertions
+        ----------
+        - Mgmt client throws exception InvalidAuthError
+        """
+        mocker.patch(REQ).side_effect = exceptions.HTTPError(
+            constants.FAILED_AUTHENTICATION, status_code=401)
+        with pytest.raises(exceptions.InvalidAuthError):
+            BigIpUtils.get_mgmt_client(user=USER, pwd=USER_PWD)
+
+    @staticmethod
+    def test_mgmt_client_with_bad_initial_request(mocker):
+        """Test: Initialize mgmt client with bad request on first call,
+        followed by valid token response and then token refresh should succeed
+
+        Assertions
+        ----------
+        - Mgmt client is initialized successfully
+        """
+
+        mocker.patch(REQ).side_effect = [
+            exceptions.HTTPError(constants.BAD_REQUEST_BODY, status_code=400),
+            mock_utils.MockRequestsResponse(TOKEN_RESPONSE),
+            mock_utils.MockRequestsResponse({})
+        ]
+
+        mgmt_client = BigIpUtils.get_mgmt_client(user=USER, pwd=USER_PWD)
+        assert mgmt_client.token == TOKEN
+
+    @staticmethod
+    def test_is_ready_backoff(mocker):
+        """Test: Device ready check - retries with exponential backoff (and jitter)
+
+        Assertions
+        ----------
+        - Ready check should succeed once the device accepts connections
+        - Delays between attempts should double (up to, with jitter)
+        - Retry metrics should count the retries
+        """
+
+        retry_utils.reset_retry_metrics()
+        mock_socket = mocker.patch('socket.socket').return_value
+        mock_socket.connect.side_effect = [OSError, OSError, OSError, None]
+        mock_sleep = mocker.patch('time.sleep')
+        mocker.patch('random.uniform', side_effect=lambda low, high: high)
+
+        BigIpUtils.get_mgmt_client(token=TOKEN, port=DFL_MGMT_PORT, skip_ready_check=False)
+
+        initial_delay = project_constants.DEVICE_READY['INITIAL_DELAY_IN_SECS']
+        assert [i[0][0] for i in mock_sleep.call_args_list] == [
+            initial_delay, initial_delay * 2, initial_delay * 4]
+        metrics = retry_utils.get_retry_metrics('bigip.is_ready')
+        assert metrics['retries'] == 3
+        assert metrics['successes'] == 1
+
+    @staticmethod
+    def test_close_on_failed_login(mocker):
+        """Test: failed login should release the device session
+
+        Assertions
+        ----------
+        - Session should be closed when authentication fails
+        """
+
+        mocker.patch(REQ).side_effect = exceptions.HTTPError(
+            constants.FAILED_AUTHENTICATION, status_code=401)
+        mock_close = mocker.patch('requests.Session.close')
+
+        with pytest.raises(exceptions.InvalidAuthError):
+            BigIpUtils.get_mgmt_client(user=USER, pwd=USER_PWD, port=9444)
+
+        # one transient session per login attempt, plus the pooled session
+        assert mock_close.call_args_list
+        assert '%s:9444' % HOST not in http_utils._SESSIONS  # pylint: disable=protected-access
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_token_refresh(mgmt_client, mocker):
+        """Test: token is refreshed before it expires
+
+        Assertions
+        ----------
+        - Request with a valid token should not log in
+        - Request with an expiring token should log in, then use the new token
+        """
+
+        mock_request = mocker.patch(REQ)
+        mock_request.return_value.json = Mock(return_value=TOKEN_RESPONSE)
+
+        mgmt_client.make_request('/')
+        assert [i for i in mock_request.call_args_list if 'authn/login' in i[0][1]] == []
+
+        mgmt_client.token = 'expiring'
+        mgmt_client.token_details['expirationDate'] = '2000-01-01T00:00:00.000000'
+        mgmt_client.make_request('/')
+
+        called_uris = [i[0][1] for i in mock_request.call_args_list]
+        assert [i for i in called_uris if 'authn/login' in i]
+        assert mock_request.call_args[1]['headers']['X-F5-Auth-Token'] == TOKEN
+
+    @staticmethod
+    def test_token_refresh_token_only(mocker):
+        """Test: token provided (without credentials) is not refreshed
+
+        Assertions
+        ----------
+        - Request should use the provided token, without logging in
+        """
+
+        mock_request = mocker.patch(REQ)
+        mgmt_client = ManagementClient(
+            HOST, port=DFL_MGMT_PORT, token='mytoken', skip_ready_check=True)
+        mgmt_client.token_details = {'expirationDate': '2000-01-01T00:00:00'}
+        mgmt_client.make_request('/')
+
+        assert mock_request.call_count == 1
+        assert mock_request.call_args[1]['headers']['X-F5-Auth-Token'] == 'mytoken'
+
+    @staticmethod
+    def test_token_cache(mocker, tmpdir):
+        """Test: token cache is used by subsequent clients (processes)
+
+        Assertions
+        ----------
+        - First client should log in
+        - Second client should reuse the cached token, without logging in
+        """
+
+        mocker.patch('f5sdk.utils.cache_utils._TOKEN_CACHE',
+                     cache_utils.TokenCache(cache_dir=str(tmpdir)))
+        mock_request = mocker.patch(REQ)
+        mock_request.return_value.json = Mock(return_value=TOKEN_RESPONSE)
+        kwargs = {'user': USER, 'password': USER_PWD, 'port': DFL_MGMT_PORT,
+                  'skip_ready_check': True, 'token_cache': True}
+
+        ManagementClient(HOST, **kwargs)
+        login_count = mock_request.call_count
+        mgmt_client = ManagementClient(HOST, **kwargs)
+
+        assert login_count == 2  # login + token (timeout) update
+        assert mock_request.call_count == login_count
+        assert mgmt_client.token == TOKEN
+
+    @staticmethod
+    def test_token_cache_rejected(mocker, tmpdir):
+        """Test: cached token rejected by the device (HTTP 401)
+
+        Assertions
+        ----------
+        - Rejected token should be removed from the token cache
+        - Client should log in again (once) and retry the request
+        """
+
+        token_cache = cache_utils.TokenCache(cache_dir=str(tmpdir))
+        mocker.patch('f5sdk.utils.cache_utils._TOKEN_CACHE', token_cache)
+        token_cache.put(HOST, DFL_MGMT_PORT, USER, {
+            'token': 'revokedtoken',
+            'expirationDate': (datetime.now() + timedelta(hours=1)).isoformat()
+        })
+        mock_remove = mocker.patch.object(token_cache, 'remove', wraps=token_cache.remove)
+        mock_request = mocker.patch(REQ)
+        mgmt_client = ManagementClient(
+            HOST, user=USER, password=USER_PWD, port=DFL_MGMT_PORT,
+            skip_ready_check=True, token_cache=True)
+        assert mgmt_client.token == 'revokedtoken'
+
+        mock_request.side_effect = [
+            exceptions.HTTPError(constants.FAILED_AUTHENTICATION, status_code=401),
+            mock_utils.MockRequestsResponse(TOKEN_RESPONSE),
+            mock_utils.MockRequestsResponse({}),
+            mock_utils.MockRequestsResponse({'foo': 'bar'})
+        ]
+
+        assert mgmt_client.make_request('/') == {'foo': 'bar'}
+        mock_remove.assert_called_once_with(HOST, DFL_MGMT_PORT, USER)
+        assert mock_request.call_args[1]['headers']['X-F5-Auth-Token'] == TOKEN
+        assert token_cache.get(HOST, DFL_MGMT_PORT, USER)['token'] == TOKEN
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_token_rejected(mgmt_client, mocker):
+        """Test: token (not cached) rejected by the device (HTTP 401)
+
+        Assertions
+        ----------
+        - HTTPError exception should be raised, without logging in again
+        """
+
+        mock_request = mocker.patch(REQ)
+        mock_request.side_effect = exceptions.HTTPError(
+            constants.FAILED_AUTHENTICATION, status_code=401)
+
+        pytest.raises(exceptions.HTTPError, mgmt_client.make_request, '/')
+        assert mock_request.call_count == 1
+
+
+@REQUIRES_ASYNCIO
+class TestAsyncBigIp(object):
+    """Test Class: bigip module (asyncio management client) """
+
+    @staticmethod
+    def _get_async_mgmt_client(**kwargs):
+        from f5sdk.bigip import AsyncManagementClient
+
+        kwargs.setdefault('skip_ready_check', True)
+        return AsyncManagementClient(HOST, **kwargs)
+
+    @staticmethod
+    @pytest.mark.usefixtures("async_mgmt_client")
+    def test_mgmt_client(async_mgmt_client):
+        """Test: Initialize (and login) asyncio mgmt client
+
+        Assertions
+        ----------
+        - Management client token should match 'TOKEN'
+        """
+
+        assert async_mgmt_client.client.token == TOKEN
+
+    def test_mgmt_client_with_bad_initial_request(self, mocker):
+        """Test: Login should be retried on the event loop after a bad request
+
+        Assertions
+        ----------
+        - Management client token should match 'TOKEN'
+        """
+
+        mocker.patch.dict(project_constants.RETRY_POLICY, {'INITIAL_DELAY_IN_SECS': 0})
+        mocker.patch(REQ).side_effect = [
+            exceptions.HTTPError(constants.BAD_REQUEST_BODY, status_code=400),
+            mock_utils.MockRequestsResponse(TOKEN_RESPONSE),
+            mock_utils.MockRequestsResponse({})
+        ]
+
+        device = self._get_async_mgmt_client(user=USER, password=USER_PWD, port=DFL_MGMT_PORT)
+        asyncio.run(device.login())
+
+        assert device.client.token == TOKEN
+
+    def test_make_request_login_required(self):
+        """Test: make_request before login
+
+        Assertions
+        ----------
+        - AuthRequiredError exception should be raised
+        """
+
+        device = self._get_async_mgmt_client(token=TOKEN, port=DFL_MGMT_PORT)
+
+        with pytest.raises(exceptions.AuthRequiredError):
+            asyncio.run(device.make_request('/'))
+
+    @staticmethod
+    @pytest.mark.usefixtures("async_mgmt_client")
+    def test_make_request(async_mgmt_client, mocker):
+        """Test: make_request
+
+        Assertions
+        ----------
+        - make_request should return the JSON response
+        """
+
+        mocker.patch(REQ).return_value.json = Mock(return_value={'foo': 'bar'})
+
+        assert asyncio.run(async_mgmt_client.make_request('/')) == {'foo': 'bar'}
+
+    def test_port_discovery(self, mocker):
+        """Test: Port discovery during login (non-blocking)
+
+        Assertions
+        ----------
+        - Device port should be 8443 when only 8443 accepts connections
+        """
+
+        def _open_connection(host, port):  # pylint: disable=unused-argument
+            if port == 443:
+                raise OSError
+            return Mock(), Mock()
+        mocker.patch('asyncio.open_connection', side_effect=_open_connection)
+
+        device = self._get_async_mgmt_client(token=TOKEN)
+        asyncio.run(device.login())
+
+        assert device.client.port == 8443
+
+    def test_is_ready_false(self, mocker):
+        """Test: Device ready check should raise exception
+
+        Assertions
+        ----------
+        - login() should raise DeviceReadyError when connections fail
+        """
+
+        mocker.patch.dict(project_constants.DEVICE_READY, {'TIMEOUT_IN_SECS': 0})
+        mocker.patch('asyncio.open_connection', side_effect=OSError)
+
+        device = self._get_async_mgmt_client(
+            token=TOKEN, port=DFL_MGMT_PORT, skip_ready_check=False)
+
+        with pytest.raises(exceptions.DeviceReadyError):
+            asyncio.run(device.login())
+
+    @staticmethod
+    @pytest.mark.usefixtures("async_mgmt_client")
+    def test_wait_for_task(async_mgmt_client, mocker):
+        """Test: wait for task should retry on any exception, and until finished
+
+        Assertions
+        ----------
+        - _wait_for_task() response should be the finished task response
+        - make_request() should be called with the task uri path
+        """
+        # pylint: disable=protected-access
+
+        mocker.patch.dict(project_constants.RETRY_POLICY, {'INITIAL_DELAY_IN_SECS': 0})
+        mock_request = mocker.patch.object(async_mgmt_client.client, 'make_request', side_effect=[
+            exceptions.HTTPError('connection reset'),
+            ({'status': 'RUNNING'}, 200),
+            ({'foo': 'bar'}, 202),
+            ({'status': 'FINISHED'}, 200)
+        ])
+
+        response = asyncio.run(async_mgmt_client._wait_for_task('https://localhost/foo/1234'))
+
+        assert response == {'status': 'FINISHED'}
+        assert mock_request.call_count == 4
+        assert mock_request.call_args[0][0] == '/foo/1234'
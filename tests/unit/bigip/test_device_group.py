@@ -0,0 +1,132 @@
+""" Test BIG-IP device group """
+
+from f5sdk import exceptions
+
+from ...global_test_imports import Mock, asyncio, REQUIRES_ASYNCIO
+from ...shared import constants
+from ...shared import mock_utils
+
+if asyncio is not None:
+    from f5sdk.bigip import DeviceGroup
+    from ...shared.async_utils import run_sequence
+
+REQ = constants.MOCK['requests']
+
+USER = constants.USER
+USER_PWD = constants.USER_PWD
+TOKEN = constants.TOKEN
+HOSTS = ['192.0.2.1', '192.0.2.2']
+
+TOKEN_RESPONSE = {
+    'token': {
+        'token': TOKEN,
+        'selfLink': 'https://localhost/mgmt/shared/authz/tokens/mytoken'
+    }
+}
+
+
+@REQUIRES_ASYNCIO
+class TestDeviceGroup(object):
+    """Test Class: bigip device group """
+
+    @staticmethod
+    def _get_device_group(hosts=None, **kwargs):
+        return DeviceGroup(
+            hosts or HOSTS,
+            user=USER,
+            password=USER_PWD,
+            port=443,
+            skip_ready_check=True,
+            **kwargs
+        )
+
+    def test_login_and_run(self, mocker):
+        """Test: login to, and run an operation on, all devices
+
+        Assertions
+        ----------
+        - All devices should be logged in
+        - Each device should return a result containing the response
+        """
+
+        mocker.patch(REQ).return_value.json = Mock(return_value=TOKEN_RESPONSE)
+
+        group = self._get_device_group(hosts=[HOSTS[0], {'host': HOSTS[1], 'port': 8443}])
+        login_results, run_results, _ = asyncio.run(run_sequence(
+            group.login,
+            lambda: group.run(lambda device: device.make_request('/')),
+            group.close
+        ))
+
+        assert sorted([i['host'] for i in login_results]) == HOSTS
+        assert [i['error'] for i in login_results] == [None, None]
+        assert sorted([i['host'] for i in run_results]) == HOSTS
+        assert [i['response'] for i in run_results] == [TOKEN_RESPONSE, TOKEN_RESPONSE]
+
+    def test_login_failure(self, mocker):
+        """Test: device failing login should be excluded from the group
+
+        Assertions
+        ----------
+        - Failed device login result should contain InvalidAuthError
+        - Operations should only run on logged in devices
+        """
+
+        def _request(*args, **kwargs):  # pylint: disable=unused-argument
+            if HOSTS[1] in args[1]:
+                raise exceptions.HTTPError(constants.FAILED_AUTHENTICATION, status_code=401)
+            return mock_utils.MockRequestsResponse(TOKEN_RESPONSE)
+        mocker.patch(REQ).side_effect = _request
+
+        group = self._get_device_group()
+        login_results, run_results, _ = asyncio.run(run_sequence(
+            group.login,
+            lambda: group.run(lambda device: device.make_request('/')),
+            group.close
+        ))
+
+        errors = {i['host']: i['error'] for i in login_results}
+        assert errors[HOSTS[0]] is None
+        assert isinstance(errors[HOSTS[1]], exceptions.InvalidAuthError)
+        assert [i['host'] for i in run_results] == [HOSTS[0]]
+
+    def test_run_timeout(self, mocker):
+        """Test: operation exceeding the per-device timeout
+
+        Assertions
+        ----------
+        - Result should contain a timeout error
+        """
+
+        mocker.patch(REQ).return_value.json = Mock(return_value=TOKEN_RESPONSE)
+
+        group = self._get_device_group(hosts=HOSTS[:1])
+        _, run_results, _ = asyncio.run(run_sequence(
+            group.login,
+            lambda: group.run(lambda device: asyncio.sleep(10), timeout=0.01),
+            group.close
+        ))
+
+        assert isinstance(run_results[0]['error'], asyncio.TimeoutError)
+
+    def test_run_yields_as_completed(self, mocker):
+        """Test: results should be yielded as each device completes
+
+        Assertions
+        ----------
+        - The fastest device result should be yielded first
+        """
+
+        mocker.patch(REQ).return_value.json = Mock(return_value=TOKEN_RESPONSE)
+
+        def _operation(device):
+            return asyncio.sleep(0.2 if device.host == HOSTS[0] else 0, result=device.host)
+
+        group = self._get_device_group()
+        _, run_results, _ = asyncio.run(run_sequence(
+            group.login,
+            lambda: group.run(_operation),
+            group.close
+        ))
+
+        assert [i['response'] for i in run_results] == [HOSTS[1], HOSTS[0]]
@@ -0,0 +1,166 @@
+""" Test BIG-IP readiness watcher """
+
+import socket
+
+from f5sdk import exceptions
+from f5sdk import constants as project_constants
+from f5sdk.bigip import mgmt_client
+
+from ...global_test_imports import Mock, asyncio, REQUIRES_ASYNCIO
+from ...shared import constants
+
+if asyncio is not None:
+    from f5sdk.bigip import DeviceGroup, ReadinessWatcher
+    from ...shared.async_utils import run_sequence, make_async
+
+REQ = constants.MOCK['requests']
+
+USER = constants.USER
+USER_PWD = constants.USER_PWD
+TOKEN = constants.TOKEN
+HOSTS = ['192.0.2.1', '192.0.2.2']
+
+TOKEN_RESPONSE = {
+    'token': {
+        'token': TOKEN,
+        'selfLink': 'https://localhost/mgmt/shared/authz/tokens/mytoken'
+    }
+}
+
+
+def _get_closed_port():
+    """Get a local port which does not accept connections"""
+
+    _socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    _socket.bind(('127.0.0.1', 0))
+    port = _socket.getsockname()[1]
+    _socket.close()
+    return port
+
+
+@REQUIRES_ASYNCIO
+class TestReadinessWatcher(object):
+    """Test Class: bigip readiness watcher """
+
+    @staticmethod
+    def test_watch(mocker):
+        """Test: watch devices using (real) non-blocking connects
+
+        Assertions
+        ----------
+        - Listening device should be ready
+        - Device not accepting connections should time out with DeviceReadyError
+        """
+
+        mocker.patch.dict(project_constants.DEVICE_READY, {'INITIAL_DELAY_IN_SECS': 0.01})
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        ready_port = listener.getsockname()[1]
+        closed_port = _get_closed_port()
+
+        watcher = ReadinessWatcher(
+            [{'host': '127.0.0.1', 'port': ready_port}, {'host': 'localhost', 'port': closed_port}],
+            timeout=0.1
+        )
+        try:
+            results = asyncio.run(run_sequence(watcher.watch))[0]
+        finally:
+            listener.close()
+
+        assert results[0] == {'host': '127.0.0.1', 'port': ready_port, 'error': None}
+        assert results[1]['host'] == 'localhost'
+        assert isinstance(results[1]['error'], exceptions.DeviceReadyError)
+
+    @staticmethod
+    def test_watch_yields_when_ready(mocker):
+        """Test: devices are reported the moment they are ready
+
+        Assertions
+        ----------
+        - Device ready on first probe should be reported first
+        - Device should be probed until ready
+        """
+
+        mocker.patch.dict(project_constants.DEVICE_READY, {'INITIAL_DELAY_IN_SECS': 0.01})
+        attempts = {HOSTS[0]: 0, HOSTS[1]: 0}
+
+        def _test_socket(host, port):  # pylint: disable=unused-argument
+            attempts[host] += 1
+            return host == HOSTS[1] or attempts[host] > 2
+
+        watcher = ReadinessWatcher([{'host': i, 'port': 443} for i in HOSTS])
+        mocker.patch.object(watcher, '_test_socket', side_effect=make_async(_test_socket))
+        results = asyncio.run(run_sequence(watcher.watch))[0]
+
+        assert [i['host'] for i in results] == [HOSTS[1], HOSTS[0]]
+        assert attempts[HOSTS[0]] == 3
+
+    @staticmethod
+    def test_watch_discovers_port(mocker):
+        """Test: device without a port is probed on both management ports
+
+        Assertions
+        ----------
+        - Device port should be 8443 when only 8443 accepts connections
+        - Discovered port should be cached for management client construction
+        """
+
+        watcher = ReadinessWatcher([HOSTS[0]])
+        mocker.patch.object(watcher, '_test_socket', side_effect=make_async(
+            lambda host, port: port == 8443))
+        results = asyncio.run(run_sequence(watcher.watch))[0]
+
+        assert results[0]['port'] == 8443
+        assert mgmt_client.get_discovered_port(HOSTS[0]) == 8443
+
+    @staticmethod
+    def test_watch_port_preference(mocker):
+        """Test: preferred port (443) is only waited on for the preference delay
+
+        Assertions
+        ----------
+        - Device port should be 8443 when 443 is still connecting after the delay
+        - Device port should be 443 when it responds within the delay
+        """
+
+        mocker.patch.dict(project_constants.DEVICE_READY, {'PORT_PREFERENCE_DELAY_IN_SECS': 0.05})
+
+        def _create_test_socket(dfl_port_delay):
+            async def _test_socket(host, port):  # pylint: disable=unused-argument
+                if port == 443:
+                    await asyncio.sleep(dfl_port_delay)
+                return True
+            return _test_socket
+
+        watcher = ReadinessWatcher([HOSTS[0]])
+        mocker.patch.object(watcher, '_test_socket', side_effect=_create_test_socket(60))
+        results = asyncio.run(asyncio.wait_for(run_sequence(watcher.watch), 5))[0]
+        assert results[0]['port'] == 8443
+
+        watcher = ReadinessWatcher([HOSTS[1]])
+        mocker.patch.object(watcher, '_test_socket', side_effect=_create_test_socket(0.01))
+        results = asyncio.run(run_sequence(watcher.watch))[0]
+        assert results[0]['port'] == 443
+
+    @staticmethod
+    def test_device_group_login_when_ready(mocker):
+        """Test: device group logs in to each device once ready
+
+        Assertions
+        ----------
+        - Ready device should be logged in
+        - Device not ready should have a DeviceReadyError result
+        """
+
+        mocker.patch(REQ).return_value.json = Mock(return_value=TOKEN_RESPONSE)
+
+        mocker.patch.object(ReadinessWatcher, '_test_socket', make_async(
+            lambda self, host, port: host == HOSTS[0]))
+
+        group = DeviceGroup(HOSTS, user=USER, password=USER_PWD, port=443, ready_timeout=0)
+        login_results, _ = asyncio.run(run_sequence(group.login, group.close))
+
+        errors = {i['host']: i['error'] for i in login_results}
+        assert errors[HOSTS[0]] is None
+        assert isinstance(errors[HOSTS[1]], exceptions.DeviceReadyError)
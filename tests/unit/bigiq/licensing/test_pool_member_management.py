@@ -57,3 +57,31 @@ class TestPoolMemberManagementClient(object):
         client = MemberManagementClient(mgmt_client)
         response = client.create(config={'foo': 'bar'})
         assert response == mock_responses[1]
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_create_async_no_wait(mgmt_client, mocker):
+        """Test: create function - async response, without waiting
+
+        Assertions
+        ----------
+        - Create should return a task future
+        - Task future result should match mocked return value (2nd response)
+        """
+
+        mock_responses = [
+            {
+                'status': 'RUNNING',
+                'selfLink': 'https://localhost/foo/bar'
+            },
+            {
+                'status': 'FINISHED'
+            }
+        ]
+        mock_request = mocker.patch(REQ).return_value
+        mock_request.json = Mock(side_effect=mock_responses)
+        type(mock_request).status_code = PropertyMock(side_effect=[202, 200])
+
+        client = MemberManagementClient(mgmt_client)
+        future = client.create(config={'foo': 'bar'}, wait=False)
+        assert future.result(timeout=10) == mock_responses[1]
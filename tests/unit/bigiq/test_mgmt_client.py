@@ -1,9 +1,12 @@
 """ Test BIG-IQ management client """
 
-from ...global_test_imports import pytest, Mock
+from ...global_test_imports import pytest, Mock, asyncio, REQUIRES_ASYNCIO
 from ...shared import constants
 
 REQ = constants.MOCK['requests']
+HOST = constants.HOST
+USER = constants.USER
+USER_PWD = constants.USER_PWD
 TOKEN = constants.TOKEN
 
 
@@ -50,3 +53,66 @@ class TestMgmtClient(object):
 
         device_info = mgmt_client.get_info()
         assert device_info['version'] == version
+
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_token_refresh(mgmt_client, mocker):
+        """Test: token is refreshed before it expires
+
+        Assertions
+        ----------
+        - Request with an expiring token should log in, then use the new token
+        """
+
+        mock_request = mocker.patch(REQ)
+        mock_request.return_value.json = Mock(
+            return_value={'token': {'token': TOKEN, 'timeout': 300}})
+
+        mgmt_client.token = 'expiring'
+        mgmt_client.token_details['expirationDate'] = '2000-01-01T00:00:00.000000'
+        mgmt_client.make_request('/')
+
+        assert mock_request.call_count == 2
+        assert 'authn/login' in mock_request.call_args_list[0][0][1]
+        assert mock_request.call_args[1]['headers']['X-F5-Auth-Token'] == TOKEN
+
+
+@REQUIRES_ASYNCIO
+class TestAsyncMgmtClient(object):
+    """Test Class: bigiq module (asyncio management client) """
+
+    @staticmethod
+    def test_mgmt_client(mocker):
+        """Test: Initialize (and login) asyncio mgmt client, then get info
+
+        Assertions
+        ----------
+        - Management client token should match 'TOKEN'
+        - Device version should match 'version'
+        """
+        from f5sdk.bigiq import AsyncManagementClient
+
+        mocker.patch(REQ).return_value.json = Mock(
+            return_value={'token': {'token': TOKEN, 'timeout': 300}})
+
+        mgmt_client = AsyncManagementClient(HOST, user=USER, password=USER_PWD)
+        asyncio.run(mgmt_client.login())
+        assert mgmt_client.client.token == TOKEN
+
+        version = '7.0.0'
+        mocker.patch(REQ).return_value.json = Mock(return_value={
+            'entries': {
+                'https://localhost/mgmt/tm/sys/version/0': {
+                    'nestedStats': {
+                        'entries': {
+                            'Version': {
+                                'description': version
+                            }
+                        }
+                    }
+                }
+            }
+        })
+        assert asyncio.run(mgmt_client.get_info())['version'] == version
+        asyncio.run(mgmt_client.close())
@@ -4,7 +4,7 @@ from f5sdk.cs import ManagementClient
 from f5sdk import constants as project_constants
 from f5sdk.exceptions import InvalidAuthError, HTTPError
 
-from ...global_test_imports import pytest, Mock
+from ...global_test_imports import pytest, Mock, asyncio, REQUIRES_ASYNCIO
 from ...shared import constants
 
 REQ = constants.MOCK['requests']
@@ -42,7 +42,7 @@ class TestCloudServices(object):
         ----------
         - Mgmt client throws exception InvalidAuthError
         """
-        mocker.patch(REQ).side_effect = HTTPError(constants.BAD_REQUEST_BODY)
+        mocker.patch(REQ).side_effect = HTTPError(constants.BAD_REQUEST_BODY, status_code=400)
         with pytest.raises(InvalidAuthError):
             ManagementClient(user=USER, password=USER_PWD)
 
@@ -109,3 +109,45 @@ class TestCloudServices(object):
         )
 
         assert mgmt_client._api_endpoint == constants.CUSTOM_API_ENDPOINT
+
+
+@REQUIRES_ASYNCIO
+class TestAsyncCloudServices(object):
+    """Test Class: cs module (asyncio management client) """
+
+    @staticmethod
+    def test_mgmt_client(mocker):
+        """Test: Initialize (and login) asyncio mgmt client
+
+        Assertions
+        ----------
+        - Mgmt client access token should match 'TOKEN'
+        - make_request should insert auth header
+        """
+        from f5sdk.cs import AsyncManagementClient
+
+        mock_request = mocker.patch(REQ)
+        mock_request.return_value.json = Mock(return_value=LOGIN_RESPONSE)
+
+        mgmt_client = AsyncManagementClient(user=USER, password=USER_PWD)
+        asyncio.run(mgmt_client.login())
+        assert mgmt_client.client.access_token == TOKEN
+
+        asyncio.run(mgmt_client.make_request('/'))
+        _, kwargs = mock_request.call_args
+        assert 'Bearer' in kwargs['headers'][AUTH_TOKEN_HEADER]
+
+    @staticmethod
+    def test_mgmt_client_with_incorrect_creds(mocker):
+        """Test: asyncio mgmt client with wrong credentials
+
+        Assertions
+        ----------
+        - login() throws exception InvalidAuthError
+        """
+        from f5sdk.cs import AsyncManagementClient
+
+        mocker.patch(REQ).side_effect = HTTPError(constants.BAD_REQUEST_BODY, status_code=400)
+
+        with pytest.raises(InvalidAuthError):
+            asyncio.run(AsyncManagementClient(user=USER, password=USER_PWD).login())
@@ -7,6 +7,7 @@ from f5sdk.cs.subscriptions import SubscriptionClient
 
 from ...global_test_imports import pytest, Mock
 from ...shared import constants
+from ...shared import mock_utils
 from .. import utils
 
 REQUESTS = constants.MOCK['requests']
@@ -61,3 +62,30 @@ class TestSubscription(object):
 
         subscription_client = SubscriptionClient(mgmt_client)
         assert subscription_client.list(query_parameters={'account_id': ''}) == {}
+
+    @staticmethod
+    @pytest.mark.usefixtures("mgmt_client")
+    def test_subscription_client_iter_list(mgmt_client, mocker):
+        """Test: iter_list() follows CS (limit/page) paging
+
+        Assertions
+        ----------
+        - All items, from all pages, should be yielded
+        - Pages should be requested using limit/page, including query parameters
+        - Iteration should stop after a page with fewer items than the limit
+        """
+
+        mock_request = mocker.patch(REQUESTS)
+        mock_request.side_effect = [
+            mock_utils.MockRequestsResponse({'subscriptions': [{'id': 1}, {'id': 2}]}),
+            mock_utils.MockRequestsResponse({'subscriptions': [{'id': 3}]})
+        ]
+
+        items = list(SubscriptionClient(mgmt_client).iter_list(
+            page_size=2, query_parameters={'account_id': 'a'}))
+
+        assert [i['id'] for i in items] == [1, 2, 3]
+        assert [i[1]['params'] for i in mock_request.call_args_list] == [
+            {'account_id': 'a', 'limit': 2, 'page': 1},
+            {'account_id': 'a', 'limit': 2, 'page': 2}
+        ]
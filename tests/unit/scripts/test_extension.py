@@ -4,6 +4,7 @@
 from f5sdk.scripts.extension.generate_metadata import ExtensionScraperClient
 # unittest imports
 from ...shared import mock_utils
+from ...shared import constants
 from ...global_test_imports import pytest
 
 COMPONENTS = ['as3', 'do', 'ts', 'cf'].sort()
@@ -56,7 +57,7 @@ MOCK_CONDITIOINS = [
 def fixture_mocked_requests(mocker):
     """ Test fixture """
 
-    mock_requests = mocker.patch('requests.request')
+    mock_requests = mocker.patch(constants.MOCK['requests'])
     mock_requests.side_effect = mock_utils.create_response(
         {}, conditional=MOCK_CONDITIOINS
     )
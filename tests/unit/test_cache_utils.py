@@ -0,0 +1,182 @@
+""" Test cache utils module """
+
+import hashlib
+import os
+import threading
+
+from f5sdk.utils import cache_utils
+from f5sdk.exceptions import ChecksumMismatchError
+
+from ..global_test_imports import pytest
+
+URL = 'https://example.com/releases/pkg.rpm'
+DOWNLOAD_TO_FILE = 'f5sdk.utils.http_utils.download_to_file'
+
+
+def _get_artifact_cache(tmpdir, **kwargs):
+    return cache_utils.ArtifactCache(cache_dir=str(tmpdir.join('cache')), **kwargs)
+
+
+def _create_file(tmpdir, name, data):
+    file_name = str(tmpdir.join(name))
+    with open(file_name, 'wb') as _f:
+        _f.write(data)
+    return file_name
+
+
+class TestArtifactCache(object):
+    """Test Class: artifact cache """
+
+    @staticmethod
+    def test_put_get(tmpdir):
+        """Test: cached artifact is returned by url
+
+        Assertions
+        ----------
+        - get() should return None before put()
+        - get() should return the cached file (named as the url) after put()
+        - get() should return None for a different expected checksum
+        """
+
+        artifact_cache = _get_artifact_cache(tmpdir)
+        sha256 = hashlib.sha256(b'foo').hexdigest()
+
+        assert artifact_cache.get(URL) is None
+        cached_file = artifact_cache.put(URL, _create_file(tmpdir, 'tmp', b'foo'), sha256=sha256)
+
+        assert artifact_cache.get(URL) == cached_file
+        assert artifact_cache.get(URL, sha256=sha256) == cached_file
+        assert artifact_cache.get(URL, sha256='0' * 64) is None
+        assert os.path.basename(cached_file) == 'pkg.rpm'
+
+    @staticmethod
+    def test_put_checksum_mismatch(tmpdir):
+        """Test: put() with an unexpected checksum
+
+        Assertions
+        ----------
+        - ChecksumMismatchError should be raised
+        - The artifact should not be cached
+        """
+
+        artifact_cache = _get_artifact_cache(tmpdir)
+
+        pytest.raises(
+            ChecksumMismatchError,
+            artifact_cache.put, URL, _create_file(tmpdir, 'tmp', b'foo'), sha256='0' * 64
+        )
+        assert artifact_cache.get(URL) is None
+
+    @staticmethod
+    def test_get_integrity_check(tmpdir):
+        """Test: corrupted artifact is removed from the cache
+
+        Assertions
+        ----------
+        - get() should return None for a modified cached file
+        - The cached file should be removed
+        """
+
+        artifact_cache = _get_artifact_cache(tmpdir)
+        cached_file = artifact_cache.put(URL, _create_file(tmpdir, 'tmp', b'foo'))
+        with open(cached_file, 'wb') as _f:
+            _f.write(b'bar')
+
+        assert artifact_cache.get(URL) is None
+        assert not os.path.exists(cached_file)
+
+    @staticmethod
+    def test_evict_least_recently_used(tmpdir):
+        """Test: least recently used artifacts are evicted once over max size
+
+        Assertions
+        ----------
+        - The least recently used artifact should be evicted
+        - The recently used and newly added artifacts should be kept
+        """
+
+        artifact_cache = _get_artifact_cache(tmpdir, max_size=20)
+        urls = ['https://example.com/%s.rpm' % i for i in range(3)]
+
+        first = artifact_cache.put(urls[0], _create_file(tmpdir, 'tmp', b'0' * 10))
+        second = artifact_cache.put(urls[1], _create_file(tmpdir, 'tmp', b'1' * 10))
+        os.utime(first, (0, 0))
+        os.utime(second, (1, 1))
+        # use first, so second becomes least recently used
+        artifact_cache.get(urls[0])
+        artifact_cache.put(urls[2], _create_file(tmpdir, 'tmp', b'2' * 10))
+
+        assert artifact_cache.get(urls[0]) is not None
+        assert artifact_cache.get(urls[1]) is None
+        assert artifact_cache.get(urls[2]) is not None
+
+    @staticmethod
+    def test_fetch_once(tmpdir, mocker):
+        """Test: concurrent fetches of the same url download once
+
+        Assertions
+        ----------
+        - download_to_file() should be called once
+        - Every fetch should return the same cached file
+        """
+
+        def _download(url, file_name):  # pylint: disable=unused-argument
+            with open(file_name, 'wb') as _f:
+                _f.write(b'foo')
+
+        mock_download = mocker.patch(DOWNLOAD_TO_FILE, side_effect=_download)
+        artifact_cache = _get_artifact_cache(tmpdir)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(artifact_cache.fetch(URL)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_download.call_count == 1
+        assert len(set(results)) == 1
+        assert len(results) == 5
+
+    @staticmethod
+    def test_fetch_evicted(tmpdir, mocker):
+        """Test: cached artifact evicted (by another process) before fetch() returns
+
+        Assertions
+        ----------
+        - Artifact should be downloaded again
+        - fetch() should return an existing file
+        """
+
+        def _download(url, file_name):  # pylint: disable=unused-argument
+            with open(file_name, 'wb') as _f:
+                _f.write(b'foo')
+
+        mock_download = mocker.patch(DOWNLOAD_TO_FILE, side_effect=_download)
+        artifact_cache = _get_artifact_cache(tmpdir)
+        mocker.patch.object(
+            artifact_cache, 'get', side_effect=[str(tmpdir.join('evicted.rpm')), None])
+
+        cached_file = artifact_cache.fetch(URL)
+
+        assert mock_download.call_count == 1
+        assert os.path.isfile(cached_file)
+
+    @staticmethod
+    def test_fetch_checksum_mismatch(tmpdir, mocker):
+        """Test: fetch() with an unexpected checksum
+
+        Assertions
+        ----------
+        - ChecksumMismatchError should be raised
+        - No temporary download files should remain
+        """
+
+        mocker.patch(DOWNLOAD_TO_FILE)
+        artifact_cache = _get_artifact_cache(tmpdir)
+
+        pytest.raises(ChecksumMismatchError, artifact_cache.fetch, URL, sha256='0' * 64)
+        assert os.listdir(os.path.join(artifact_cache.cache_dir, 'objects')) == []
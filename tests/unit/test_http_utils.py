@@ -0,0 +1,310 @@
+""" Test http utils module """
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+
+from f5sdk.utils import http_utils, json_utils, transport_utils
+from f5sdk.exceptions import ChecksumMismatchError, HTTPError
+
+from ..global_test_imports import pytest
+
+REQUESTS = 'requests.Session.request'
+URL = 'https://example.com/releases/pkg.rpm'
+DATA = os.urandom(1000)
+HOST = '192.0.2.10'
+URI = '/mgmt/shared/appsvcs/declare'
+LARGE_BODY = {'items': ['item_%s' % i for i in range(20000)]}
+
+
+class _RangeResponse(object):
+    """ Mock requests response, serving byte ranges of DATA """
+
+    def __init__(self, status_code, body=b'', headers=None):
+        self.status_code = status_code
+        self.reason = None
+        self.url = URL
+        self.headers = headers or {}
+        self.body = body
+
+    def iter_content(self, chunk_size=1):
+        """ Mock function """
+        return [self.body[i:i + chunk_size] for i in range(0, len(self.body), chunk_size)]
+
+    @staticmethod
+    def close():
+        """ Mock function """
+        return None
+
+
+def _create_server(ranges=True, fail_offsets=None):
+    """Create mock requests.request side effect, recording GET ranges"""
+
+    requested = []
+    lock = threading.Lock()
+
+    def _func(method, url, **kwargs):  # pylint: disable=unused-argument
+        if method == 'HEAD':
+            headers = {'content-length': str(len(DATA)), 'etag': '"1"'}
+            if ranges:
+                headers['accept-ranges'] = 'bytes'
+            return _RangeResponse(200, headers=headers)
+
+        if 'Range' not in kwargs.get('headers', {}):
+            return _RangeResponse(200, body=DATA)
+        start, end = [int(i) for i in kwargs['headers']['Range'][6:].split('-')]
+        with lock:
+            requested.append(start)
+        if start in (fail_offsets or []):
+            return _RangeResponse(503)
+        return _RangeResponse(206, body=DATA[start:end + 1])
+
+    return _func, requested
+
+
+def _read_file(file_name):
+    with open(file_name, 'rb') as file_object:
+        return file_object.read()
+
+
+class TestDownloadToFile(object):
+    """Test Class: download to file """
+
+    @staticmethod
+    def test_ranged_download(mocker, tmpdir):
+        """Test: artifact is downloaded using concurrent range requests
+
+        Assertions
+        ----------
+        - The file should equal the artifact
+        - Each part should be requested once
+        - No partial download files should remain
+        """
+
+        side_effect, requested = _create_server()
+        mocker.patch(REQUESTS, side_effect=side_effect)
+        file_name = str(tmpdir.join('pkg.rpm'))
+
+        http_utils.download_to_file(URL, file_name, connections=4, part_size=100, buffer_size=64)
+
+        assert _read_file(file_name) == DATA
+        assert sorted(requested) == list(range(0, 1000, 100))
+        assert os.listdir(str(tmpdir)) == ['pkg.rpm']
+
+    @staticmethod
+    def test_ranged_download_resume(mocker, tmpdir):
+        """Test: failed download resumes from the completed parts
+
+        Assertions
+        ----------
+        - First download should raise HTTPError once retries are exhausted, the
+          failed part retried once after a backoff delay
+        - Second download should only request the failed part
+        - The file should equal the artifact
+        """
+
+        mock_sleep = mocker.patch('time.sleep')
+        mocker.patch.dict('f5sdk.constants.DOWNLOAD', {'RETRIES': 1})
+        side_effect, requested = _create_server(fail_offsets=[500])
+        mocker.patch(REQUESTS, side_effect=side_effect)
+        file_name = str(tmpdir.join('pkg.rpm'))
+
+        pytest.raises(
+            HTTPError,
+            http_utils.download_to_file, URL, file_name, connections=1, part_size=100
+        )
+        assert not os.path.exists(file_name)
+        assert requested == [0, 100, 200, 300, 400, 500, 500]
+        assert mock_sleep.call_count == 1
+
+        side_effect, requested = _create_server()
+        mocker.patch(REQUESTS, side_effect=side_effect)
+        http_utils.download_to_file(URL, file_name, connections=1, part_size=100)
+
+        assert requested == [500, 600, 700, 800, 900]
+        assert _read_file(file_name) == DATA
+
+    @staticmethod
+    def test_stream_download(mocker, tmpdir):
+        """Test: artifact is downloaded using a single request, without range support
+
+        Assertions
+        ----------
+        - The file should equal the artifact
+        - No range requests should be made
+        """
+
+        side_effect, requested = _create_server(ranges=False)
+        mocker.patch(REQUESTS, side_effect=side_effect)
+        file_name = str(tmpdir.join('pkg.rpm'))
+
+        http_utils.download_to_file(URL, file_name)
+
+        assert _read_file(file_name) == DATA
+        assert requested == []
+
+    @staticmethod
+    def test_download_checksum(mocker, tmpdir):
+        """Test: downloaded artifact checksum is verified
+
+        Assertions
+        ----------
+        - Matching checksum should download the file
+        - Mismatched checksum should raise ChecksumMismatchError, removing the file
+        """
+
+        mocker.patch(REQUESTS, side_effect=_create_server()[0])
+        file_name = str(tmpdir.join('pkg.rpm'))
+
+        http_utils.download_to_file(URL, file_name, sha256=hashlib.sha256(DATA).hexdigest())
+        assert _read_file(file_name) == DATA
+
+        other_file_name = str(tmpdir.join('other.rpm'))
+        pytest.raises(
+            ChecksumMismatchError,
+            http_utils.download_to_file, URL, other_file_name, sha256='0' * 64
+        )
+        assert not os.path.exists(other_file_name)
+        assert not os.path.exists('%s.part' % other_file_name)
+
+
+def _create_compression_handler(rejected_status_code=None):
+    """Create in-memory transport handler, decompressing (or rejecting) gzip bodies"""
+
+    bodies = []
+
+    def _handler(method, url, **kwargs):  # pylint: disable=unused-argument
+        data = kwargs['data']
+        if kwargs['headers'].get('Content-Encoding') == 'gzip':
+            if rejected_status_code:
+                return (rejected_status_code, {'message': 'rejected'}, {})
+            data = gzip.GzipFile(fileobj=io.BytesIO(data)).read()
+        bodies.append(json.loads(data.decode('utf-8')))
+        return (200, {'message': 'success'}, {})
+    return _handler, bodies
+
+
+class TestCompression(object):
+    """Test Class: make_request compression """
+
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def compression_support_fixture(mocker):
+        """Test fixture: reset the compression support cache"""
+        mocker.patch.dict(http_utils._COMPRESSION_SUPPORT)  # pylint: disable=protected-access
+
+    @staticmethod
+    def test_compressed_request():
+        """Test: compressed request body
+
+        Assertions
+        ----------
+        - Large body should be compressed, endpoint cached as supported
+        - Small body should not be compressed
+        - Compressed response should be requested
+        """
+
+        handler, bodies = _create_compression_handler()
+        transport = transport_utils.InMemoryTransport(handler)
+
+        http_utils.make_request(HOST, URI, method='POST', body=LARGE_BODY, compress=True,
+                                transport=transport)
+        http_utils.make_request(HOST, URI, method='POST', body={'a': 1}, compress=True,
+                                transport=transport)
+
+        assert bodies == [LARGE_BODY, {'a': 1}]
+        assert [i['kwargs']['headers'].get('Content-Encoding') for i in transport.requests] \
+            == ['gzip', None]
+        assert transport.requests[0]['kwargs']['headers']['Accept-Encoding'] == 'gzip'
+        assert http_utils.get_compression_support(HOST, 443, URI) is True
+
+    @staticmethod
+    def test_compressed_request_prepared_body():
+        """Test: compressed prepared body
+
+        Assertions
+        ----------
+        - Prepared body should be compressed once
+        """
+
+        handler, bodies = _create_compression_handler()
+        transport = transport_utils.InMemoryTransport(handler)
+        body = json_utils.PreparedBody(LARGE_BODY)
+
+        for _ in range(2):
+            http_utils.make_request(HOST, URI, method='POST', body=body, compress=True,
+                                    transport=transport)
+
+        assert bodies == [LARGE_BODY, LARGE_BODY]
+        assert transport.requests[0]['kwargs']['data'] is transport.requests[1]['kwargs']['data']
+
+    @staticmethod
+    @pytest.mark.parametrize('rejected_status_code', [400, 415])
+    def test_compressed_request_rejected(rejected_status_code):
+        """Test: endpoint rejecting compressed request body
+
+        Assertions
+        ----------
+        - Request should be retried uncompressed
+        - Endpoint should be cached as unsupported, subsequent requests not compressed
+        """
+
+        handler, bodies = _create_compression_handler(rejected_status_code)
+        transport = transport_utils.InMemoryTransport(handler)
+
+        for _ in range(2):
+            assert http_utils.make_request(
+                HOST, URI + '?async=true', method='POST', body=LARGE_BODY, compress=True,
+                transport=transport) == {'message': 'success'}
+
+        assert bodies == [LARGE_BODY, LARGE_BODY]
+        assert [i['kwargs']['headers'].get('Content-Encoding') for i in transport.requests] \
+            == ['gzip', None, None]
+        assert http_utils.get_compression_support(HOST, 443, URI) is False
+
+
+class TestHTTPError(object):
+    """Test Class: structured HTTP errors """
+
+    @staticmethod
+    def test_error_attributes():
+        """Test: error response attributes
+
+        Assertions
+        ----------
+        - Error should contain the status code, headers, URL and body
+        - Error should be retryable, with Retry-After
+        """
+
+        transport = transport_utils.InMemoryTransport(
+            lambda method, url, **kwargs: (503, {'message': 'busy'}, {'Retry-After': '10'}))
+
+        with pytest.raises(HTTPError) as error:
+            http_utils.make_request(HOST, URI, transport=transport)
+
+        assert error.value.status_code == 503
+        assert error.value.headers['retry-after'] == '10'
+        assert error.value.url == 'https://%s:443%s' % (HOST, URI)
+        assert error.value.body == {'message': 'busy'}
+        assert error.value.retryable is True
+        assert error.value.retry_after == 10
+
+    @staticmethod
+    def test_error_classification():
+        """Test: retryable classification and Retry-After parsing
+
+        Assertions
+        ----------
+        - Client errors should not be retryable, errors without a response should
+        - Retry-After should be parsed as seconds or HTTP-date, only on 429 and 503
+        """
+
+        assert HTTPError('', status_code=401).retryable is False
+        assert HTTPError('connection reset').retryable is True
+        assert HTTPError('', status_code=500, headers={'Retry-After': '10'}).retry_after is None
+        assert HTTPError('', status_code=429, headers={
+            'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}).retry_after == 0
+        assert HTTPError('', status_code=429, headers={'Retry-After': 'soon'}).retry_after is None
@@ -0,0 +1,223 @@
+""" Test json utils """
+
+import json
+import sys
+
+from f5sdk import exceptions
+from f5sdk.utils import http_utils, json_utils, transport_utils
+
+from ..global_test_imports import pytest, Mock
+from ..shared import constants
+
+HOST = constants.HOST
+
+
+def _chunks(data, size):
+    """ Split data into chunks of size """
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonUtils(object):
+    """Test Class: json utils """
+
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def codec_fixture(mocker):
+        """Test fixture: restore the JSON codec once complete"""
+        mocker.patch.dict(json_utils._CODEC)  # pylint: disable=protected-access
+
+    @staticmethod
+    def test_set_codec_fallback(mocker):
+        """Test: codec selection, no fast codec installed
+
+        Assertions
+        ----------
+        - Standard library codec should be used
+        - Encoded JSON should be bytes
+        """
+
+        mocker.patch.dict(sys.modules, {'orjson': None, 'ujson': None})
+
+        assert json_utils.set_codec() == 'json'
+        assert json_utils.get_codec() == 'json'
+        assert json_utils.encode({'a': [1]}) == b'{"a": [1]}'
+        assert json_utils.decode(b'{"a": [1]}') == {'a': [1]}
+
+    @staticmethod
+    def test_set_codec_environment_variable(mocker):
+        """Test: codec set using environment variable
+
+        Assertions
+        ----------
+        - Codec in environment variable should be used
+        """
+
+        mocker.patch.dict('os.environ', {'F5_SDK_JSON_CODEC': 'json'})
+
+        assert json_utils.set_codec() == 'json'
+
+    @staticmethod
+    def test_set_codec_invalid(mocker):
+        """Test: unknown, or not installed, codec
+
+        Assertions
+        ----------
+        - InputRequiredError exception should be raised
+        """
+
+        mocker.patch.dict(sys.modules, {'ujson': None})
+
+        pytest.raises(exceptions.InputRequiredError, json_utils.set_codec, 'foo')
+        pytest.raises(exceptions.InputRequiredError, json_utils.set_codec, 'ujson')
+
+    @staticmethod
+    def test_encode_unsupported(mocker):
+        """Test: object the codec does not support
+
+        Assertions
+        ----------
+        - Object should be encoded using the standard library
+        """
+
+        mocker.patch.dict(json_utils._CODEC, {  # pylint: disable=protected-access
+            'name': 'orjson', 'encode': Mock(side_effect=TypeError), 'decode': json.loads})
+
+        assert json_utils.encode({1: 2}) == b'{"1": 2}'
+
+    @staticmethod
+    def test_make_request_body():
+        """Test: make_request encodes the body using the codec
+
+        Assertions
+        ----------
+        - Body should be encoded JSON (bytes), non-ASCII characters preserved
+        """
+
+        transport = transport_utils.InMemoryTransport(
+            lambda method, url, **kwargs: (200, {}, {}))
+
+        http_utils.make_request(HOST, '/foo', method='POST', body={'name': u'\u00e9'},
+                                transport=transport)
+
+        data = transport.requests[0]['kwargs']['data']
+        assert isinstance(data, bytes)
+        assert json.loads(data.decode('utf-8')) == {'name': u'\u00e9'}
+
+    @staticmethod
+    def test_iter_array_items():
+        """Test: items of a nested array, skipping values before it
+
+        Assertions
+        ----------
+        - Items should be decoded
+        - Skipped values (containing escapes, brackets and commas) should be ignored
+        """
+
+        document = {
+            'kind': 'tm:ltm:pool:poolcollectionstate',
+            'skipped': [{'a': 'b\\"]}[{,'}, 1.5e3, True, None, u'\u00e9'],
+            'declaration': {'count': 10, 'items': [{'name': 'foo'}, 1, 'bar', [2, 3]]},
+            'after': 'not read'
+        }
+
+        items = json_utils.iter_array_items(
+            _chunks(json.dumps(document).encode('utf-8'), 1024), 'declaration.items')
+        assert list(items) == [{'name': 'foo'}, 1, 'bar', [2, 3]]
+
+    @staticmethod
+    def test_iter_array_items_chunk_boundaries():
+        """Test: chunk boundaries splitting tokens and multibyte characters
+
+        Assertions
+        ----------
+        - Items should be decoded regardless of chunk size
+        """
+
+        document = {
+            'skipped': {u'\u00e9\u4e2d': ['\\\\', '"']},
+            'items': [{'name': u'\u00e9\u4e2d', 'value': 123456789}, 12345, -0.5, False]
+        }
+        data = json.dumps(document, ensure_ascii=False).encode('utf-8')
+
+        for size in [1, 2, 3, 7]:
+            assert list(json_utils.iter_array_items(_chunks(data, size), 'items')) \
+                == document['items']
+
+    @staticmethod
+    def test_iter_array_items_top_level():
+        """Test: top level (and empty) array
+
+        Assertions
+        ----------
+        - Items should be decoded
+        - Empty array should yield nothing
+        """
+
+        assert list(json_utils.iter_array_items([b' [1, ', b'{"a": 2} ] '], '')) == [1, {'a': 2}]
+        assert list(json_utils.iter_array_items([b'{"items": [ ]}'], 'items')) == []
+
+    @staticmethod
+    def test_iter_array_items_missing_path():
+        """Test: path not in the document
+
+        Assertions
+        ----------
+        - KeyError exception should be raised
+        """
+
+        pytest.raises(KeyError, list, json_utils.iter_array_items([b'{"a": 1}'], 'items'))
+        pytest.raises(KeyError, list, json_utils.iter_array_items([b'{}'], 'items'))
+
+    @staticmethod
+    def test_iter_array_items_invalid():
+        """Test: truncated document
+
+        Assertions
+        ----------
+        - ValueError exception should be raised
+        """
+
+        pytest.raises(
+            ValueError, list, json_utils.iter_array_items([b'{"items": [1, {"a"'], 'items'))
+
+    @staticmethod
+    def test_make_request_prepared_body():
+        """Test: make_request with pre-serialized bodies
+
+        Assertions
+        ----------
+        - Prepared body, bytes and memoryview bodies should be sent as-is
+        - Content-Type should be JSON
+        """
+
+        transport = transport_utils.InMemoryTransport(
+            lambda method, url, **kwargs: (200, {}, {}))
+
+        body = json_utils.PreparedBody({'class': 'AS3'})
+        for request_body in [body, body.data, memoryview(body.data)]:
+            http_utils.make_request(HOST, '/foo', method='POST', body=request_body,
+                                    transport=transport)
+
+        for request in transport.requests:
+            assert request['kwargs']['data'] == body.data
+            assert request['kwargs']['headers']['Content-Type'] == 'application/json'
+        assert transport.requests[0]['kwargs']['data'] is body.data
+        assert json_utils.PreparedBody(bytearray(b'[1]')).data == b'[1]'
+
+    @staticmethod
+    def test_make_request_stream_path():
+        """Test: make_request with a stream path
+
+        Assertions
+        ----------
+        - Request should be streamed
+        - Response should be a generator of the array items
+        """
+
+        transport = transport_utils.InMemoryTransport(
+            lambda method, url, **kwargs: (200, {'items': [{'name': 'foo'}, {'name': 'bar'}]}, {}))
+
+        response = http_utils.make_request(HOST, '/foo', stream_path='items', transport=transport)
+
+        assert transport.requests[0]['kwargs']['stream'] is True
+        assert [i['name'] for i in response] == ['foo', 'bar']
@@ -0,0 +1,79 @@
+""" Test query utils """
+
+from f5sdk import exceptions
+from f5sdk.utils.query_utils import Query
+
+from ..global_test_imports import pytest
+
+
+class TestQueryUtils(object):
+    """Test Class: query utils """
+
+    @staticmethod
+    def test_get_query_parameters():
+        """Test: iControl REST (BIG-IP) query parameters
+
+        Assertions
+        ----------
+        - $select, $filter and expandSubcollections should be set
+        """
+
+        query = Query().select('name', 'fullPath').select('name') \
+            .filter('partition', 'Common').expand_subcollections()
+
+        assert query.get_query_parameters() == {
+            '$select': 'name,fullPath',
+            '$filter': 'partition eq Common',
+            'expandSubcollections': 'true'
+        }
+
+    @staticmethod
+    def test_get_query_parameters_bigiq():
+        """Test: BIG-IQ (OData) query parameters
+
+        Assertions
+        ----------
+        - String filter values should be quoted (and escaped)
+        - Filters should be combined using and
+        """
+
+        query = Query().filter('name', "it's").filter('count', 2, operator='gt')
+
+        assert query.get_query_parameters(style='bigiq') == {
+            '$filter': "name eq 'it''s' and count gt 2"
+        }
+
+    @staticmethod
+    def test_get_query_parameters_cs():
+        """Test: CS query parameters
+
+        Assertions
+        ----------
+        - eq filters should be plain query parameters, without $select
+        - Other operators should raise InputRequiredError
+        """
+
+        query = Query().select('id').filter('account_id', 'a-123')
+        assert query.get_query_parameters(style='cs') == {'account_id': 'a-123'}
+
+        pytest.raises(
+            exceptions.InputRequiredError,
+            Query().filter('count', 1, operator='gt').get_query_parameters,
+            style='cs'
+        )
+
+    @staticmethod
+    def test_to_record():
+        """Test: item converted to a lightweight record
+
+        Assertions
+        ----------
+        - Record should contain only the selected fields, missing fields set to None
+        - Record type should be reused
+        """
+
+        query = Query().select('name', 'fullPath', 'sub-path')
+        record = query.to_record({'name': 'foo', 'fullPath': '/Common/foo', 'extra': 1})
+
+        assert (record.name, record.fullPath, record.sub_path) == ('foo', '/Common/foo', None)
+        assert type(record) is type(query.to_record({}))  # pylint: disable=unidiomatic-typecheck
@@ -0,0 +1,174 @@
+""" Test retry utils """
+
+from f5sdk.exceptions import HTTPError
+from f5sdk.utils import retry_utils
+
+from ..global_test_imports import pytest, Mock
+
+
+class TestRetryUtils(object):
+    """Test Class: retry utils """
+
+    @staticmethod
+    @pytest.fixture(autouse=True)
+    def retry_fixture(mocker):
+        """Test fixture: reset retry metrics, do not sleep"""
+        retry_utils.reset_retry_metrics()
+        mocker.patch('time.sleep')
+        yield
+        retry_utils.reset_retry_metrics()
+
+    @staticmethod
+    def test_call(mocker):
+        """Test: call retried with exponential backoff and full jitter
+
+        Assertions
+        ----------
+        - Function should be retried until it succeeds
+        - Delays should be random, between zero and the (capped) exponential delay
+        - Metrics should count the attempts and retries
+        """
+
+        mock_uniform = mocker.patch('random.uniform', side_effect=lambda low, high: high)
+        mock_sleep = mocker.patch('time.sleep')
+        function = Mock(side_effect=[ValueError, ValueError, ValueError, 'foo'])
+
+        policy = retry_utils.RetryPolicy(
+            'test.call', initial_delay=1, max_delay=3, budget=retry_utils.RetryBudget())
+        assert policy.call(function, 'bar') == 'foo'
+
+        function.assert_called_with('bar')
+        assert [i[0] for i in mock_uniform.call_args_list] == [(0, 1), (0, 2), (0, 3)]
+        assert [i[0][0] for i in mock_sleep.call_args_list] == [1, 2, 3]
+        metrics = retry_utils.get_retry_metrics('test.call')
+        assert (metrics['calls'], metrics['attempts'], metrics['retries'], metrics['successes']) \
+            == (1, 4, 3, 1)
+        assert metrics['retry_delay_secs'] == 6
+
+    @staticmethod
+    def test_call_not_retried():
+        """Test: exception not in the retry exceptions
+
+        Assertions
+        ----------
+        - Exception should be raised, without retries
+        """
+
+        function = Mock(side_effect=KeyError)
+        policy = retry_utils.RetryPolicy('test.not_retried', exceptions=ValueError)
+
+        pytest.raises(KeyError, policy.call, function)
+        assert function.call_count == 1
+
+    @staticmethod
+    def test_call_deadline():
+        """Test: deadline passed
+
+        Assertions
+        ----------
+        - Last exception should be raised, once the tries or deadline are exhausted
+        - Metrics should count the failures
+        """
+
+        function = Mock(side_effect=ValueError)
+
+        pytest.raises(
+            ValueError, retry_utils.RetryPolicy('test.deadline', timeout=0).call, function)
+        assert function.call_count == 1
+        pytest.raises(ValueError, retry_utils.RetryPolicy('test.tries', tries=3).call, function)
+        assert function.call_count == 4
+
+        assert retry_utils.get_retry_metrics('test.deadline')['deadline_exceeded'] == 1
+        assert retry_utils.get_retry_metrics()['test.tries']['failures'] == 1
+
+    @staticmethod
+    def test_budget():
+        """Test: shared retry budget exhausted
+
+        Assertions
+        ----------
+        - Retries should stop once the budget is exhausted, across policies
+        - First attempts should not be limited
+        """
+
+        budget = retry_utils.RetryBudget(capacity=2, refill_per_sec=0)
+        function = Mock(side_effect=ValueError)
+
+        for _ in range(2):
+            pytest.raises(ValueError, retry_utils.RetryPolicy(
+                'test.budget', tries=2, budget=budget).call, function)
+
+        assert function.call_count == 4
+        pytest.raises(
+            ValueError, retry_utils.RetryPolicy('test.budget', budget=budget).call, function)
+        assert function.call_count == 5
+        assert retry_utils.get_retry_metrics('test.budget')['budget_exhausted'] == 1
+
+    @staticmethod
+    def test_retry_decorator():
+        """Test: retry decorator
+
+        Assertions
+        ----------
+        - Decorated function should be retried
+        """
+
+        responses = [ValueError(), 'foo']
+
+        @retry_utils.retry('test.decorator', budget=retry_utils.RetryBudget())
+        def _function():
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        assert _function() == 'foo'
+        assert retry_utils.get_retry_metrics('test.decorator')['retries'] == 1
+
+    @staticmethod
+    def test_http_error_not_retryable():
+        """Test: HTTP errors classified as retryable or not
+
+        Assertions
+        ----------
+        - Client errors (such as 404) should not be retried
+        - Client errors in retry_status_codes should be retried
+        - Transient errors (such as 502) should be retried
+        """
+
+        function = Mock(side_effect=HTTPError('not found', status_code=404))
+        pytest.raises(HTTPError, retry_utils.RetryPolicy('test.not_retryable').call, function)
+        assert function.call_count == 1
+        assert retry_utils.get_retry_metrics('test.not_retryable')['not_retryable'] == 1
+
+        for status_code, policy_kwargs in [(400, {'retry_status_codes': [400]}), (502, {})]:
+            function = Mock(side_effect=[HTTPError('error', status_code=status_code), 'foo'])
+            assert retry_utils.RetryPolicy(
+                'test.retryable', budget=retry_utils.RetryBudget(), **policy_kwargs
+            ).call(function) == 'foo'
+        assert retry_utils.get_retry_metrics('test.retryable')['retries'] == 2
+
+    @staticmethod
+    def test_http_error_retry_after(mocker):
+        """Test: Retry-After honored
+
+        Assertions
+        ----------
+        - Delay should be at least the Retry-After value
+        - Retry-After beyond the deadline should not be retried
+        """
+
+        mock_sleep = mocker.patch('time.sleep')
+        function = Mock(side_effect=[
+            HTTPError('busy', status_code=429, headers={'Retry-After': '5'}), 'foo'])
+
+        assert retry_utils.RetryPolicy(
+            'test.retry_after', initial_delay=1, budget=retry_utils.RetryBudget()
+        ).call(function) == 'foo'
+        mock_sleep.assert_called_once_with(5.0)
+
+        function = Mock(side_effect=HTTPError(
+            'unavailable', status_code=503, headers={'Retry-After': '120'}))
+        pytest.raises(HTTPError, retry_utils.RetryPolicy(
+            'test.retry_after_deadline', timeout=60).call, function)
+        assert function.call_count == 1
@@ -0,0 +1,63 @@
+""" Test ssh utils module """
+
+from f5sdk.utils import ssh_utils
+
+from ..shared import mock_utils
+
+HOST = '192.0.2.10'
+
+
+class TestSSHConnection(object):
+    """Test Class: persistent SSH connection """
+
+    @staticmethod
+    def test_idle_close(mocker):
+        """Test: idle connection is closed by the idle timer
+
+        Assertions
+        ----------
+        - Idle timer should be scheduled for the idle timeout, once a command completes
+        - Connection should not be closed before the idle timeout
+        - Connection should be closed after the idle timeout, without further use
+        """
+
+        mock_ssh_client_instance = mock_utils.create_ssh_client(
+            mocker.patch('paramiko.SSHClient'), 'response')
+        mock_timer = mocker.patch('threading.Timer')
+        mock_time = mocker.patch('time.time', return_value=100)
+
+        connection = ssh_utils.SSHConnection(HOST, idle_timeout=60)
+        assert connection.exec_command('command') == ('response', '')
+        timeout, close_if_idle = mock_timer.call_args[0]
+        assert timeout == 60
+        assert mock_timer.return_value.start.call_count == 1
+
+        mock_time.return_value = 130
+        close_if_idle()
+        assert mock_ssh_client_instance.close.call_count == 0
+
+        mock_time.return_value = 160
+        close_if_idle()
+        assert mock_ssh_client_instance.close.call_count == 1
+
+    @staticmethod
+    def test_idle_close_rescheduled(mocker):
+        """Test: idle timer is rescheduled on each use, and cancelled on close
+
+        Assertions
+        ----------
+        - Previous idle timer should be cancelled when a command completes
+        - Idle timer should be cancelled by close()
+        """
+
+        mock_utils.create_ssh_client(mocker.patch('paramiko.SSHClient'), 'response')
+        mock_timer = mocker.patch('threading.Timer')
+
+        connection = ssh_utils.SSHConnection(HOST)
+        connection.exec_command('command')
+        connection.exec_command('command')
+        assert mock_timer.call_count == 2
+        assert mock_timer.return_value.cancel.call_count == 1
+
+        connection.close()
+        assert mock_timer.return_value.cancel.call_count == 2
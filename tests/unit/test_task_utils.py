@@ -0,0 +1,145 @@
+""" Test task utils module """
+
+import threading
+
+from f5sdk.utils import task_utils
+from f5sdk.exceptions import TaskTimeoutError
+
+from ..global_test_imports import pytest, Mock
+
+
+def _get_task_poller():
+    return task_utils.TaskPoller(workers=2, initial_delay=0.01, max_delay=0.02)
+
+
+class TestTaskPoller(object):
+    """Test Class: task poller """
+
+    @staticmethod
+    def test_submit():
+        """Test: task is polled until finished
+
+        Assertions
+        ----------
+        - Future result should be the finished task response
+        - Poll function should be called until the task is finished
+        """
+
+        poll = Mock(side_effect=[(False, None), (False, None), (True, {'status': 'FINISHED'})])
+
+        future = _get_task_poller().submit(poll)
+
+        assert future.result(timeout=10) == {'status': 'FINISHED'}
+        assert poll.call_count == 3
+
+    @staticmethod
+    def test_submit_exception():
+        """Test: poll exception should fail the task
+
+        Assertions
+        ----------
+        - Future result should raise the poll exception
+        - Poll function should not be retried
+        """
+
+        poll = Mock(side_effect=Exception('task failed'))
+
+        future = _get_task_poller().submit(poll)
+
+        with pytest.raises(Exception, match='task failed'):
+            future.result(timeout=10)
+        assert poll.call_count == 1
+
+    @staticmethod
+    def test_submit_retry_exceptions():
+        """Test: poll exception should be retried (retry_exceptions=True)
+
+        Assertions
+        ----------
+        - Future result should be the finished task response
+        """
+
+        poll = Mock(side_effect=[Exception('connection reset'), (True, {'foo': 'bar'})])
+
+        future = _get_task_poller().submit(poll, retry_exceptions=True)
+
+        assert future.result(timeout=10) == {'foo': 'bar'}
+
+    @staticmethod
+    def test_submit_timeout():
+        """Test: task not finished before the timeout
+
+        Assertions
+        ----------
+        - Future result should raise TaskTimeoutError
+        - Future result should raise the last poll exception (retry_exceptions=True)
+        """
+
+        poller = _get_task_poller()
+
+        future = poller.submit(Mock(return_value=(False, None)), timeout=0.05)
+        with pytest.raises(TaskTimeoutError):
+            future.result(timeout=10)
+
+        future = poller.submit(Mock(side_effect=ValueError('not ready')), timeout=0.05,
+                               retry_exceptions=True)
+        with pytest.raises(ValueError):
+            future.result(timeout=10)
+
+    @staticmethod
+    def test_submit_callback():
+        """Test: callback should be called once the task completes
+
+        Assertions
+        ----------
+        - Callback should be called with the (completed) future
+        """
+
+        event = threading.Event()
+        callback = Mock(side_effect=lambda future: event.set())
+
+        future = _get_task_poller().submit(Mock(return_value=(True, {})), callback=callback)
+
+        assert event.wait(10)
+        callback.assert_called_once_with(future)
+
+    @staticmethod
+    def test_submit_many():
+        """Test: many outstanding tasks are multiplexed over the worker threads
+
+        Assertions
+        ----------
+        - Every future should complete with its task response
+        """
+
+        poller = _get_task_poller()
+        futures = []
+        for i in range(50):
+            poll = Mock(side_effect=[(False, None), (True, i)])
+            futures.append(poller.submit(poll))
+
+        assert [i.result(timeout=10) for i in futures] == list(range(50))
+
+    @staticmethod
+    def test_result_timeout():
+        """Test: waiting on a running task with a timeout
+
+        Assertions
+        ----------
+        - Future result should raise TaskTimeoutError
+        """
+
+        future = task_utils.TaskFuture()
+
+        pytest.raises(TaskTimeoutError, future.result, timeout=0.01)
+
+    @staticmethod
+    def test_get_task_poller():
+        """Test: get shared task poller
+
+        Assertions
+        ----------
+        - The same task poller should be returned
+        """
+
+        assert task_utils.get_task_poller() is task_utils.get_task_poller()
@@ -0,0 +1,141 @@
+""" Test transport utils """
+
+import json
+import warnings
+
+import urllib3
+from urllib3._collections import HTTPHeaderDict
+
+from f5sdk import exceptions
+from f5sdk.bigip import ManagementClient
+from f5sdk.utils import http_utils, transport_utils
+
+from ..global_test_imports import pytest, Mock
+from ..shared import constants
+
+HOST = constants.HOST
+TOKEN = constants.TOKEN
+
+
+class TestTransportUtils(object):
+    """Test Class: transport utils """
+
+    @staticmethod
+    def test_in_memory_transport():
+        """Test: management client using the in-memory transport
+
+        Assertions
+        ----------
+        - Requests should be made using the transport, not a session
+        - Response should be decoded
+        - Requests should be recorded
+        """
+
+        transport = transport_utils.InMemoryTransport(
+            lambda method, url, **kwargs: (200, {'version': '15.1.0'}, {}))
+
+        device = ManagementClient(HOST, port=443, token=TOKEN, skip_ready_check=True,
+                                  transport=transport)
+        assert device.make_request('/mgmt/tm/sys/version') == {'version': '15.1.0'}
+        assert transport.requests[0]['method'] == 'GET'
+        assert transport.requests[0]['url'] == 'https://%s:443/mgmt/tm/sys/version' % HOST
+        assert transport.requests[0]['kwargs']['headers']['X-F5-Auth-Token'] == TOKEN
+
+        device.close()
+        assert device._http['session'] is None  # pylint: disable=protected-access
+
+    @staticmethod
+    def test_in_memory_transport_error():
+        """Test: make_request using a transport, error status code
+
+        Assertions
+        ----------
+        - HTTPError exception should be raised
+        """
+
+        transport = transport_utils.InMemoryTransport(
+            lambda method, url, **kwargs: (404, {'message': 'not found'}, {}))
+
+        pytest.raises(exceptions.HTTPError, http_utils.make_request,
+                      HOST, '/foo', transport=transport)
+
+    @staticmethod
+    def test_in_memory_transport_empty_body():
+        """Test: make_request using a transport, empty response body
+
+        Assertions
+        ----------
+        - Response should be None (Content-Length: 0)
+        """
+
+        transport = transport_utils.InMemoryTransport(
+            lambda method, url, **kwargs: (200, None, {}))
+
+        assert http_utils.make_request(HOST, '/foo', transport=transport) is None
+
+    @staticmethod
+    def test_urllib3_transport(mocker):
+        """Test: make_request using the urllib3 transport
+
+        Assertions
+        ----------
+        - Request should include query parameters, basic auth header and encoded body
+        - Response should be decoded
+        """
+
+        mock_urlopen = mocker.patch('urllib3.PoolManager.urlopen')
+        mock_urlopen.return_value = Mock(
+            status=200,
+            reason='OK',
+            headers=HTTPHeaderDict({'Content-Type': 'application/json'}),
+            data=json.dumps({'foo': 'bar'}).encode('utf-8')
+        )
+
+        transport = transport_utils.Urllib3Transport(pool_size=2)
+        response = http_utils.make_request(
+            HOST,
+            '/foo',
+            method='POST',
+            query_parameters={'$top': 1},
+            body={'bar': 'baz'},
+            basic_auth={'user': 'user', 'password': 'password'},
+            transport=transport
+        )
+        transport.close()
+
+        assert response == {'foo': 'bar'}
+        args, kwargs = mock_urlopen.call_args
+        assert args == ('POST', 'https://%s:443/foo?%%24top=1' % HOST)
+        assert isinstance(kwargs['body'], bytes)
+        assert json.loads(kwargs['body'].decode('utf-8')) == {'bar': 'baz'}
+        assert kwargs['headers']['authorization'].startswith('Basic ')
+        assert kwargs['retries'] is False
+
+    @staticmethod
+    def test_urllib3_transport_insecure_warning(mocker):
+        """Test: urllib3 transport insecure request warnings (verify=False)
+
+        Assertions
+        ----------
+        - Process-wide warning filters should not be modified
+        - Insecure request warning should be suppressed during the request only
+        """
+
+        def _urlopen(*args, **kwargs):  # pylint: disable=unused-argument
+            warnings.warn('insecure', urllib3.exceptions.InsecureRequestWarning)
+            return Mock(status=200, reason='OK', headers=HTTPHeaderDict(), data=b'')
+
+        mocker.patch('urllib3.PoolManager.urlopen', side_effect=_urlopen)
+
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            filters = list(warnings.filters)
+            transport = transport_utils.Urllib3Transport(verify=False)
+            assert warnings.filters == filters
+
+            transport.request('GET', 'https://%s/foo' % HOST)
+            assert not caught_warnings
+
+            warnings.warn('insecure', urllib3.exceptions.InsecureRequestWarning)
+            assert len(caught_warnings) == 1
+        transport.close()